@@ -0,0 +1,92 @@
+"""
+Benchmark the harmonic force evaluation and sigma^A reductions.
+
+Compares the batched implementation in ``atomate2.common.jobs.anharmonicity`` with
+a per-sample loop for increasing numbers of atoms and samples. Run with::
+
+    python benchmarks/anharmonicity.py
+"""
+
+from __future__ import annotations
+
+import timeit
+from functools import partial
+
+import numpy as np
+
+from atomate2.common.jobs.anharmonicity import (
+    _get_grouped_sigma_a,
+    calc_sigma_a,
+    get_harmonic_forces,
+)
+
+
+def harmonic_forces_loop(
+    force_constants: np.ndarray, displacements: np.ndarray
+) -> list[np.ndarray]:
+    """Evaluate the harmonic forces one sample at a time."""
+    n_dof = 3 * len(force_constants)
+    force_constants_2d = force_constants.swapaxes(1, 2).reshape(n_dof, n_dof)
+    return [
+        (-force_constants_2d @ displacement.flatten()).reshape((-1, 3))
+        for displacement in displacements
+    ]
+
+
+def grouped_sigma_loop(
+    anharmonic_forces: np.ndarray, dft_forces: np.ndarray, labels: np.ndarray
+) -> list[float]:
+    """Evaluate sigma^A for each group using boolean masks."""
+    return [
+        calc_sigma_a(anharmonic_forces[:, labels == u], dft_forces[:, labels == u])
+        for u in np.unique(labels)
+    ]
+
+
+def run_loop(
+    force_constants: np.ndarray,
+    displacements: np.ndarray,
+    dft_forces: np.ndarray,
+    labels: np.ndarray,
+) -> None:
+    """Run the per-sample and per-group reference implementation."""
+    harmonic = np.array(harmonic_forces_loop(force_constants, displacements))
+    grouped_sigma_loop(dft_forces - harmonic, dft_forces, labels)
+
+
+def run_batched(
+    force_constants: np.ndarray,
+    displacements: np.ndarray,
+    dft_forces: np.ndarray,
+    labels: np.ndarray,
+) -> None:
+    """Run the batched implementation."""
+    harmonic = get_harmonic_forces(force_constants, displacements)
+    _get_grouped_sigma_a(dft_forces - harmonic, dft_forces, labels)
+
+
+def main() -> None:
+    """Print timings for a grid of atom and sample counts."""
+    rng = np.random.default_rng(0)
+    print(f"{'atoms':>6} {'samples':>8} {'loop (s)':>10} {'batched (s)':>12} {'x':>6}")
+    for n_atoms in (64, 256, 512):
+        force_constants = rng.normal(size=(n_atoms, n_atoms, 3, 3))
+        # mode-resolved analysis uses one group per (mostly non-degenerate) mode
+        labels = rng.integers(0, n_atoms, size=n_atoms)
+        for n_samples in (1, 10, 100):
+            disps = rng.normal(size=(n_samples, n_atoms, 3))
+            dft = rng.normal(size=(n_samples, n_atoms, 3))
+
+            args = (force_constants, disps, dft, labels)
+            t_loop = min(timeit.repeat(partial(run_loop, *args), number=1, repeat=3))
+            t_batched = min(
+                timeit.repeat(partial(run_batched, *args), number=1, repeat=3)
+            )
+            print(
+                f"{n_atoms:>6} {n_samples:>8} {t_loop:>10.4f} {t_batched:>12.4f} "
+                f"{t_loop / t_batched:>6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
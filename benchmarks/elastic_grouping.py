@@ -0,0 +1,80 @@
+"""
+Benchmark grouping deformation tasks by parent structure in the elastic builder.
+
+Compares the bucketed ``_group_deformations`` with a pairwise comparison against
+every group on synthetic task sets. Run with::
+
+    python benchmarks/elastic_grouping.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+from pydash import get
+from pymatgen.core import Lattice, Structure
+
+from atomate2.vasp.builders.elastic import _group_deformations
+
+
+def group_deformations_pairwise(tasks: list[dict], tol: float) -> list[list[dict]]:
+    """Group tasks by comparing each task against every existing group."""
+    path = "output.transformations.history.0.input_structure"
+    grouped_tasks = [[tasks[0]]]
+    for task in tasks[1:]:
+        orig = get(task, path)
+        for group in grouped_tasks:
+            group_orig = get(group[0], path)
+            if np.allclose(
+                orig.lattice.matrix, group_orig.lattice.matrix, atol=tol
+            ) and np.allclose(orig.frac_coords, group_orig.frac_coords, atol=tol):
+                group.append(task)
+                break
+        else:
+            grouped_tasks.append([task])
+    return grouped_tasks
+
+
+def get_tasks(n_parents: int, n_deformations: int, seed: int = 0) -> list[dict]:
+    """Generate deformation tasks for randomly perturbed parent structures."""
+    rng = np.random.default_rng(seed)
+    parents = []
+    for _ in range(n_parents):
+        lattice = Lattice(np.eye(3) * 5.43 + rng.normal(scale=0.01, size=(3, 3)))
+        coords = np.array([[0, 0, 0], [0.25, 0.25, 0.25]])
+        coords += rng.normal(scale=0.01, size=(2, 3))
+        parents.append(Structure(lattice, ["Si", "Si"], coords))
+
+    parent_idxs = rng.permutation(np.repeat(np.arange(n_parents), n_deformations))
+    return [
+        {"output": {"transformations": {"history": [{"input_structure": parents[i]}]}}}
+        for i in parent_idxs
+    ]
+
+
+def main() -> None:
+    """Print timings for increasing numbers of tasks."""
+    print(f"{'tasks':>7} {'groups':>7} {'pairwise (s)':>13} {'bucketed (s)':>13}")
+    for n_parents in (10, 100, 250):
+        tasks = get_tasks(n_parents, n_deformations=24)
+
+        t_start = time.perf_counter()
+        reference = group_deformations_pairwise(tasks, 1e-5)
+        t_pairwise = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        grouped = _group_deformations(tasks, 1e-5)
+        t_bucketed = time.perf_counter() - t_start
+
+        if [[id(t) for t in g] for g in grouped] != [
+            [id(t) for t in g] for g in reference
+        ]:
+            raise RuntimeError("Grouping does not match the pairwise reference")
+        print(
+            f"{len(tasks):>7} {len(grouped):>7} {t_pairwise:>13.3f} {t_bucketed:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark fitting many energy vs. volume datasets to equations of state.
+
+Compares the batched ``fit_energy_eos`` with fitting each dataset and EOS model
+separately with pymatgen, as done per EOS job before. Run with::
+
+    python benchmarks/eos_fitting.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+from pymatgen.analysis.eos import EOS, EOSError
+
+from atomate2.common.analysis.eos import ENERGY_EOS_MODELS, fit_energy_eos
+
+
+def fit_per_dataset(
+    volumes: list[np.ndarray], energies: list[np.ndarray]
+) -> list[dict[str, dict]]:
+    """Fit each dataset and EOS model separately with pymatgen."""
+    results = []
+    for vols, energy in zip(volumes, energies, strict=True):
+        results.append({})
+        for eos_name in ENERGY_EOS_MODELS:
+            try:
+                eos = EOS(eos_name=eos_name).fit(vols, energy)
+                results[-1][eos_name] = {**eos.results, "b0 GPa": float(eos.b0_GPa)}
+            except EOSError as exc:
+                results[-1][eos_name] = {"exception": str(exc)}
+    return results
+
+
+def get_datasets(
+    n_datasets: int, seed: int = 0
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """Generate noisy Vinet energies of random materials around equilibrium."""
+    rng = np.random.default_rng(seed)
+    volumes, energies = [], []
+    for _ in range(n_datasets):
+        e0, v0 = rng.uniform(-50, -5), rng.uniform(10, 40)
+        b0, b1 = rng.uniform(0.3, 1.5), rng.uniform(3, 6)
+        vols = v0 * np.linspace(0.9, 1.1, rng.integers(6, 12))
+        eta = (vols / v0) ** (1 / 3)
+        energy = (
+            2
+            * b0
+            * v0
+            / (b1 - 1) ** 2
+            * (2 - (2 + 3 * (b1 - 1) * (eta - 1)) * np.exp(-1.5 * (b1 - 1) * (eta - 1)))
+        )
+        volumes.append(vols)
+        energies.append(e0 + energy + rng.normal(scale=1e-3, size=len(vols)))
+    return volumes, energies
+
+
+def main() -> None:
+    """Print timings for increasing numbers of datasets."""
+    print(
+        f"{'datasets':>8} {'per dataset (s)':>16} {'batched (s)':>12} "
+        f"{'max rel. diff. of b0 and v0':>28}"
+    )
+    for n_datasets in (10, 100, 1000):
+        volumes, energies = get_datasets(n_datasets)
+
+        t_start = time.perf_counter()
+        reference = fit_per_dataset(volumes, energies)
+        t_per_dataset = time.perf_counter() - t_start
+
+        t_start = time.perf_counter()
+        results = fit_energy_eos(volumes, energies)
+        t_batched = time.perf_counter() - t_start
+
+        max_diff = max(
+            abs(result[eos_name][key] / ref[eos_name][key] - 1)
+            for ref, result in zip(reference, results, strict=True)
+            for eos_name in ENERGY_EOS_MODELS
+            if "exception" not in ref[eos_name]
+            for key in ("b0", "v0")
+        )
+        print(
+            f"{n_datasets:>8} {t_per_dataset:>16.3f} {t_batched:>12.3f} "
+            f"{max_diff:>28.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
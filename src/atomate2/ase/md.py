@@ -31,7 +31,7 @@ from scipy.linalg import schur
 
 from atomate2.ase.jobs import _ASE_DATA_OBJECTS, AseMaker
 from atomate2.ase.schemas import AseResult, AseTaskDoc
-from atomate2.ase.utils import TrajectoryObserver
+from atomate2.ase.utils import StreamingTrajectoryObserver, TrajectoryObserver
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -146,6 +146,14 @@ class AseMDMaker(AseMaker):
         If "xdatcar, writes a VASP-style XDATCAR
     traj_interval : int
         The step interval for saving the trajectories.
+    traj_store_dir : str | Path | None = None
+        If a str or Path, frames are streamed in chunks to an on-disk store in this
+        directory during the run, which bounds the memory required for long MD runs.
+        The task document then stores the path of the store instead of the
+        trajectory, see :obj:`.load_trajectory_store`. If None, all frames are kept
+        in memory.
+    traj_chunk_size : int = 1000
+        Number of frames kept in memory before writing them to `traj_store_dir`.
     mb_velocity_seed : int or None
         If an int, a random number seed for generating initial velocities
         from a Maxwell-Boltzmann distribution.
@@ -171,6 +179,8 @@ class AseMDMaker(AseMaker):
     traj_file: str | Path | None = None
     traj_file_fmt: Literal["pmg", "ase"] = "ase"
     traj_interval: int = 1
+    traj_store_dir: str | Path | None = None
+    traj_chunk_size: int = 1000
     mb_velocity_seed: int | None = None
     zero_linear_momentum: bool = False
     zero_angular_momentum: bool = False
@@ -181,6 +191,12 @@ class AseMDMaker(AseMaker):
         if isinstance(self.ensemble, str):
             self.ensemble = MDEnsemble(self.ensemble)
 
+        if self.traj_store_dir is not None and self.ionic_step_data:
+            raise ValueError(
+                "ionic_step_data cannot be used with traj_store_dir, as the ionic "
+                "steps would hold all frames of the trajectory in memory."
+            )
+
     @staticmethod
     def _interpolate_quantity(values: Sequence | np.ndarray, n_pts: int) -> np.ndarray:
         """Interpolate temperature / pressure on a schedule."""
@@ -355,7 +371,15 @@ class AseMDMaker(AseMaker):
 
         atoms.calc = self.calculator
 
-        md_observer = TrajectoryObserver(atoms, store_md_outputs=True)
+        if self.traj_store_dir is None:
+            md_observer = TrajectoryObserver(atoms, store_md_outputs=True)
+        else:
+            md_observer = StreamingTrajectoryObserver(
+                atoms,
+                store_md_outputs=True,
+                directory=self.traj_store_dir,
+                chunk_size=self.traj_chunk_size,
+            )
 
         md_runner = dynamics(
             atoms=atoms, timestep=self.time_step * units.fs, **self.ase_md_kwargs
@@ -385,6 +409,20 @@ class AseMDMaker(AseMaker):
             cls=Structure if isinstance(mol_or_struct, Structure) else Molecule,
         )
 
+        if isinstance(md_observer, StreamingTrajectoryObserver):
+            # keep the frames on disk, the task document only needs the end points
+            return AseResult(
+                final_mol_or_struct=mol_or_struct,
+                trajectory=md_observer.to_pymatgen_trajectory(
+                    filename=None,
+                    frame_indices=sorted({0, md_observer.n_frames - 1}),
+                ),
+                trajectory_store=str(md_observer.directory),
+                n_steps=md_observer.n_frames,
+                dir_name=os.getcwd(),
+                elapsed_time=t_f - t_i,
+            )
+
         return AseResult(
             final_mol_or_struct=mol_or_struct,
             trajectory=md_observer.to_pymatgen_trajectory(filename=None),
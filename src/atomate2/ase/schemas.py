@@ -48,6 +48,23 @@ class AseResult(BaseModel):
         None, description="The relaxation or molecular dynamics trajectory."
     )
 
+    trajectory_store: Optional[str] = Field(
+        None,
+        description=(
+            "The directory of the on-disk store of the trajectory, if the frames were "
+            "streamed to disk. The trajectory then only contains the first and last "
+            "frames."
+        ),
+    )
+
+    n_steps: Optional[int] = Field(
+        None,
+        description=(
+            "The number of trajectory frames, if the trajectory does not contain all "
+            "of them."
+        ),
+    )
+
     is_force_converged: Optional[bool] = Field(
         None,
         description=(
@@ -85,6 +102,7 @@ class AseObject(ValueEnum):
     """Types of ASE data objects."""
 
     TRAJECTORY = "trajectory"
+    TRAJECTORY_STORE = "trajectory_store"
     IONIC_STEPS = "ionic_steps"
 
 
@@ -398,11 +416,11 @@ class AseTaskDoc(AseBaseModel):
         """
         trajectory = result.trajectory
 
-        n_steps = len(trajectory)
+        n_steps = result.n_steps if result.n_steps is not None else len(trajectory)
 
         # NOTE: convert stress units from eV/A³ to kBar (* -1 from standard output)
         # and to 3x3 matrix to comply with MP convention
-        for idx in range(n_steps):
+        for idx in range(len(trajectory)):
             if trajectory.frame_properties[idx].get("stress") is not None:
                 trajectory.frame_properties[idx]["stress"] = voigt_6_to_full_3x3_stress(
                     [
@@ -450,7 +468,7 @@ class AseTaskDoc(AseBaseModel):
 
         ionic_steps = []
         if ionic_step_data is not None and len(ionic_step_data) > 0:
-            for idx in range(n_steps):
+            for idx in range(len(trajectory)):
                 _ionic_step_data = {
                     key: (
                         trajectory.frame_properties[idx].get(key)
@@ -494,7 +512,11 @@ class AseTaskDoc(AseBaseModel):
             # electronic step info. There is no equivalent for classical
             # forcefields, so we just save the same info for FULL and
             # PARTIAL options.
-            objects[AseObject.TRAJECTORY] = trajectory  # type: ignore[index]
+            if result.trajectory_store is not None:
+                # only store a reference to a trajectory streamed to disk
+                objects[AseObject.TRAJECTORY_STORE] = result.trajectory_store  # type: ignore[index]
+            else:
+                objects[AseObject.TRAJECTORY] = trajectory  # type: ignore[index]
 
         output_doc = OutputDoc(
             mol_or_struct=output_mol_or_struct,
@@ -7,7 +7,8 @@ import io
 import os
 import sys
 import time
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 from ase import Atoms
@@ -18,7 +19,7 @@ from ase.filters import FrechetCellFilter
 from ase.io import Trajectory as AseTrajectory
 from ase.optimize import BFGS, FIRE, LBFGS, BFGSLineSearch, LBFGSLineSearch, MDMin
 from ase.optimize.sciopt import SciPyFminBFGS, SciPyFminCG
-from monty.serialization import dumpfn
+from monty.serialization import dumpfn, loadfn
 from pymatgen.core.structure import Molecule, Structure
 from pymatgen.core.trajectory import Trajectory as PmgTrajectory
 from pymatgen.io.ase import AseAtomsAdaptor
@@ -26,6 +27,7 @@ from pymatgen.io.ase import AseAtomsAdaptor
 from atomate2.ase.schemas import AseResult
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from os import PathLike
     from typing import Literal
 
@@ -34,6 +36,9 @@ if TYPE_CHECKING:
     from ase.io.trajectory import TrajectoryReader
     from ase.optimize.optimize import Optimizer
 
+# file in a trajectory store holding the number of frames and their shapes
+TRAJECTORY_STORE_METADATA = "metadata.json"
+
 OPTIMIZERS = {
     "FIRE": FIRE,
     "BFGS": BFGS,
@@ -286,6 +291,317 @@ class TrajectoryObserver:
         return traj_dict
 
 
+class StreamingTrajectoryObserver(TrajectoryObserver):
+    """Trajectory observer which streams frames to disk.
+
+    Frames are accumulated in memory in chunks of ``chunk_size`` and then appended
+    to one binary file per quantity (energies, forces, positions, ...). The
+    trajectory is only read back as memory-mapped arrays, such that the memory
+    required by the observer is bounded by the chunk size rather than the number of
+    steps. The store can be read without the observer using
+    :obj:`load_trajectory_store`.
+    """
+
+    _columns = (
+        "energies",
+        "forces",
+        "stresses",
+        "magmoms",
+        "atom_positions",
+        "cells",
+        "velocities",
+        "temperatures",
+    )
+
+    def __init__(
+        self,
+        atoms: Atoms,
+        store_md_outputs: bool = False,
+        directory: str | PathLike = "trajectory_store",
+        chunk_size: int = 1000,
+    ) -> None:
+        """Initialize the Observer.
+
+        Parameters
+        ----------
+        atoms (Atoms): the structure to observe.
+        store_md_outputs (bool): whether to store velocities and temperatures.
+        directory (str or PathLike): directory to write the trajectory store to.
+        chunk_size (int): number of frames to keep in memory before writing to disk.
+
+        Returns
+        -------
+            None
+        """
+        super().__init__(atoms, store_md_outputs=store_md_outputs)
+        self.directory = Path(directory).absolute()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.n_frames = 0
+        self._frame_shapes: dict[str, tuple[int, ...]] = {}
+        for column in (*self._columns, "frac_coords"):
+            _get_column_file(self.directory, column).unlink(missing_ok=True)
+
+    def __call__(self) -> None:
+        """Save the properties of an Atoms, writing them to disk once in a while."""
+        super().__call__()
+        if len(self.cells) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append the frames held in memory to the on-disk store."""
+        n_new = len(self.cells)
+        if n_new == 0:
+            return
+
+        columns = {column: getattr(self, column) for column in self._columns}
+        if self._is_periodic:
+            # precompute fractional coordinates for the pymatgen trajectory
+            columns["frac_coords"] = [
+                np.linalg.solve(np.asarray(cell).T, np.asarray(positions).T).T
+                for cell, positions in zip(self.cells, self.atom_positions, strict=True)
+            ]
+
+        for column, frames in columns.items():
+            if len(frames) == 0:
+                continue
+            data = np.asarray(frames, dtype=np.float64)
+            self._frame_shapes.setdefault(column, data.shape[1:])
+            with open(_get_column_file(self.directory, column), "ab") as file:
+                data.tofile(file)
+            frames.clear()
+
+        self.n_frames += n_new
+        dumpfn(
+            {
+                "n_frames": self.n_frames,
+                "frame_shapes": self._frame_shapes,
+                "species": self.atoms.get_chemical_symbols(),
+                "is_periodic": self._is_periodic,
+            },
+            self.directory / TRAJECTORY_STORE_METADATA,
+        )
+
+    def get_column(self, column: str) -> np.ndarray:
+        """
+        Get all frames of a quantity as a read-only memory-mapped array.
+
+        Parameters
+        ----------
+        column : str
+            The name of the quantity, e.g., "forces" or "atom_positions".
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_frames, ...).
+        """
+        self.flush()
+        return _load_column(self.directory, column, self._frame_shapes.get(column))
+
+    def _get_property_columns(self) -> dict[str, np.ndarray]:
+        """Get the memory-mapped frame properties, keyed by their pymatgen name."""
+        columns = {"energy": "energies", "forces": "forces"} | {
+            key: column
+            for key, column in (
+                ("stress", "stresses"),
+                ("magmoms", "magmoms"),
+                ("velocities", "velocities"),
+                ("temperature", "temperatures"),
+            )
+            if self._calc_kwargs[key]
+        }
+        data = {key: self.get_column(column) for key, column in columns.items()}
+        return {key: value for key, value in data.items() if len(value) > 0}
+
+    @staticmethod
+    def _get_frame_properties(data: dict[str, np.ndarray], idx: int) -> dict:
+        """Get the properties of a single frame from the memory-mapped columns."""
+        return {
+            key: float(value[idx]) if value.ndim == 1 else np.array(value[idx])
+            for key, value in data.items()
+        }
+
+    def to_ase_trajectory(
+        self, filename: str | None = "atoms.traj"
+    ) -> TrajectoryReader:
+        """
+        Convert to an ASE .Trajectory.
+
+        The frames are written one at a time from the on-disk store.
+
+        Parameters
+        ----------
+        filename : str | None
+            Name of the file to write the ASE trajectory to.
+        """
+        positions = self.get_column("atom_positions")
+        cells = self.get_column("cells")
+        velocities = self.get_column("velocities") if self._store_md_outputs else None
+        properties = self._get_property_columns()
+
+        with AseTrajectory(filename, "w") as file:
+            for idx in range(self.n_frames):
+                atoms = self.atoms.copy()
+                atoms.set_positions(positions[idx])
+                atoms.set_cell(cells[idx])
+                if velocities is not None:
+                    atoms.set_velocities(velocities[idx])
+
+                props = self._get_frame_properties(properties, idx)
+                kwargs = {"energy": props["energy"], "forces": props["forces"]}
+                if "stress" in props:
+                    kwargs["stress"] = props["stress"]
+                if "magmoms" in props:
+                    kwargs["magmom"] = props["magmoms"]
+
+                atoms.calc = SinglePointCalculator(atoms=atoms, **kwargs)
+                file.write(atoms)
+
+        return AseTrajectory(filename, "r")
+
+    def to_pymatgen_trajectory(
+        self,
+        filename: str | None = "trajectory.json.gz",
+        file_format: Literal["pmg", "xdatcar"] = "pmg",
+        frame_indices: Sequence[int] | None = None,
+    ) -> PmgTrajectory:
+        """
+        Convert the trajectory to a pymatgen .Trajectory object.
+
+        The coordinates and lattices of the trajectory are memory-mapped from the
+        on-disk store if all frames are included. The frame properties are always
+        loaded into memory, so use ``frame_indices`` to convert part of a long
+        trajectory.
+
+        Parameters
+        ----------
+        filename : str or None
+            Name of the file to write the pymatgen trajectory to.
+            If None, no file is written.
+        file_format : str
+            If "pmg", writes a pymatgen .Trajectory object to file
+            If "xdatcar", writes a VASP-format XDATCAR object to file
+        frame_indices : Sequence of int or None
+            The frames to include. If None, all frames are included.
+        """
+        species = AseAtomsAdaptor.get_structure(
+            self.atoms, cls=Structure if self._is_periodic else Molecule
+        ).species
+        properties = self._get_property_columns()
+        if frame_indices is None:
+            frame_indices = range(self.n_frames)
+            select = slice(None)
+        else:
+            frame_indices = list(frame_indices)
+            select = frame_indices
+        frame_properties = [
+            self._get_frame_properties(properties, idx) for idx in frame_indices
+        ]
+
+        if self._is_periodic:
+            pmg_traj = PmgTrajectory(
+                species=species,
+                coords=self.get_column("frac_coords")[select],
+                lattice=self.get_column("cells")[select],
+                frame_properties=frame_properties,
+                constant_lattice=False,
+            )
+        else:
+            pmg_traj = PmgTrajectory(
+                species=species,
+                coords=self.get_column("atom_positions")[select],
+                charge=getattr(self.atoms, "charge", 0),
+                spin_multiplicity=getattr(self.atoms, "spin_multiplicity", None),
+                frame_properties=frame_properties,
+            )
+
+        if filename:
+            if file_format == "pmg":
+                dumpfn(pmg_traj, filename)
+            elif file_format == "xdatcar":
+                pmg_traj.write_Xdatcar(filename=filename)
+
+        return pmg_traj
+
+    def as_dict(self) -> dict:
+        """Make a dict representation of the Trajectory.
+
+        Unlike :obj:`TrajectoryObserver.as_dict`, the quantities are the
+        memory-mapped arrays of the on-disk store rather than lists.
+        """
+        traj_dict = {
+            "energy": self.get_column("energies"),
+            "forces": self.get_column("forces"),
+            "stress": self.get_column("stresses"),
+            "atom_positions": self.get_column("atom_positions"),
+            "cells": self.get_column("cells"),
+            "atoms": self.atoms,
+            "atomic_number": self.atoms.get_atomic_numbers().tolist(),
+        }
+
+        if self._calc_kwargs["magmoms"]:
+            traj_dict["magmoms"] = self.get_column("magmoms")
+
+        if self._store_md_outputs:
+            traj_dict.update(
+                velocities=self.get_column("velocities"),
+                temperature=self.get_column("temperatures"),
+            )
+        return traj_dict
+
+
+def _get_column_file(directory: Path, column: str) -> Path:
+    """Get the file of a quantity in a trajectory store."""
+    return directory / f"{column}.bin"
+
+
+def _load_column(
+    directory: Path, column: str, shape: tuple[int, ...] | None
+) -> np.ndarray:
+    """Memory-map all frames of a quantity in a trajectory store."""
+    if shape is None:
+        return np.empty((0,))
+    n_frames = _get_column_file(directory, column).stat().st_size // (
+        8 * int(np.prod(shape, dtype=int))
+    )
+    return np.memmap(
+        _get_column_file(directory, column),
+        dtype=np.float64,
+        mode="r",
+        shape=(n_frames, *shape),
+    )
+
+
+def load_trajectory_store(directory: str | PathLike) -> dict[str, Any]:
+    """
+    Load a trajectory store written by a :obj:`StreamingTrajectoryObserver`.
+
+    Parameters
+    ----------
+    directory : str or PathLike
+        The directory of the trajectory store.
+
+    Returns
+    -------
+    dict
+        The chemical symbols "species", whether the structure "is_periodic", the
+        number of frames "n_frames" and all frames of each stored quantity as
+        read-only memory-mapped arrays.
+    """
+    directory = Path(directory)
+    metadata = loadfn(directory / TRAJECTORY_STORE_METADATA)
+    return {
+        "species": metadata["species"],
+        "is_periodic": metadata["is_periodic"],
+        "n_frames": metadata["n_frames"],
+        **{
+            column: _load_column(directory, column, tuple(shape))
+            for column, shape in metadata["frame_shapes"].items()
+        },
+    }
+
+
 class AseRelaxer:
     """Relax a structure using the Atomic Simulation Environment."""
 
@@ -3,6 +3,7 @@
 import click
 
 from atomate2.cli.dev import dev
+from atomate2.cli.plot import plot
 
 
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
@@ -11,3 +12,4 @@ def cli() -> None:
 
 
 cli.add_command(dev)
+cli.add_command(plot)
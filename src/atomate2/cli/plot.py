@@ -0,0 +1,54 @@
+"""Module containing command line scripts for rendering plots."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument("documents", nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--n-workers",
+    "-n",
+    default=1,
+    show_default=True,
+    help="Number of processes used to render the plots.",
+)
+def plot(documents: tuple[str, ...], n_workers: int) -> None:
+    """Render the deferred plots of phonon, Grueneisen and QHA documents.
+
+    Each document should be a JSON file of a document created with the "deferred"
+    plot policy, e.g., the output of a job exported from the job store. The plots are
+    written to the directory of the JSON file.
+
+    Parameters
+    ----------
+    documents
+        The JSON files of the documents.
+    n_workers
+        Number of processes used to render the plots.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if n_workers > 1 and len(documents) > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_render_document, documents))
+    else:
+        for document in documents:
+            _render_document(document)
+
+
+def _render_document(filename: str) -> None:
+    """Render the deferred plots of a document in the directory of its file."""
+    from pathlib import Path
+
+    from monty.os import cd
+    from monty.serialization import loadfn
+
+    path = Path(filename).resolve()
+    document = loadfn(path)
+    if not hasattr(document, "render_plots"):
+        raise click.ClickException(f"{filename} does not contain a plottable document")
+    with cd(path.parent):
+        document.render_plots()
+    click.echo(f"Rendered plots of {filename}")
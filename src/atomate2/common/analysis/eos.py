@@ -0,0 +1,450 @@
+"""Batched fitting of equations of state."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from pymatgen.core.units import FloatWithUnit
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+ENERGY_EOS_MODELS = (
+    "murnaghan",
+    "birch",
+    "birch_murnaghan",
+    "pourier_tarantola",
+    "vinet",
+)
+
+# b1 and a relative v0 for each starting point, the first one is the standard guess
+_STARTING_POINTS = (
+    (4.0, 1.0),
+    (2.5, 0.99),
+    (5.5, 1.01),
+    (7.0, 1.0),
+    (3.0, 1.02),
+    (6.0, 0.98),
+)
+
+_EV_PER_ANG3_TO_GPA = float(FloatWithUnit(1.0, "eV ang^-3").to("GPa"))
+
+
+def fit_energy_eos(
+    volumes: Sequence[Sequence[float]],
+    energies: Sequence[Sequence[float]],
+    eos_models: Sequence[str] = ENERGY_EOS_MODELS,
+    n_starts: int = 4,
+    max_iter: int = 200,
+) -> list[dict[str, dict]]:
+    """
+    Fit many energy vs. volume datasets to several equations of state at once.
+
+    All datasets, models and starting points are fitted simultaneously with a
+    vectorized Levenberg-Marquardt algorithm using analytic Jacobians. For each
+    dataset and model, the fit with the lowest residual over all starting points
+    is kept. The equations of state are the same as those of
+    :obj:`pymatgen.analysis.eos.EOS`.
+
+    Parameters
+    ----------
+    volumes : list of list of float
+        The volumes of each dataset in Å^3. The datasets can have different
+        lengths.
+    energies : list of list of float
+        The energies of each dataset in eV.
+    eos_models : tuple of str
+        Names of the equations of state to fit, see ``ENERGY_EOS_MODELS``.
+    n_starts : int
+        Number of starting points for each fit, at most 6.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    list of dict
+        For each dataset, the results of each model, as in
+        ``PostProcessEosEnergy``: the "e0", "b0", "b1", "v0" and "b0 GPa" of the fit,
+        or the "exception" if the fit failed.
+    """
+    unknown = set(eos_models) - set(_ENERGY_MODELS)
+    if unknown:
+        raise ValueError(f"Unknown EOS models: {', '.join(sorted(unknown))}")
+    if len(volumes) == 0:
+        return []
+
+    vols, values, weights = _pad(volumes, energies)
+    n_sets = len(vols)
+
+    # quadratic fit for the initial guess, as in pymatgen
+    scale = vols.max(axis=1, keepdims=True)
+    quad_a, quad_b, quad_c = _weighted_quadratic_fit(vols / scale, values, weights)
+    quad_a, quad_b = quad_a / scale[:, 0] ** 2, quad_b / scale[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v0 = -quad_b / (2 * quad_a)
+    e0 = quad_a * v0**2 + quad_b * v0 + quad_c
+    b0 = 2 * quad_a * v0
+    vol_min = np.where(weights > 0, vols, np.inf).min(axis=1)
+    vol_max = np.where(weights > 0, vols, -np.inf).max(axis=1)
+    valid_guess = (vol_min < v0) & (v0 < vol_max)
+
+    starts = np.array(_STARTING_POINTS[:n_starts])
+    n_starts = len(starts)
+    initial = np.empty((n_sets, n_starts, 4))
+    initial[..., 0] = e0[:, None]
+    initial[..., 1] = b0[:, None]
+    initial[..., 2] = starts[:, 0]
+    initial[..., 3] = v0[:, None] * starts[:, 1]
+    initial = np.where(valid_guess[:, None, None], initial, 1.0)
+
+    results: list[dict[str, dict]] = [{} for _ in range(n_sets)]
+    for eos_name in eos_models:
+        func, jac = _ENERGY_MODELS[eos_name]
+        params, converged = _fit_multi_start(
+            func, jac, vols, values, weights, initial, max_iter
+        )
+        for idx in range(n_sets):
+            if not valid_guess[idx]:
+                results[idx][eos_name] = {
+                    "exception": "The minimum volume of a fitted parabola is not in "
+                    "the input volumes."
+                }
+            elif not converged[idx]:
+                results[idx][eos_name] = {"exception": "Optimal parameters not found"}
+            else:
+                e0_fit, b0_fit, b1_fit, v0_fit = params[idx].tolist()
+                results[idx][eos_name] = {
+                    "e0": e0_fit,
+                    "b0": b0_fit,
+                    "b1": b1_fit,
+                    "v0": v0_fit,
+                    "b0 GPa": b0_fit * _EV_PER_ANG3_TO_GPA,
+                }
+    return results
+
+
+def fit_pressure_eos(
+    volumes: Sequence[Sequence[float]],
+    pressures: Sequence[Sequence[float]],
+    initial_guesses: Sequence[Sequence[float]],
+    n_starts: int = 4,
+    max_iter: int = 200,
+) -> list[dict[str, float | str]]:
+    """
+    Fit many pressure vs. volume datasets to the Birch-Murnaghan EOS at once.
+
+    Parameters
+    ----------
+    volumes : list of list of float
+        The volumes of each dataset in Å^3.
+    pressures : list of list of float
+        The pressures of each dataset.
+    initial_guesses : list of list of float
+        The initial (b0, b1, v0) of each dataset. Further starting points are
+        generated around them.
+    n_starts : int
+        Number of starting points for each fit, at most 6.
+    max_iter : int
+        Maximum number of iterations.
+
+    Returns
+    -------
+    list of dict
+        For each dataset, the "b0", "b1" and "v0" of the fit, or the "exception" if
+        the fit failed.
+    """
+    if len(volumes) == 0:
+        return []
+    vols, values, weights = _pad(volumes, pressures)
+    guesses = np.asarray(initial_guesses, dtype=float)
+
+    starts = np.array(_STARTING_POINTS[:n_starts])
+    initial = np.empty((len(vols), len(starts), 3))
+    initial[..., 0] = guesses[:, None, 0]
+    initial[..., 1] = guesses[:, None, 1] + starts[:, 0] - starts[0, 0]
+    initial[..., 2] = guesses[:, None, 2] * starts[:, 1]
+
+    params, converged = _fit_multi_start(
+        _bm_pressure, _bm_pressure_jac, vols, values, weights, initial, max_iter
+    )
+    return [
+        dict(zip(("b0", "b1", "v0"), set_params.tolist(), strict=True))
+        if set_converged
+        else {"exception": "Optimal EOS parameters not found."}
+        for set_params, set_converged in zip(params, converged, strict=True)
+    ]
+
+
+def _pad(
+    volumes: Sequence[Sequence[float]], values: Sequence[Sequence[float]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pad datasets of different lengths into arrays, with zero weight padding."""
+    n_max = max(len(vols) for vols in volumes)
+    padded_vols = np.ones((len(volumes), n_max))
+    padded_values = np.zeros((len(volumes), n_max))
+    weights = np.zeros((len(volumes), n_max))
+    for idx, (vols, vals) in enumerate(zip(volumes, values, strict=True)):
+        padded_vols[idx, : len(vols)] = vols
+        # padding uses the first volume to stay in the domain of the EOS
+        padded_vols[idx, len(vols) :] = vols[0]
+        padded_values[idx, : len(vals)] = vals
+        weights[idx, : len(vols)] = 1.0
+    return padded_vols, padded_values, weights
+
+
+def _weighted_quadratic_fit(
+    x: np.ndarray, y: np.ndarray, weights: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fit y = a x^2 + b x + c to each row, ignoring points with zero weight."""
+    basis = np.stack([x**2, x, np.ones_like(x)], axis=-1) * weights[..., None]
+    lhs = np.einsum("sni,snj->sij", basis, basis)
+    rhs = np.einsum("sni,sn->si", basis, y * weights)
+    coeffs = np.linalg.solve(lhs, rhs[..., None])[..., 0]
+    return coeffs[:, 0], coeffs[:, 1], coeffs[:, 2]
+
+
+def _fit_multi_start(
+    func: Callable,
+    jac: Callable,
+    volumes: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    initial: np.ndarray,
+    max_iter: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fit all starting points and keep the best converged fit of each dataset."""
+    n_sets, n_starts, n_params = initial.shape
+    params, sse, converged = _levenberg_marquardt(
+        func,
+        jac,
+        np.repeat(volumes, n_starts, axis=0),
+        np.repeat(values, n_starts, axis=0),
+        np.repeat(weights, n_starts, axis=0),
+        initial.reshape(-1, n_params),
+        max_iter,
+    )
+    sse = np.where(converged, sse, np.inf).reshape(n_sets, n_starts)
+    best = np.argmin(sse, axis=1)
+    params = params.reshape(n_sets, n_starts, n_params)[np.arange(n_sets), best]
+    return params, np.isfinite(sse[np.arange(n_sets), best])
+
+
+def _levenberg_marquardt(
+    func: Callable,
+    jac: Callable,
+    volumes: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    params: np.ndarray,
+    max_iter: int,
+    ftol: float = 1.49012e-8,
+    xtol: float = 1.49012e-8,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Minimize the weighted squared residuals of a batch of independent fits.
+
+    The tolerances have the same meaning and default values as in
+    :obj:`scipy.optimize.leastsq`.
+    """
+    params = params.copy()
+    n_params = params.shape[1]
+    damping = np.full(len(params), 1e-3)
+    converged = np.zeros(len(params), dtype=bool)
+    done = np.zeros(len(params), dtype=bool)
+
+    with np.errstate(all="ignore"):
+        residuals = weights * (values - func(volumes, params))
+        sse = np.sum(residuals**2, axis=1)
+        done |= ~np.isfinite(sse)
+
+        for _ in range(max_iter):
+            active = np.flatnonzero(~done)
+            if len(active) == 0:
+                break
+            act_vols, act_weights = volumes[active], weights[active]
+            act_params = params[active]
+
+            jacobian = -act_weights[..., None] * jac(act_vols, act_params)
+            jtj = np.einsum("sni,snj->sij", jacobian, jacobian)
+            gradient = np.einsum("sni,sn->si", jacobian, residuals[active])
+            diag = np.maximum(np.einsum("sii->si", jtj), 1e-300)
+            lhs = jtj + damping[active, None, None] * diag[..., None] * np.eye(n_params)
+            step = -_batched_solve(lhs, gradient)
+
+            trial = act_params + step
+            trial_residuals = act_weights * (values[active] - func(act_vols, trial))
+            trial_sse = np.sum(trial_residuals**2, axis=1)
+            improved = np.isfinite(trial_sse) & (trial_sse < sse[active])
+
+            accepted = active[improved]
+            small_reduction = (sse[active] - trial_sse) <= ftol * sse[active]
+            small_step = np.linalg.norm(step, axis=1) <= xtol * (
+                np.linalg.norm(act_params, axis=1) + xtol
+            )
+            params[accepted] = trial[improved]
+            residuals[accepted] = trial_residuals[improved]
+            sse[accepted] = trial_sse[improved]
+
+            damping[active] = np.where(
+                improved, damping[active] / 10, damping[active] * 10
+            )
+            # no further improvement is possible if even tiny steps do not help
+            stalled = damping[active] > 1e16
+            finished = (improved & (small_reduction | small_step)) | stalled
+            finished |= sse[active] == 0
+            converged[active[finished]] = np.isfinite(sse[active[finished]])
+            done[active[finished]] = True
+
+    return params, sse, converged & np.all(np.isfinite(params), axis=1)
+
+
+def _batched_solve(lhs: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Solve a batch of linear systems, using least squares for singular ones."""
+    try:
+        return np.linalg.solve(lhs, rhs[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return np.einsum("sij,sj->si", np.linalg.pinv(lhs), rhs)
+
+
+def _split(params: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Split parameters into columns that broadcast with the volumes."""
+    return tuple(params[:, idx, None] for idx in range(params.shape[1]))
+
+
+def _murnaghan(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e0, b0, b1, v0 = _split(params)
+    return (
+        e0
+        + b0 * volumes / b1 * (((v0 / volumes) ** b1) / (b1 - 1.0) + 1.0)
+        - v0 * b0 / (b1 - 1.0)
+    )
+
+
+def _murnaghan_jac(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    _, b0, b1, v0 = _split(params)
+    ratio = (v0 / volumes) ** b1
+    denom = b1 * (b1 - 1.0)
+    d_b0 = volumes * (ratio / denom + 1.0 / b1) - v0 / (b1 - 1.0)
+    d_ratio_term = (
+        ratio * np.log(v0 / volumes) * denom - ratio * (2 * b1 - 1.0)
+    ) / denom**2
+    d_b1 = b0 * volumes * (d_ratio_term - 1.0 / b1**2) + v0 * b0 / (b1 - 1.0) ** 2
+    d_v0 = b0 / (b1 - 1.0) * (volumes * ratio / v0 - 1.0)
+    return np.stack([np.ones_like(d_b0), d_b0, d_b1, d_v0], axis=-1)
+
+
+def _birch(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e0, b0, b1, v0 = _split(params)
+    strain = (v0 / volumes) ** (2 / 3.0) - 1.0
+    return e0 + 9 / 8 * b0 * v0 * strain**2 + 9 / 16 * b0 * v0 * (b1 - 4.0) * strain**3
+
+
+def _birch_murnaghan(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e0, b0, b1, v0 = _split(params)
+    eta = (v0 / volumes) ** (1 / 3)
+    return e0 + 9 * b0 * v0 / 16 * (eta**2 - 1) ** 2 * (
+        6 + b1 * (eta**2 - 1.0) - 4 * eta**2
+    )
+
+
+def _birch_jac(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    # the Birch and Birch-Murnaghan forms are algebraically identical
+    _, b0, b1, v0 = _split(params)
+    strain = (v0 / volumes) ** (2 / 3.0) - 1.0
+    d_b0 = 9 / 8 * v0 * strain**2 + 9 / 16 * v0 * (b1 - 4.0) * strain**3
+    d_b1 = 9 / 16 * b0 * v0 * strain**3
+    d_strain = 2 / 3 * (strain + 1.0) / v0
+    d_v0 = (
+        b0 * d_b0 / v0
+        + (9 / 4 * b0 * v0 * strain + 27 / 16 * b0 * v0 * (b1 - 4.0) * strain**2)
+        * d_strain
+    )
+    return np.stack([np.ones_like(d_b0), d_b0, d_b1, d_v0], axis=-1)
+
+
+def _pourier_tarantola(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e0, b0, b1, v0 = _split(params)
+    eta = (volumes / v0) ** (1 / 3)
+    squiggle = -3 * np.log(eta)
+    return e0 + b0 * v0 * squiggle**2 / 6 * (3 + squiggle * (b1 - 2))
+
+
+def _pourier_tarantola_jac(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    _, b0, b1, v0 = _split(params)
+    squiggle = np.log(v0 / volumes)
+    shape = squiggle**2 * (3 + squiggle * (b1 - 2))
+    d_shape = 6 * squiggle + 3 * (b1 - 2) * squiggle**2
+    d_b0 = v0 * shape / 6
+    d_b1 = b0 * v0 * squiggle**3 / 6
+    d_v0 = b0 / 6 * (shape + d_shape)
+    return np.stack([np.ones_like(d_b0), d_b0, d_b1, d_v0], axis=-1)
+
+
+def _vinet(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    e0, b0, b1, v0 = _split(params)
+    eta = (volumes / v0) ** (1 / 3)
+    return e0 + 2 * b0 * v0 / (b1 - 1.0) ** 2 * (
+        2
+        - (5 + 3 * b1 * (eta - 1.0) - 3 * eta)
+        * np.exp(-3 * (b1 - 1.0) * (eta - 1.0) / 2.0)
+    )
+
+
+def _vinet_jac(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    # E = e0 + 4 b0 v0 / c^2 * (1 - (1 + z) exp(-z)), c = b1 - 1, z = 3 c (eta - 1) / 2
+    _, b0, b1, v0 = _split(params)
+    eta = (volumes / v0) ** (1 / 3)
+    c = b1 - 1.0
+    z = 1.5 * c * (eta - 1.0)
+    exp_z = np.exp(-z)
+    shape = 1 - (1 + z) * exp_z
+    d_b0 = 4 * v0 * shape / c**2
+    d_b1 = 4 * b0 * v0 * (-2 * shape / c**3 + z * exp_z * 1.5 * (eta - 1.0) / c**2)
+    d_v0 = 4 * b0 / c**2 * (shape - c * eta * z * exp_z / 2)
+    return np.stack([np.ones_like(d_b0), d_b0, d_b1, d_v0], axis=-1)
+
+
+def _bm_pressure(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    b0, b1, v0 = _split(params)
+    eta = (v0 / volumes) ** (1.0 / 3.0)
+    return (
+        3
+        * b0
+        * eta**5
+        / 8.0
+        * (3 * (b1 - 4) * eta**4 + 2 * (14.0 - 3 * b1) * eta**2 + 3 * b1 - 16.0)
+    )
+
+
+def _bm_pressure_jac(volumes: np.ndarray, params: np.ndarray) -> np.ndarray:
+    b0, b1, v0 = _split(params)
+    eta = (v0 / volumes) ** (1.0 / 3.0)
+    d_b0 = (
+        3
+        * eta**5
+        / 8.0
+        * (3 * (b1 - 4) * eta**4 + 2 * (14.0 - 3 * b1) * eta**2 + 3 * b1 - 16.0)
+    )
+    d_b1 = 9 * b0 * eta**5 * (eta**2 - 1) ** 2 / 8.0
+    d_eta = (
+        3
+        * b0
+        / 8.0
+        * (
+            27 * (b1 - 4) * eta**8
+            + 14 * (14.0 - 3 * b1) * eta**6
+            + 5 * (3 * b1 - 16.0) * eta**4
+        )
+    )
+    d_v0 = d_eta * eta / (3 * v0)
+    return np.stack([d_b0, d_b1, d_v0], axis=-1)
+
+
+_ENERGY_MODELS: dict[str, tuple[Callable, Callable]] = {
+    "murnaghan": (_murnaghan, _murnaghan_jac),
+    "birch": (_birch, _birch_jac),
+    "birch_murnaghan": (_birch_murnaghan, _birch_jac),
+    "pourier_tarantola": (_pourier_tarantola, _pourier_tarantola_jac),
+    "vinet": (_vinet, _vinet_jac),
+}
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+from functools import partial
 from typing import TYPE_CHECKING
 
 from emmet.core.utils import jsanitize
@@ -9,6 +11,11 @@ from maggma.builders import Builder
 from monty.serialization import MontyDecoder
 from pymatgen.analysis.structure_matcher import StructureMatcher
 
+from atomate2.common.builders.utils import (
+    get_source_timestamp,
+    get_updated_formulas,
+    run_in_process_pool,
+)
 from atomate2.common.schemas.magnetism import MagneticOrderingsDocument
 
 if TYPE_CHECKING:
@@ -40,6 +47,12 @@ class MagneticOrderingsBuilder(Builder):
         Numerical length tolerance for structure equivalence. Default is 0.3
     structure_match_angle_tol : float
         Numerical angle tolerance in degrees for structure equivalence. Default is 5.
+    incremental : bool
+        Only rebuild formulas with tasks that were added or updated since the
+        magnetic orderings documents were last built. If False, all formulas are
+        rebuilt.
+    n_workers : int
+        Number of processes used to process items when calling :obj:`run`.
     **kwargs : dict
         Keyword arguments that will be passed to the Builder init.
     """
@@ -52,6 +65,8 @@ class MagneticOrderingsBuilder(Builder):
         structure_match_stol: float = 0.3,
         structure_match_ltol: float = 0.2,
         structure_match_angle_tol: float = 5,
+        incremental: bool = False,
+        n_workers: int = 1,
         **kwargs,
     ) -> None:
         self.tasks = tasks
@@ -60,6 +75,8 @@ class MagneticOrderingsBuilder(Builder):
         self.structure_match_stol = structure_match_stol
         self.structure_match_ltol = structure_match_ltol
         self.structure_match_angle_tol = structure_match_angle_tol
+        self.incremental = incremental
+        self.n_workers = n_workers
 
         self.kwargs = kwargs
 
@@ -69,6 +86,7 @@ class MagneticOrderingsBuilder(Builder):
         """Ensure indices on the tasks and magnetic orderings collections."""
         self.tasks.ensure_index("output.formula_pretty")
         self.tasks.ensure_index("last_updated")
+        self.magnetic_orderings.ensure_index("formula_pretty")
         self.magnetic_orderings.ensure_index("last_updated")
 
     def get_items(self) -> Iterator[list[dict]]:
@@ -89,6 +107,13 @@ class MagneticOrderingsBuilder(Builder):
 
         criteria = dict(self.query)
         criteria.update({"metadata.ordering": {"$exists": True}})
+        if self.incremental:
+            formulas = get_updated_formulas(
+                self.tasks, self.magnetic_orderings, criteria
+            )
+            self.logger.info("Found %d formulas with updated tasks", len(formulas))
+            criteria["output.formula_pretty"] = {"$in": formulas}
+
         self.logger.info("Grouping by formula...")
         num_formulas = len(
             self.tasks.distinct("output.formula_pretty", criteria=criteria)
@@ -118,7 +143,7 @@ class MagneticOrderingsBuilder(Builder):
                 )
                 yield group
 
-    def process_item(self, tasks: list[dict]) -> list[MagneticOrderingsDocument]:
+    def process_item(self, tasks: list[dict]) -> dict | list:
         """Process magnetic ordering relaxation/static calculations into documents.
 
         The magnetic ordering tasks will be grouped based on their parent structure
@@ -132,31 +157,72 @@ class MagneticOrderingsBuilder(Builder):
 
         Returns
         -------
-        list of .MagneticOrderingsDocument
-            A list of magnetic ordering documents (one for each unique parent
-            structure).
+        dict
+            The serialized magnetic ordering document for the parent structure,
+            stamped with the last updated time of its tasks.
         """
-        self.logger.debug("Processing %s", tasks[0]["output"].formula_pretty)
-
         if not tasks:
             return []
 
-        return jsanitize(
-            MagneticOrderingsDocument.from_tasks(tasks).model_dump(),
-            allow_bson=True,
+        self.logger.debug("Processing %s", tasks[0]["output"].formula_pretty)
+        return _process_tasks(
+            tasks,
+            self.tasks.last_updated_field,
+            self.magnetic_orderings.last_updated_field,
         )
 
-    def update_targets(self, items: list[MagneticOrderingsDocument]) -> None:
+    def update_targets(self, items: list[dict]) -> None:
         """Insert new magnetic orderings into the magnetic orderings Store.
 
         Parameters
         ----------
-        items : list of .MagneticOrderingsDocument
-            A list of magnetic ordering documents to add to the database.
+        items : list of dict
+            A list of serialized magnetic ordering documents to add to the database.
         """
+        items = [item for item in items if item]
         self.logger.info("Updating %s magnetic orderings documents", len(items))
         self.magnetic_orderings.update(items, key="ground_state_uuid")
 
+    def run(self, log_level: int = logging.DEBUG) -> None:
+        """Run the builder.
+
+        If ``n_workers`` is greater than 1, items are processed across a pool of
+        processes and the magnetic orderings store is updated after every chunk of
+        items.
+
+        Parameters
+        ----------
+        log_level : int
+            Logging level used when running serially.
+        """
+        if self.n_workers <= 1:
+            super().run(log_level=log_level)
+            return
+
+        process_func = partial(
+            _process_tasks,
+            tasks_last_updated_field=self.tasks.last_updated_field,
+            last_updated_field=self.magnetic_orderings.last_updated_field,
+        )
+        run_in_process_pool(self, process_func, self.n_workers)
+
+
+def _process_tasks(
+    tasks: list[dict],
+    tasks_last_updated_field: str = "last_updated",
+    last_updated_field: str = "last_updated",
+) -> dict | list:
+    """Create a magnetic orderings document for tasks with the same parent."""
+    if not tasks:
+        return []
+
+    doc = jsanitize(
+        MagneticOrderingsDocument.from_tasks(tasks).model_dump(),
+        allow_bson=True,
+    )
+    doc[last_updated_field] = get_source_timestamp(tasks, tasks_last_updated_field)
+    return doc
+
 
 def _group_orderings(
     tasks: list[dict], ltol: float, stol: float, angle_tol: float
@@ -0,0 +1,180 @@
+"""Utilities shared by the atomate2 builders."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from maggma.core import Sort
+from maggma.utils import grouper, to_dt
+from pydash import get
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from maggma.builders import Builder
+    from maggma.core import Store
+
+logger = logging.getLogger(__name__)
+
+
+def get_updated_formulas(
+    tasks: Store,
+    target: Store,
+    criteria: dict,
+    tasks_formula_key: str = "output.formula_pretty",
+    target_formula_key: str = "formula_pretty",
+) -> list[str]:
+    """
+    Get the formulas with tasks that changed since the target documents were built.
+
+    A formula is considered changed if it has no documents in the target store, if
+    any of its target documents has no last updated time, or if any of its tasks was
+    updated after the most recent target document for that formula. Target documents
+    are stamped with the last updated time of their most recent source task (see
+    :obj:`get_source_timestamp`). Tasks without a last updated time are always
+    considered changed.
+
+    Only tasks updated after the oldest target document are grouped, so the cost
+    depends on the number of changed tasks rather than on the size of the stores.
+
+    Parameters
+    ----------
+    tasks : .Store
+        Store of task documents.
+    target : .Store
+        Store of built documents.
+    criteria : dict
+        Query to limit the tasks to be considered.
+    tasks_formula_key : str
+        Key of the formula in the task documents.
+    target_formula_key : str
+        Key of the formula in the target documents.
+
+    Returns
+    -------
+    list of str
+        The formulas that need to be (re)built.
+    """
+    tasks_key = tasks.last_updated_field
+    target_key = target.last_updated_field
+
+    stamped = set(
+        target.distinct(target_formula_key, criteria={target_key: {"$ne": None}})
+    )
+    unstamped = set(target.distinct(target_formula_key, criteria={target_key: None}))
+    built = stamped - unstamped
+    updated = set(tasks.distinct(tasks_formula_key, criteria=criteria)) - built
+
+    oldest = next(
+        target.query(
+            criteria={target_key: {"$ne": None}},
+            properties=[target_key],
+            sort={target_key: Sort.Ascending},
+            limit=1,
+        ),
+        None,
+    )
+    if oldest is None:
+        return sorted(updated)
+
+    # last updated times can be stored as dates or as ISO 8601 strings
+    oldest_time = _get_time(oldest, target_key)
+    changed_criteria = {
+        "$and": [
+            criteria,
+            {
+                "$or": [
+                    {tasks_key: {"$gt": oldest_time}},
+                    {tasks_key: {"$gt": oldest_time.isoformat()}},
+                    {tasks_key: None},
+                ]
+            },
+        ]
+    }
+    changed_tasks = {
+        get(keys, tasks_formula_key): [_get_time(doc, tasks_key) for doc in docs]
+        for keys, docs in tasks.groupby(
+            tasks_formula_key, criteria=changed_criteria, properties=[tasks_key]
+        )
+    }
+    if not changed_tasks:
+        return sorted(updated)
+
+    for keys, docs in target.groupby(
+        target_formula_key,
+        criteria={target_formula_key: {"$in": sorted(changed_tasks)}},
+        properties=[target_key],
+    ):
+        formula = get(keys, target_formula_key)
+        last_built = max(_get_time(doc, target_key) for doc in docs)
+        if any(time is None or time > last_built for time in changed_tasks[formula]):
+            updated.add(formula)
+    return sorted(updated)
+
+
+def get_source_timestamp(tasks: list[dict], key: str = "last_updated") -> datetime:
+    """
+    Get the last updated time of a built document from its source tasks.
+
+    The most recent last updated time of the tasks is used, rather than the time the
+    document is written, so that tasks updated while the builder runs are picked up
+    by the next incremental build. If no task has a last updated time, the current
+    time is used.
+
+    Parameters
+    ----------
+    tasks : list of dict
+        The tasks used to build the document.
+    key : str
+        Key of the last updated time in the task documents.
+
+    Returns
+    -------
+    datetime
+        The last updated time as a naive UTC datetime.
+    """
+    times = [_get_time(task, key) for task in tasks]
+    times = [time for time in times if time is not None]
+    if times:
+        return max(times)
+    return datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+
+def run_in_process_pool(
+    builder: Builder, process_func: Callable, n_workers: int
+) -> None:
+    """
+    Run a builder, processing items across a pool of processes.
+
+    Items are processed in chunks of ``builder.chunk_size`` and the targets are
+    updated after every chunk. The builder itself is not sent to the worker
+    processes, so ``process_func`` must be a picklable function (e.g., a module level
+    function or a :obj:`functools.partial` of one) that only depends on the item.
+
+    Parameters
+    ----------
+    builder : .Builder
+        The builder to run.
+    process_func : callable
+        Function used to process each item instead of ``builder.process_item``.
+    n_workers : int
+        Number of worker processes.
+    """
+    builder.connect()
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for chunk in grouper(builder.get_items(), builder.chunk_size):
+            logger.info(f"Processing batch of {len(chunk)} items")
+            processed = executor.map(process_func, chunk)
+            builder.update_targets([item for item in processed if item is not None])
+    builder.finalize()
+
+
+def _get_time(doc: dict, key: str) -> datetime | None:
+    """Get a last updated time as a naive UTC datetime."""
+    time = to_dt(get(doc, key))
+    if time is not None and time.tzinfo is not None:
+        time = time.astimezone(timezone.utc).replace(tzinfo=None)
+    return time
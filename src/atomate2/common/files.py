@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from atomate2 import SETTINGS
 from atomate2.utils.file_client import FileClient, auto_fileclient
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
 
 @auto_fileclient
 def copy_files(
@@ -20,6 +30,9 @@ def copy_files(
     allow_missing: bool = False,
     file_client: FileClient | None = None,
     link_files: bool = False,
+    bulk: bool = False,
+    max_transfers: int = 4,
+    compress: bool = False,
 ) -> None:
     r"""
     Copy files between source and destination folders.
@@ -53,11 +66,37 @@ def copy_files(
     link_files : bool
         Whether to link the files instead of copying them. This option will raise an
         error if it is used in combination with a file_client.
+    bulk : bool
+        Whether to copy all files in a single bulk transfer. The source directory is
+        listed with a single request and several files are copied concurrently,
+        which greatly reduces the number of round trips for remote hosts. Ignored
+        when linking files.
+    max_transfers : int
+        The maximum number of concurrent transfers in bulk mode.
+    compress : bool
+        Whether to compress files on the fly during bulk transfers from a remote
+        host. Only worthwhile on slow connections.
     """
     src_dir = file_client.abspath(src_dir, host=src_host)
     if dest_dir is None:
         dest_dir = Path.cwd()
 
+    if bulk and not (link_files and src_host is None):
+        _copy_files_bulk(
+            file_client,
+            src_dir,
+            Path(dest_dir),
+            src_host,
+            include_files,
+            exclude_files,
+            suffix,
+            prefix,
+            allow_missing,
+            max_transfers,
+            compress,
+        )
+        return
+
     files = find_and_filter_files(
         file_client, src_dir, include_files, exclude_files, src_host
     )
@@ -76,6 +115,60 @@ def copy_files(
                 raise
 
 
+def _copy_files_bulk(
+    file_client: FileClient,
+    src_dir: Path,
+    dest_dir: Path,
+    src_host: str | None,
+    include_files: list[str | Path] | None,
+    exclude_files: list[str | Path] | None,
+    suffix: str,
+    prefix: str,
+    allow_missing: bool,
+    max_transfers: int,
+    compress: bool,
+) -> None:
+    """Copy files using a single directory listing and concurrent transfers."""
+    t_start = time.perf_counter()
+    listing = file_client.list_files(src_dir, host=src_host)
+
+    if include_files is None:
+        files = list(listing)
+    else:
+        files = []
+        for file in include_files:
+            if len(Path(file).parts) > 1:
+                # files in subdirectories are not part of the listing
+                globbed = file_client.glob(src_dir / file, host=src_host)
+                matches = [p.relative_to(src_dir) for p in globbed]
+            else:
+                matches = [f for f in listing if fnmatch(f.name, str(file))]
+
+            if len(matches) > 0:
+                files.extend(matches)
+            elif not allow_missing:
+                raise FileNotFoundError(f"{src_dir / file} does not exist")
+
+    exclude_files = [] if exclude_files is None else exclude_files
+    to_copy = {}
+    for file in dict.fromkeys(files):
+        if any(fnmatch(str(file), str(ex)) for ex in exclude_files):
+            continue
+        to_file = Path(file.parent) / f"{prefix}{file.name}"
+        to_copy[src_dir / file] = (dest_dir / to_file).with_suffix(file.suffix + suffix)
+
+    file_client.copy_many(
+        to_copy, src_host=src_host, max_workers=max_transfers, compress=compress
+    )
+
+    n_bytes = sum(listing.get(Path(f).relative_to(src_dir), 0) for f in to_copy)
+    elapsed = time.perf_counter() - t_start
+    logger.info(
+        f"Copied {len(to_copy)} files ({n_bytes / 1e6:.1f} MB) from {src_dir} in "
+        f"{elapsed:.2f} s ({n_bytes / 1e6 / max(elapsed, 1e-9):.1f} MB/s)"
+    )
+
+
 @auto_fileclient
 def delete_files(
     directory: str | Path | None = None,
@@ -175,6 +268,7 @@ def gzip_files(
     allow_missing: bool = False,
     force: bool = False,
     file_client: FileClient = None,
+    n_threads: int | None = None,
 ) -> None:
     r"""
     Gzip files in a directory.
@@ -200,10 +294,15 @@ def gzip_files(
         Whether to overwrite files if they exist.
     file_client : .FileClient
         A file client to use for performing file operations.
+    n_threads : int or None
+        Number of threads used to compress local files. Several files are
+        compressed concurrently, while a single large file is split into blocks
+        compressed in parallel. If ``None``, the ``GZIP_N_THREADS`` setting is used.
     """
     if directory is None:
         directory = Path.cwd() if host is None else Path("~/")
     directory = file_client.abspath(directory, host=host)
+    n_threads = SETTINGS.GZIP_N_THREADS if n_threads is None else n_threads
 
     exclude_files = [] if exclude_files is None else list(exclude_files)
     exclude_files += ["*.gz", "*.GZ"]  # exclude files that are already gzipped
@@ -211,13 +310,22 @@ def gzip_files(
         file_client, directory, include_files, exclude_files, host
     )
 
-    for file in files:
+    # only parallelise one level, so that at most n_threads threads are used:
+    # several files are compressed concurrently, a single file in blocks
+    n_file_threads = n_threads if host is None and len(files) > 1 else 1
+    n_block_threads = 1 if n_file_threads > 1 else n_threads
+
+    def _gzip(file: Path) -> None:
         try:
-            file_client.gzip(directory / file, host=host, force=force)
+            file_client.gzip(
+                directory / file, host=host, force=force, n_threads=n_block_threads
+            )
         except FileNotFoundError:
             if not allow_missing:
                 raise
 
+    _map_files(_gzip, files, n_file_threads)
+
 
 @auto_fileclient
 def gunzip_files(
@@ -228,6 +336,7 @@ def gunzip_files(
     allow_missing: bool = False,
     force: bool = False,
     file_client: FileClient | None = None,
+    n_threads: int | None = None,
 ) -> None:
     r"""
     Gunzip files in a directory.
@@ -253,23 +362,41 @@ def gunzip_files(
         Whether to overwrite files if they exist.
     file_client : .FileClient
         A file client to use for performing file operations.
+    n_threads : int or None
+        Number of local files to decompress concurrently. If ``None``, the
+        ``GZIP_N_THREADS`` setting is used.
     """
     if directory is None:
         directory = Path.cwd() if host is None else Path("~/")
     directory = file_client.abspath(directory, host=host)
+    n_threads = SETTINGS.GZIP_N_THREADS if n_threads is None else n_threads
 
     include_files = ["*.gz"] if include_files is None else include_files
     files = find_and_filter_files(
         file_client, directory, include_files, exclude_files, host
     )
 
-    for file in files:
+    def _gunzip(file: Path) -> None:
         try:
             file_client.gunzip(directory / file, host=host, force=force)
         except FileNotFoundError:
             if not allow_missing:
                 raise
 
+    _map_files(_gunzip, files, n_threads if host is None else 1)
+
+
+def _map_files(func: Callable, files: list[Path], n_threads: int) -> None:
+    """Apply a function to files, concurrently if more than one thread is used."""
+    if n_threads <= 1 or len(files) <= 1:
+        for file in files:
+            func(file)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(n_threads, len(files))) as executor:
+        # consume the results to propagate exceptions
+        list(executor.map(func, files))
+
 
 def find_and_filter_files(
     file_client: FileClient,
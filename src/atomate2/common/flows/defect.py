@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
 from jobflow import Flow, Job, Maker, OutputReference
+from pymatgen.analysis.defects.supercells import get_sc_fromstruct
 
 from atomate2.common.jobs.defect import (
     bulk_supercell_calculation,
@@ -360,6 +362,9 @@ class FormationEnergyMaker(Maker, ABC):
     perturb: float | None = None
     validate_charge: bool = True
     collect_defect_entry_data: bool = False
+    _supercell_matrices: dict = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Apply post init updates."""
@@ -384,7 +389,9 @@ class FormationEnergyMaker(Maker, ABC):
         """Make a flow to calculate the formation energy diagram.
 
         Start a series of charged supercell relaxations from a single defect
-        structure.
+        structure. The flow contains its own bulk supercell calculation; use
+        ``make_many`` to share a single bulk supercell calculation between several
+        defects in the same host.
 
         Parameters
         ----------
@@ -406,39 +413,163 @@ class FormationEnergyMaker(Maker, ABC):
         flow: Flow
             The workflow to calculate the formation energy diagram.
         """
+        supercell_matrix = self._get_supercell_matrix(
+            defect.structure, bulk_supercell_dir, supercell_matrix
+        )
         jobs = []
+        bulk_job = None
         if not self.uc_bulk:
-            if bulk_supercell_dir is None:
-                get_sc_job = bulk_supercell_calculation(
-                    uc_structure=defect.structure,
-                    relax_maker=self.bulk_relax_maker,
-                    sc_mat=supercell_matrix,
-                    get_planar_locpot=self.get_planar_locpot,
-                )
-                sc_mat = get_sc_job.output["sc_mat"]
-                lattice = get_sc_job.output["sc_struct"].lattice
-                bulk_supercell_dir = get_sc_job.output["dir_name"]
-                sc_uuid = get_sc_job.output["uuid"]
-            else:
-                # all additional reader functions need to be in this job
-                # b/c they might receive Response objects instead of data.
-                get_sc_job = get_supercell_from_prv_calc(
-                    uc_structure=defect.structure,
-                    prv_calc_dir=bulk_supercell_dir,
-                    sc_entry_and_locpot_from_prv=self.sc_entry_and_locpot_from_prv,
-                    sc_mat_ref=supercell_matrix,
-                )
-                sc_mat = get_sc_job.output["sc_mat"]
-                lattice = get_sc_job.output["lattice"]
-                sc_uuid = get_sc_job.output["uuid"]
-            jobs.append(get_sc_job)
-        else:
-            if bulk_supercell_dir is not None:
+            bulk_job = self._make_bulk_job(
+                defect.structure, bulk_supercell_dir, supercell_matrix
+            )
+            jobs.append(bulk_job)
+        elif bulk_supercell_dir is not None:
+            raise ValueError(
+                "bulk_supercell_dir should be None when uc_bulk is True."
+                "We will be using a uc bulk calculation, so no bulk supercell "
+                "is needed."
+            )
+
+        defect_jobs, output = self._make_defect_jobs(
+            defect, bulk_job, bulk_supercell_dir, supercell_matrix, defect_index
+        )
+        return Flow(jobs=jobs + defect_jobs, output=output, name=self.name)
+
+    def make_many(
+        self,
+        defects: list[Defect],
+        bulk_supercell_dir: str | Path | None = None,
+        supercell_matrix: npt.NDArray | None = None,
+        defect_indices: list[int | str] | None = None,
+    ) -> Flow:
+        """Make a flow to calculate the formation energy diagrams of several defects.
+
+        Defects in the same host structure share a single bulk supercell
+        calculation. The returned flow contains one bulk supercell job per host and
+        one sub-flow per defect, and should be submitted as a whole.
+
+        Parameters
+        ----------
+        defects: list of Defect
+            The defects to calculate the formation energy diagrams for.
+        bulk_supercell_dir: str | Path | None
+            If provided, the bulk supercell calculation will be skipped. Only
+            supported if all defects are in the same host structure.
+        supercell_matrix: NDArray | None
+            The supercell transformation matrix used for all defects. If None, the
+            supercell matrix will be computed automatically for each host. If
+            `bulk_supercell_dir` is provided, this parameter will be ignored.
+        defect_indices : list of int or str or None
+            Additional indices to give unique names to the defect calculations. If
+            None, the position of each defect in ``defects`` is used.
+
+        Returns
+        -------
+        flow: Flow
+            The workflow to calculate the formation energy diagrams. The output is
+            the list of outputs of the flows for each defect.
+        """
+        if defect_indices is None:
+            defect_indices = list(range(len(defects)))
+        if len(defect_indices) != len(defects):
+            raise ValueError("defect_indices must have the same length as defects.")
+
+        hosts: dict[tuple, list[int]] = {}
+        for idx, defect in enumerate(defects):
+            hosts.setdefault(_get_structure_key(defect.structure), []).append(idx)
+        if bulk_supercell_dir is not None:
+            if self.uc_bulk:
                 raise ValueError(
                     "bulk_supercell_dir should be None when uc_bulk is True."
-                    "We will be using a uc bulk calculation, so no bulk supercell "
-                    "is needed."
                 )
+            if len(hosts) > 1:
+                raise ValueError(
+                    "bulk_supercell_dir can only be used for defects in the same host "
+                    "structure."
+                )
+
+        jobs: list[Job | Flow] = []
+        outputs = [None] * len(defects)
+        for host_indices in hosts.values():
+            host_structure = defects[host_indices[0]].structure
+            host_sc_mat = self._get_supercell_matrix(
+                host_structure, bulk_supercell_dir, supercell_matrix
+            )
+            bulk_job = None
+            if not self.uc_bulk:
+                bulk_job = self._make_bulk_job(
+                    host_structure, bulk_supercell_dir, host_sc_mat
+                )
+                jobs.append(bulk_job)
+
+            for idx in host_indices:
+                defect_jobs, outputs[idx] = self._make_defect_jobs(
+                    defects[idx],
+                    bulk_job,
+                    bulk_supercell_dir,
+                    host_sc_mat,
+                    defect_indices[idx],
+                )
+                jobs.append(Flow(jobs=defect_jobs, output=outputs[idx], name=self.name))
+
+        return Flow(jobs=jobs, output=outputs, name=self.name)
+
+    def _get_supercell_matrix(
+        self,
+        structure: Structure,
+        bulk_supercell_dir: str | Path | None,
+        supercell_matrix: npt.NDArray | None,
+    ) -> npt.NDArray | list | None:
+        """Get the supercell matrix, caching automatic matrices for each host."""
+        if supercell_matrix is not None or bulk_supercell_dir is not None:
+            return supercell_matrix
+        host_key = _get_structure_key(structure)
+        if host_key not in self._supercell_matrices:
+            self._supercell_matrices[host_key] = get_sc_fromstruct(structure).tolist()
+        return self._supercell_matrices[host_key]
+
+    def _make_bulk_job(
+        self,
+        structure: Structure,
+        bulk_supercell_dir: str | Path | None,
+        supercell_matrix: npt.NDArray | list | None,
+    ) -> Job:
+        """Make the job that calculates or reads the bulk supercell."""
+        if bulk_supercell_dir is None:
+            return bulk_supercell_calculation(
+                uc_structure=structure,
+                relax_maker=self.bulk_relax_maker,
+                sc_mat=supercell_matrix,
+                get_planar_locpot=self.get_planar_locpot,
+            )
+        # all additional reader functions need to be in this job
+        # b/c they might receive Response objects instead of data.
+        return get_supercell_from_prv_calc(
+            uc_structure=structure,
+            prv_calc_dir=bulk_supercell_dir,
+            sc_entry_and_locpot_from_prv=self.sc_entry_and_locpot_from_prv,
+            sc_mat_ref=supercell_matrix,
+        )
+
+    def _make_defect_jobs(
+        self,
+        defect: Defect,
+        bulk_job: Job | None,
+        bulk_supercell_dir: str | Path | None,
+        supercell_matrix: npt.NDArray | list | None,
+        defect_index: int | str,
+    ) -> tuple[list[Job | Flow], OutputReference]:
+        """Make the charged defect jobs using the outputs of the bulk job."""
+        jobs: list[Job | Flow] = []
+        if bulk_job is not None:
+            if bulk_supercell_dir is None:
+                lattice = bulk_job.output["sc_struct"].lattice
+                bulk_supercell_dir = bulk_job.output["dir_name"]
+            else:
+                lattice = bulk_job.output["lattice"]
+            sc_mat = bulk_job.output["sc_mat"]
+            sc_uuid = bulk_job.output["uuid"]
+        else:
             sc_mat = supercell_matrix
             lattice = None
             sc_uuid = None
@@ -476,15 +607,11 @@ class FormationEnergyMaker(Maker, ABC):
         if self.collect_defect_entry_data:
             collection_job = get_defect_entry(
                 charge_state_summary=spawn_output.output,
-                bulk_summary=get_sc_job.output,
+                bulk_summary=bulk_job.output,
             )
             jobs.append(collection_job)
 
-        return Flow(
-            jobs=jobs,
-            output=output_,
-            name=self.name,
-        )
+        return jobs, output_
 
     @abstractmethod
     def sc_entry_and_locpot_from_prv(
@@ -532,3 +659,12 @@ class FormationEnergyMaker(Maker, ABC):
         Example:  For VASP, the relax maker should have:
             `ISIF = 2` and `use_structure_charge = True`
         """
+
+
+def _get_structure_key(structure: Structure) -> tuple:
+    """Get a hashable key identifying a structure."""
+    return (
+        tuple(site.species_string for site in structure),
+        np.round(structure.lattice.matrix, 6).tobytes(),
+        np.round(np.mod(structure.frac_coords, 1), 6).tobytes(),
+    )
@@ -74,6 +74,10 @@ class ElectrodeInsertionMaker(Maker, ABC):
         A maker to perform static calculations.
     structure_matcher: StructureMatcher
         The structure matcher to use to determine if additional insertion is needed.
+    charge_density_coarsening: int
+        Factor by which the charge density grid is coarse-grained along each axis
+        before searching for insertion sites. Coarser grids are faster to analyze
+        but can miss small insertion sites.
     """
 
     relax_maker: Maker
@@ -85,6 +89,7 @@ class ElectrodeInsertionMaker(Maker, ABC):
             comparator=ElementComparator(),
         )
     )
+    charge_density_coarsening: int = 1
 
     def __post_init__(self) -> None:
         """Ensure that the static maker will store the desired data."""
@@ -132,6 +137,7 @@ class ElectrodeInsertionMaker(Maker, ABC):
             get_charge_density=self.get_charge_density,
             n_steps=n_steps,
             insertions_per_step=insertions_per_step,
+            charge_density_coarsening=self.charge_density_coarsening,
         )
         relaxed_summary = RelaxJobSummary(
             structure=relax.output.structure,
@@ -122,7 +122,10 @@ class BasePhononMaker(Maker, ABC):
     code: str
         determines the dft or force field code.
     store_force_constants: bool
-        if True, force constants will be stored
+        if True, force constants will be stored. To reduce the size of the stored
+        document, set ``compact_force_constants=True`` and optionally a
+        ``force_constants_cutoff`` distance in Å in
+        ``generate_frequencies_eigenvectors_kwargs``.
     socket: bool
         If True, use the socket for the calculation
     """
@@ -300,12 +303,13 @@ class BasePhononMaker(Maker, ABC):
             use_symmetrized_structure=self.use_symmetrized_structure,
             kpath_scheme=self.kpath_scheme,
             code=self.code,
+            return_dataset=True,
         )
         jobs.append(displacements)
 
         # perform the phonon displacement calculations
         displacement_calcs = run_phonon_displacements(
-            displacements=displacements.output,
+            displacements=displacements.output["displacements"],
             structure=structure,
             supercell_matrix=supercell_matrix,
             phonon_maker=self.phonon_displacement_maker,
@@ -344,6 +348,7 @@ class BasePhononMaker(Maker, ABC):
             code=self.code,
             structure=structure,
             displacement_data=displacement_calcs.output,
+            displacement_dataset=displacements.output["dataset"],
             epsilon_static=epsilon_static,
             born=born,
             total_dft_energy=total_dft_energy,
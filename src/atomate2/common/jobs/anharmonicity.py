@@ -120,29 +120,16 @@ def get_sigma_per_site(
         sites = sites.repeat(3)
         wycks = wycks.repeat(3)
 
-    unique_sites = np.unique(wycks)
+    unique_sites, sigma_sites = _get_grouped_sigma_a(
+        forces_dft - forces_harmonic, forces_dft, wycks
+    )
     site_to_wyckoff: dict = {wyck: [] for wyck in unique_sites}
     for idx, val in enumerate(wycks):
         site_to_wyckoff[val].append(sites[idx])
 
-    sigma_sites = []
-    for s in unique_sites:
-        mask = wycks == s
-        f_dft = forces_dft[:, mask]
-        f_ha = forces_harmonic[:, mask]
-        f_anharm = f_dft - f_ha
-        sigma_sites.append(calc_sigma_a(f_anharm, f_dft))
-
     return [
-        (
-            {
-                list(site_to_wyckoff.keys())[i]: site_to_wyckoff[
-                    list(site_to_wyckoff.keys())[i]
-                ]
-            },
-            sigma_sites[i],
-        )
-        for i in range(len(sigma_sites))
+        ({wyck: site_to_wyckoff[wyck]}, sigma)
+        for wyck, sigma in zip(unique_sites, sigma_sites, strict=True)
     ]
 
 
@@ -185,24 +172,49 @@ def get_sigma_per_element(
     if np.shape(forces_dft)[1] == 3 * structure.num_sites:
         atom_numbers = atom_numbers.repeat(3)
 
-    symbols = np.array([site.specie.name for site in structure.sites])
-    unique_atoms = np.unique(atom_numbers)
+    symbols = {site.specie.number: site.specie.name for site in structure.sites}
+    unique_atoms, sigma_atom = _get_grouped_sigma_a(
+        forces_dft - forces_harmonic, forces_dft, atom_numbers
+    )
+
+    return [
+        (symbols[number], sigma)
+        for number, sigma in zip(unique_atoms, sigma_atom, strict=True)
+    ]
+
+
+def _get_grouped_sigma_a(
+    anharmonic_forces: np.ndarray,
+    dft_forces: np.ndarray,
+    labels: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate sigma^A for groups of sites or modes in a single pass.
+
+    Parameters
+    ----------
+    anharmonic_forces: np.ndarray
+        Array of anharmonic forces with shape (n_samples, n_columns, ...)
+    dft_forces: np.ndarray
+        Array of DFT forces with the same shape as the anharmonic forces
+    labels: np.ndarray
+        Group label for each of the n_columns columns
 
-    sigma_atom = []
-    unique_symbols = []
-    for u in unique_atoms:
-        # Find atoms of type u in the structure
-        mask = atom_numbers == u
-        # Add symbol for atom u to list of examined atoms
-        unique_symbols.append(symbols[mask][0])
-        # Take forces belonging to this atom
-        f_dft = forces_dft[:, mask]
-        f_ha = forces_harmonic[:, mask]
-        f_anharm = f_dft - f_ha
-        # Calculate sigma^A for this atom
-        sigma_atom.append(calc_sigma_a(f_anharm, f_dft))
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The sorted unique labels and the sigma^A value of each group
+    """
+    unique_labels, inverse = np.unique(labels, return_inverse=True)
+    counts = np.bincount(inverse) * (anharmonic_forces.size // len(labels))
 
-    return [(unique_symbols[i], sigma_atom[i]) for i in range(len(sigma_atom))]
+    def group_std(values: np.ndarray) -> np.ndarray:
+        # sum over all axes except the grouped column axis
+        values = np.moveaxis(values, 1, 0).reshape(len(labels), -1)
+        mean = np.bincount(inverse, weights=values.sum(axis=1)) / counts
+        sq_dev = ((values - mean[inverse, None]) ** 2).sum(axis=1)
+        return np.sqrt(np.bincount(inverse, weights=sq_dev) / counts)
+
+    return unique_labels, group_std(anharmonic_forces) / group_std(dft_forces)
 
 
 def box_muller(
@@ -415,38 +427,61 @@ def get_sigma_a_per_mode(
     dynamical_matrix = build_dynmat(force_constants, structure)
     eig_val, eig_vec = get_eigens(dynamical_matrix)
     eig_val = eig_val[3:] * omegaToTHz
-    # Projection matrix P
-    p = eig_vec.T
     masses = np.array([site.species.weight for site in structure.sites])
     m = masses ** (-0.5)
-    # Project the forces
-    dft_forces = m.reshape((len(structure), 1)) * dft_forces
-    dft_proj = np.array([p @ (f.flatten()) for f in np.array(dft_forces)])[:, 3:]
-    harmonic_forces = m.reshape((len(structure), 1)) * harmonic_forces
-    harmonic_proj = np.array([p @ (f.flatten()) for f in np.array(harmonic_forces)])[
-        :, 3:
-    ]
-    # Calculate sigma^A for each mode
-    mode_sigma_vals = []
-    for mode in np.unique(eig_val):
-        dft_vals = np.array(
-            [dft_proj[:, idx] for idx in range(len(eig_val)) if eig_val[idx] == mode]
-        ).flatten()
-        harmonic_vals = np.array(
-            [
-                harmonic_proj[:, idx]
-                for idx in range(len(eig_val))
-                if eig_val[idx] == mode
-            ]
-        ).flatten()
-        anharmonic_vals = [
-            dft_force - harmonic_force
-            for dft_force, harmonic_force in zip(dft_vals, harmonic_vals, strict=True)
-        ]
-        sigma_a = np.std(anharmonic_vals) / np.std(dft_vals)
-        mode_sigma_vals.append((mode, sigma_a))
 
-    return mode_sigma_vals
+    # Project the forces of all samples onto the eigenmodes at once
+    n_dof = 3 * len(structure)
+    dft_forces = (m[:, None] * np.asarray(dft_forces)).reshape(-1, n_dof)
+    dft_proj = (dft_forces @ eig_vec)[:, 3:]
+    harmonic_forces = (m[:, None] * np.asarray(harmonic_forces)).reshape(-1, n_dof)
+    harmonic_proj = (harmonic_forces @ eig_vec)[:, 3:]
+
+    # Calculate sigma^A for each mode, grouping degenerate modes
+    modes, mode_sigmas = _get_grouped_sigma_a(
+        dft_proj - harmonic_proj, dft_proj, eig_val
+    )
+    return list(zip(modes, mode_sigmas, strict=True))
+
+
+def get_harmonic_forces(
+    force_constants: ForceConstants | np.ndarray,
+    displacements: np.ndarray,
+) -> np.ndarray:
+    """Calculate the harmonic forces for a batch of displacements.
+
+    If the force constants only contain pairs of atoms within a cutoff, the forces
+    are evaluated from the sparse pairs without expanding the force constants.
+
+    Parameters
+    ----------
+    force_constants: ForceConstants or np.ndarray
+        Force constants with shape (n_atoms, n_atoms, 3, 3)
+    displacements: np.ndarray
+        Atomic displacements with shape (n_samples, n_atoms, 3)
+
+    Returns
+    -------
+    np.ndarray
+        Harmonic forces with shape (n_samples, n_atoms, 3)
+    """
+    if not isinstance(force_constants, np.ndarray):
+        pairs = getattr(force_constants, "pairs", None)
+        if pairs is not None:
+            idx_i, idx_j, pair_fcs = pairs
+            displacements = np.asarray(displacements)
+            pair_forces = np.einsum("pab,spb->spa", pair_fcs, displacements[:, idx_j])
+            forces = np.zeros(displacements.shape)
+            np.add.at(forces, (slice(None), idx_i), -pair_forces)
+            return forces
+        force_constants = force_constants.force_constants
+    force_constants = np.asarray(force_constants)
+    n_atoms = force_constants.shape[0]
+    displacements = np.asarray(displacements).reshape(-1, 3 * n_atoms)
+
+    # F_ia = - sum_jb Phi_ij^ab u_jb, evaluated for all samples as a single GEMM
+    force_constants_2d = force_constants.swapaxes(1, 2).reshape(3 * n_atoms, -1)
+    return -(displacements @ force_constants_2d.T).reshape(-1, n_atoms, 3)
 
 
 @job
@@ -469,30 +504,20 @@ def get_forces(
     Returns
     -------
     list[np.ndarray]
-        List of forces in the form [DFT forces, harmonic forces]
+        List of forces in the form [DFT forces, harmonic forces], each with shape
+        (n_samples, n_atoms, 3)
     """
-    force_constants_2d = np.swapaxes(
-        force_constants.force_constants,
-        1,
-        2,
-    ).reshape(2 * (len(phonon_supercell) * 3,))
     if isinstance(displaced_structures["coords"][0], Calculation):
-        displacements = [
-            disp_data.output.structure.cart_coords - phonon_supercell.cart_coords
+        coords = [
+            disp_data.output.structure.cart_coords
             for disp_data in displaced_structures["coords"]
         ]
     else:
-        displacements = [
-            np.array(disp_data) - phonon_supercell.cart_coords
-            for disp_data in displaced_structures["coords"]
-        ]
+        coords = displaced_structures["coords"]
+    displacements = np.asarray(coords) - phonon_supercell.cart_coords
 
-    harmonic_forces = [
-        (-force_constants_2d @ displacement.flatten()).reshape((-1, 3))
-        for displacement in displacements
-    ]
-
-    dft_forces = [np.array(disp_data) for disp_data in displaced_structures["forces"]]
+    harmonic_forces = get_harmonic_forces(force_constants, displacements)
+    dft_forces = np.asarray(displaced_structures["forces"])
 
     return [dft_forces, harmonic_forces]
 
@@ -539,16 +564,9 @@ def get_sigmas(
         Dictionary in the form {sigma^A type: float/list with sigma^A values}
         that contains all the sigma^A values
     """
-    dft_forces = np.array(dft_forces)
-    harmonic_forces = np.array(harmonic_forces)
-    anharmonic_forces = np.array(
-        [
-            dft_force - harmonic_force
-            for dft_force, harmonic_force in zip(
-                dft_forces, harmonic_forces, strict=True
-            )
-        ]
-    )
+    dft_forces = np.asarray(dft_forces)
+    harmonic_forces = np.asarray(harmonic_forces)
+    anharmonic_forces = dft_forces - harmonic_forces
 
     sigma_dict: dict[str, Any] = {}
 
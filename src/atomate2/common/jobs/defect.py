@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,7 @@ from pymatgen.analysis.defects.supercells import (
 from pymatgen.analysis.defects.thermo import DefectEntry
 from pymatgen.core import Lattice, Structure
 from pymatgen.entries.computed_entries import ComputedStructureEntry
+from scipy.spatial import cKDTree
 
 from atomate2.common.schemas.defects import CCDDocument
 from atomate2.utils.path import strip_hostname
@@ -348,17 +350,24 @@ def spawn_defect_q_jobs(
     -------
     Response
         A response object containing the summary of the calculations for different
-        charge states.
+        charge states. The summaries include the fractional coordinates of the defect
+        in the supercell and the index of the bulk supercell site of each defect
+        supercell site, see ``get_supercell_site_mapping``.
     """
     defect_q_jobs = []
     all_chg_outputs = {}
-    sc_def_struct = defect.get_supercell_structure(
-        sc_mat=sc_mat, relax_radius=relax_radius, perturb=perturb
+    if sc_mat is None:
+        sc_mat = get_sc_fromstruct(defect.structure)
+    sc_mat = np.array(sc_mat).tolist()
+    sc_def_struct, sc_def_site = defect.get_supercell_structure(
+        sc_mat=sc_mat, relax_radius=relax_radius, perturb=perturb, return_site=True
+    )
+    # the mapping is shared by all charge states
+    bulk_site_indices = get_supercell_site_mapping(
+        defect.structure * sc_mat, sc_def_struct
     )
     if relaxed_sc_lattice is not None:
         sc_def_struct.lattice = relaxed_sc_lattice
-    if sc_mat is not None:
-        sc_mat = np.array(sc_mat).tolist()
     for qq in defect.get_charge_states():
         suffix = (
             f" {defect.name} q={qq}"
@@ -395,6 +404,8 @@ def spawn_defect_q_jobs(
             "dir_name": charged_output.dir_name,
             "uuid": charged_relax.uuid,
             "locpot_plnr": charged_output.calcs_reversed[0].output.locpot,
+            "sc_defect_frac_coords": sc_def_site.frac_coords.tolist(),
+            "bulk_site_indices": bulk_site_indices,
         }
         # check that the charge state was set correctly
         if validate_charge:
@@ -404,6 +415,45 @@ def spawn_defect_q_jobs(
     return Response(replace=replace_flow)
 
 
+def get_supercell_site_mapping(
+    bulk_structure: Structure, defect_structure: Structure, tol: float = 0.5
+) -> list[int | None]:
+    """Map the sites of a defect supercell to the sites of the bulk supercell.
+
+    Each defect site is mapped to the closest bulk site within ``tol``, using a
+    KD-tree of the bulk sites and their periodic images. Substituted sites are mapped
+    to the bulk site they replace.
+
+    Parameters
+    ----------
+    bulk_structure : Structure
+        The bulk supercell.
+    defect_structure : Structure
+        The defect supercell, with the same lattice and origin as the bulk supercell.
+    tol : float
+        The maximum distance in Å between a defect site and its bulk site.
+
+    Returns
+    -------
+    list of int or None
+        The index of the bulk site of each defect site, or None for interstitials.
+    """
+    lattice = bulk_structure.lattice
+    images = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+    bulk_frac_coords = np.mod(bulk_structure.frac_coords, 1)
+    image_coords = lattice.get_cartesian_coords(
+        (bulk_frac_coords[None, :, :] + images[:, None, :]).reshape(-1, 3)
+    )
+    distances, indices = cKDTree(image_coords).query(
+        lattice.get_cartesian_coords(np.mod(defect_structure.frac_coords, 1)),
+        distance_upper_bound=tol,
+    )
+    return [
+        int(index % len(bulk_structure)) if np.isfinite(distance) else None
+        for distance, index in zip(distances, indices, strict=True)
+    ]
+
+
 @job
 def check_charge_state(charge_state: int, task_structure: Structure) -> Response:
     """Check that the charge state of a defect calculation is correct.
@@ -451,6 +501,7 @@ def get_defect_entry(charge_state_summary: dict, bulk_summary: dict) -> list[dic
             charge_state=qq,
             sc_entry=defect_struct_entry,
             bulk_entry=bulk_struct_entry,
+            sc_defect_frac_coords=qq_summary.get("sc_defect_frac_coords"),
         )
         defect_ent_res.append(
             {
@@ -5,11 +5,14 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, NamedTuple
 
+import numpy as np
 from emmet.core.electrode import InsertionElectrodeDoc
 from emmet.core.mpid import MPID
 from emmet.core.structure_group import StructureGroupDoc
 from jobflow import Flow, Maker, Response, job
 from pymatgen.analysis.defects.generators import ChargeInterstitialGenerator
+from pymatgen.analysis.structure_matcher import AbstractComparator
+from pymatgen.core import Composition
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from ulid import ULID
 
@@ -50,6 +53,7 @@ def get_stable_inserted_results(
     insertions_per_step: int = 4,
     n_steps: int | None = None,
     n_inserted: int = 0,
+    charge_density_coarsening: int = 1,
 ) -> Response:
     """Attempt ion insertion.
 
@@ -83,6 +87,9 @@ def get_stable_inserted_results(
     n_inserted:
         The number of ions inserted so far, used to help assign a unique name to the
         different jobs.
+    charge_density_coarsening:
+        Factor by which the charge density grid is coarse-grained along each axis
+        before searching for insertion sites.
     """
     if structure is None:
         return []
@@ -92,7 +99,11 @@ def get_stable_inserted_results(
     add_name = f"{n_inserted}"
 
     static_job = static_maker.make(structure=structure)
-    chg_job = get_charge_density_job(static_job.output.dir_name, get_charge_density)
+    chg_job = get_charge_density_job(
+        static_job.output.dir_name,
+        get_charge_density,
+        coarsening=charge_density_coarsening,
+    )
     insertion_job = get_inserted_structures(
         chg_job.output,
         inserted_species=inserted_element,
@@ -118,6 +129,7 @@ def get_stable_inserted_results(
         insertions_per_step=insertions_per_step,
         n_steps=nn_step,
         n_inserted=n_inserted + 1,
+        charge_density_coarsening=charge_density_coarsening,
     )
 
     for job_ in [static_job, chg_job, insertion_job, min_en_job, relax_jobs, next_step]:
@@ -274,6 +286,10 @@ def get_min_energy_summary(
 ) -> Response:
     """Get the structure with the lowest energy.
 
+    The structures are compared to the reference in order of increasing energy,
+    until one matches. Structures whose host composition or cell cannot match are
+    skipped without running the full structure matcher.
+
     Parameters
     ----------
     structures: The structures to compare.
@@ -287,32 +303,139 @@ def get_min_energy_summary(
     # Since the outputs parser will see a NamedTuple and immediately convert it to
     # a list We have to convert the list of lists to a list of NamedTuples
     relaxed_summaries = list(map(RelaxJobSummary._make, relaxed_summaries))
-    topotactic_summaries = [
-        summary
-        for summary in relaxed_summaries
-        if structure_matcher.fit(ref_structure, summary.structure)
-    ]
 
-    if len(topotactic_summaries) == 0:
-        return None
+    # The lowest energy topotactic structure is the first match in order of energy.
+    # Cheap invariants of the host rule out most candidates before the full match.
+    matcher_settings = structure_matcher.as_dict()
+    ref_fingerprint = _get_host_fingerprint(ref_structure, matcher_settings)
+    n_full_matches = 0
+    topotactic_summary = None
+    for summary in sorted(relaxed_summaries, key=lambda x: x.entry.energy_per_atom):
+        fingerprint = _get_host_fingerprint(summary.structure, matcher_settings)
+        if not _fingerprints_may_match(ref_fingerprint, fingerprint, matcher_settings):
+            continue
+        n_full_matches += 1
+        if structure_matcher.fit(ref_structure, summary.structure):
+            topotactic_summary = summary
+            break
+
+    logger.info(
+        f"Ran {n_full_matches} full structure matches for {len(relaxed_summaries)} "
+        f"relaxed structures, {len(relaxed_summaries) - n_full_matches} avoided"
+    )
+    return topotactic_summary
 
-    return min(topotactic_summaries, key=lambda x: x.entry.energy_per_atom)
 
+def _get_host_fingerprint(
+    structure: Structure, matcher_settings: dict
+) -> tuple[Composition, int, np.ndarray, np.ndarray]:
+    """Get cheap invariants of the host structure without the ignored species.
 
-@job
+    The fingerprint is the composition hash of the structure matcher, the number
+    of host sites and the lengths and angles of the Niggli-reduced lattice, with the
+    lengths normalized to the volume if the structure matcher scales volumes.
+    """
+    ignored_species = set(matcher_settings["ignored_species"])
+    host_composition = Composition(
+        {
+            el: amt
+            for el, amt in structure.composition.items()
+            if str(el) not in ignored_species
+        }
+    )
+    n_host_sites = sum(
+        1
+        for site in structure
+        if not {str(sp) for sp in site.species} & ignored_species
+    )
+    lattice = structure.lattice.get_niggli_reduced_lattice()
+    lengths = np.array(lattice.abc)
+    if matcher_settings["scale"]:
+        lengths /= lattice.volume ** (1 / 3)
+    comparator = AbstractComparator.from_dict(matcher_settings["comparator"])
+    return (
+        comparator.get_hash(host_composition),
+        n_host_sites,
+        lengths,
+        np.array(lattice.angles),
+    )
+
+
+def _fingerprints_may_match(
+    ref_fingerprint: tuple, fingerprint: tuple, matcher_settings: dict
+) -> bool:
+    """Check if two host fingerprints are compatible with a structure match.
+
+    Structures with different host compositions never match. Structures with the
+    same number of host sites are assumed to share the cell of the insertion
+    workflow, and are ruled out if their Niggli-reduced cells differ by twice the
+    tolerances of the structure matcher. Supercell and subset matching disable the
+    checks.
+    """
+    if matcher_settings["attempt_supercell"] or matcher_settings["allow_subset"]:
+        return True
+    ref_hash, ref_n_sites, ref_lengths, ref_angles = ref_fingerprint
+    comp_hash, n_sites, lengths, angles = fingerprint
+    if comp_hash != ref_hash:
+        return False
+    if n_sites != ref_n_sites:
+        return True
+    ltol, angle_tol = matcher_settings["ltol"], matcher_settings["angle_tol"]
+    return bool(
+        np.all(np.abs(lengths / ref_lengths - 1) <= 2 * ltol)
+        and np.all(np.abs(angles - ref_angles) <= 2 * angle_tol)
+    )
+
+
+@job(data=True)
 def get_charge_density_job(
     prev_dir: Path | str,
     get_charge_density: Callable,
+    coarsening: int = 1,
 ) -> VolumetricData:
     """Get the charge density from a task document.
 
+    The charge density is saved in the additional "data" store, such that the job
+    store only holds a reference to it.
+
     Parameters
     ----------
     prev_dir: The previous directory where the static calculation was performed.
     get_charge_density: A function to get the charge density from a task document.
+    coarsening: Factor by which the grids are coarse-grained along each axis.
 
     Returns
     -------
         The charge density.
     """
-    return get_charge_density(prev_dir)
+    chg = get_charge_density(prev_dir)
+    if coarsening <= 1:
+        return chg
+    data = {key: coarsen_grid(grid, coarsening) for key, grid in chg.data.items()}
+    return type(chg)(chg.structure, data, data_aug=chg.data_aug)
+
+
+def coarsen_grid(grid: np.ndarray, factor: int) -> np.ndarray:
+    """Coarse-grain a volumetric grid by averaging blocks of grid points.
+
+    Blocks at the end of an axis are smaller if the number of grid points is not a
+    multiple of the factor.
+
+    Parameters
+    ----------
+    grid: The volumetric data.
+    factor: Number of grid points averaged along each axis.
+
+    Returns
+    -------
+        The coarse-grained grid.
+    """
+    if factor <= 1:
+        return grid
+    for axis, n_points in enumerate(grid.shape):
+        starts = np.arange(0, n_points, factor)
+        counts = np.diff(np.append(starts, n_points))
+        shape = [1] * grid.ndim
+        shape[axis] = len(starts)
+        grid = np.add.reduceat(grid, starts, axis=axis) / counts.reshape(shape)
+    return grid
@@ -12,10 +12,14 @@ from pymatgen.analysis.eos import EOS, EOSError
 from pymatgen.transformations.standard_transformations import (
     DeformStructureTransformation,
 )
-from scipy.optimize import leastsq
+
+from atomate2.common.analysis.eos import (
+    ENERGY_EOS_MODELS,
+    fit_energy_eos,
+    fit_pressure_eos,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
     from typing import Any
 
     from jobflow import Job
@@ -171,10 +175,22 @@ class PostProcessEosEnergy(EOSPostProcessor):
     )
 
     def eval(self) -> None:
-        """Fit the input data to each EOS in ``self.eos_models``."""
-        for jobtype in self._use_job_types:
+        """Fit the input data to each EOS in ``self.eos_models``.
+
+        The models in ``ENERGY_EOS_MODELS`` are fitted for all job types at once,
+        any other model supported by pymatgen is fitted with :obj:`EOS`.
+        """
+        eos_results = fit_energy_eos(
+            [self.results[jobtype]["volume"] for jobtype in self._use_job_types],
+            [self.results[jobtype]["energy"] for jobtype in self._use_job_types],
+            eos_models=[name for name in self.eos_models if name in ENERGY_EOS_MODELS],
+        )
+        for jobtype, results in zip(self._use_job_types, eos_results, strict=True):
             self.results[jobtype]["EOS"] = {}
             for eos_name in self.eos_models:
+                if eos_name in results:
+                    self.results[jobtype]["EOS"][eos_name] = results[eos_name]
+                    continue
                 try:
                     eos = EOS(eos_name=eos_name).fit(
                         self.results[jobtype]["volume"], self.results[jobtype]["energy"]
@@ -323,29 +339,16 @@ class PostProcessEosPressure(EOSPostProcessor):
 
         return init_pars
 
-    def _objective(self, pars: Sequence, jobtype: str) -> float:
-        return np.array(
-            self.results[jobtype]["pressure"]
-        ) - self._birch_murnaghan_pressure(
-            np.array(self.results[jobtype]["volume"]), *pars
-        )
-
     def eval(self) -> None:
         """Fit the input data to the Birch-Murnaghan pressure EOS."""
         initial_pars = self._initial_fit()
-        for jobtype in self._use_job_types:
-            eos_params, ierr = leastsq(
-                self._objective, initial_pars[jobtype], args=(jobtype,)
-            )
-
-            self.results[jobtype]["EOS"] = {}
-            if ierr not in (1, 2, 3, 4):
-                self.results[jobtype]["EOS"]["exception"] = (
-                    "Optimal EOS parameters not found."
-                )
-            else:
-                for i, key in enumerate(["b0", "b1", "v0"]):
-                    self.results[jobtype]["EOS"][key] = eos_params[i]
+        eos_results = fit_pressure_eos(
+            [self.results[jobtype]["volume"] for jobtype in self._use_job_types],
+            [self.results[jobtype]["pressure"] for jobtype in self._use_job_types],
+            [initial_pars[jobtype] for jobtype in self._use_job_types],
+        )
+        for jobtype, results in zip(self._use_job_types, eos_results, strict=True):
+            self.results[jobtype]["EOS"] = results
 
 
 @job
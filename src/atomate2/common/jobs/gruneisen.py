@@ -95,11 +95,10 @@ def run_phonon_jobs(
             # change default phonopy.yaml file name to ensure workflow can be
             # run without having to create folders, thus
             # prevent overwriting and easier to identify yaml file belong
-            # to corresponding phonon run
+            # to corresponding phonon run. The band structure and dos yaml files are
+            # not written, as only phonopy.yaml is needed to compute the parameters
             phonon_job.jobs[-1].function_kwargs.update(
                 filename_phonopy_yaml=f"{st}_phonopy.yaml",
-                filename_band_yaml=f"{st}_phonon_band_structure.yaml",
-                filename_dos_yaml=f"{st}_phonon_dos.yaml",
                 filename_bs=f"{st}_phonon_band_structure.pdf",
                 filename_dos=f"{st}_phonon_dos.pdf",
             )
@@ -18,7 +18,12 @@ from pymatgen.transformations.advanced_transformations import (
     CubicSupercellTransformation,
 )
 
-from atomate2.common.schemas.phonons import ForceConstants, PhononBSDOSDoc, get_factor
+from atomate2.common.schemas.phonons import (
+    ForceConstants,
+    PhononBSDOSDoc,
+    get_displacement_dataset,
+    get_factor,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -132,10 +137,15 @@ def generate_phonon_displacements(
     use_symmetrized_structure: str | None,
     kpath_scheme: str,
     code: str,
-) -> list[Structure]:
+    return_dataset: bool = False,
+) -> list[Structure] | dict[str, list[Structure] | dict]:
     """
     Generate displaced structures with phonopy.
 
+    Optionally, the phonopy displacement dataset is returned alongside the displaced
+    structures, such that the forces can be collected without generating the
+    displacements again.
+
     Parameters
     ----------
     structure: Structure object
@@ -154,6 +164,15 @@ def generate_phonon_displacements(
         scheme to generate kpath
     code:
         code to perform the computations
+    return_dataset: bool
+        if True, also return the displacement dataset
+
+    Returns
+    -------
+    list of Structure or dict
+        The displaced structures. If ``return_dataset`` is True, a dictionary of the
+        displaced structures ("displacements") and the displacement dataset
+        ("dataset"), see :obj:`.get_displacement_dataset`.
     """
     warnings.warn(
         "Initial magnetic moments will not be considered for the determination "
@@ -194,8 +213,14 @@ def generate_phonon_displacements(
     phonon.generate_displacements(distance=displacement)
 
     supercells = phonon.supercells_with_displacements
+    displacements = [get_pmg_structure(cell) for cell in supercells]
 
-    return [get_pmg_structure(cell) for cell in supercells]
+    if not return_dataset:
+        return displacements
+    return {
+        "displacements": displacements,
+        "dataset": get_displacement_dataset(phonon),
+    }
 
 
 @job(
@@ -215,6 +240,7 @@ def generate_frequencies_eigenvectors(
     total_dft_energy: float,
     epsilon_static: Matrix3D = None,
     born: Matrix3D = None,
+    displacement_dataset: dict | None = None,
     **kwargs,
 ) -> PhononBSDOSDoc:
     """
@@ -246,6 +272,9 @@ def generate_frequencies_eigenvectors(
         The high-frequency dielectric constant
     born: Matrix3D
         Born charges
+    displacement_dataset: dict or None
+        The displacement dataset from generate_phonon_displacements. If None, the
+        displacements are generated again.
     kwargs: dict
         Additional parameters that are passed to PhononBSDOSDoc.from_forces_born
     """
@@ -264,6 +293,7 @@ def generate_frequencies_eigenvectors(
         total_dft_energy=total_dft_energy,
         epsilon_static=epsilon_static,
         born=born,
+        displacement_dataset=displacement_dataset,
         **kwargs,
     )
 
@@ -282,7 +312,7 @@ def run_phonon_displacements(
     Run phonon displacements.
 
     Note, this job will replace itself with N displacement calculations,
-    or a single socket calculation for all displacements.
+    or a single socket (or batched force field) calculation for all displacements.
 
     Parameters
     ----------
@@ -299,7 +329,8 @@ def run_phonon_displacements(
     prev_dir_argname: str
         argument name for the prev_dir variable
     socket: bool
-        If True use the socket-io interface to increase performance
+        If True use the socket-io interface to increase performance. For force
+        fields, all displacements are evaluated in a single batched job.
     """
     phonon_jobs = []
     outputs: dict[str, list] = {
@@ -319,9 +350,12 @@ def run_phonon_displacements(
             "supercell_matrix": supercell_matrix,
             "displaced_structures": displacements,
         }
-        phonon_job.update_maker_kwargs(
-            {"_set": {"write_additional_data->phonon_info:json": info}}, dict_mod=True
-        )
+        # not all makers (e.g., force field batch makers) write additional data
+        with contextlib.suppress(Exception):
+            phonon_job.update_maker_kwargs(
+                {"_set": {"write_additional_data->phonon_info:json": info}},
+                dict_mod=True,
+            )
         phonon_jobs.append(phonon_job)
         outputs["displacement_number"] = list(range(len(displacements)))
         outputs["uuids"] = [phonon_job.output.uuid] * len(displacements)
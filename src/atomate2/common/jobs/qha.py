@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 from jobflow import Flow, Response, job
 
 from atomate2.common.schemas.phonons import PhononBSDOSDoc
@@ -51,7 +52,13 @@ def get_phonon_jobs(phonon_maker: BasePhononMaker, eos_output: dict) -> Flow:
 
 @job(
     output_schema=PhononQHADoc,
-    data=["free_energies", "heat_capacities", "entropies", "helmholtz_volume"],
+    data=[
+        "free_energies",
+        "heat_capacities",
+        "entropies",
+        "helmholtz_volume",
+        "compact_arrays",
+    ],
 )
 def analyze_free_energy(
     phonon_outputs: list[PhononBSDOSDoc],
@@ -77,48 +84,42 @@ def analyze_free_energy(
     ignore_imaginary_modes: bool
         If True, all free energies will be used
         for EOS fit
+    eos_type: str
+        Equation of state used for the fit.
     kwargs: dict
-        Additional keywords to pass to this job
+        Additional keywords to pass to PhononQHADoc.from_phonon_runs, e.g.,
+        ``n_workers`` to fit the equations of state in parallel or
+        ``compact_arrays`` to store the arrays in a compact binary form.
     """
     # only add free energies if there are no imaginary modes
     # tolerance has to be tested
-    electronic_energies: list[list[float]] = []
-    free_energies: list[list[float]] = []
-    heat_capacities: list[list[float]] = []
-    entropies: list[list[float]] = []
-    temperatures: list[float] = []
-    formula_units: list[int] = []
-    volume: list[float] = [
-        output.volume_per_formula_unit * output.formula_units
-        for output in phonon_outputs
-    ]
-
-    for itemp, temp in enumerate(phonon_outputs[0].temperatures):
-        temperatures.append(float(temp))
-        sorted_volume = []
-        electronic_energies.append([])
-        free_energies.append([])
-        heat_capacities.append([])
-        entropies.append([])
-
-        for _, output in sorted(zip(volume, phonon_outputs, strict=True)):
-            # check if imaginary modes
-            if (not output.has_imaginary_modes) or ignore_imaginary_modes:
-                electronic_energies[itemp].append(output.total_dft_energy)
-                # convert from J/mol in kJ/mol
-                free_energies[itemp].append(output.free_energies[itemp] / 1000.0)
-                heat_capacities[itemp].append(output.heat_capacities[itemp])
-                entropies[itemp].append(output.entropies[itemp])
-                sorted_volume.append(output.volume_per_formula_unit)
-                formula_units.append(output.formula_units)
+    outputs = sorted(
+        (
+            output
+            for output in phonon_outputs
+            if (not output.has_imaginary_modes) or ignore_imaginary_modes
+        ),
+        key=lambda output: output.volume_per_formula_unit * output.formula_units,
+    )
 
     # potentially implement a space group check in the future
 
-    if len(set(formula_units)) != 1:
+    formula_units = {output.formula_units for output in outputs}
+    if len(formula_units) != 1:
         raise ValueError("There should be only one formula unit.")
 
+    # stack the thermal properties into arrays of shape (temperatures, volumes)
+    temperatures = np.asarray(phonon_outputs[0].temperatures, dtype=float)
+    # convert from J/mol in kJ/mol
+    free_energies = np.array([output.free_energies for output in outputs]).T / 1000.0
+    heat_capacities = np.array([output.heat_capacities for output in outputs]).T
+    entropies = np.array([output.entropies for output in outputs]).T
+    electronic_energies = np.broadcast_to(
+        [output.total_dft_energy for output in outputs], free_energies.shape
+    )
+
     return PhononQHADoc.from_phonon_runs(
-        volumes=sorted_volume,
+        volumes=[output.volume_per_formula_unit for output in outputs],
         free_energies=free_energies,
         electronic_energies=electronic_energies,
         entropies=entropies,
@@ -127,7 +128,7 @@ def analyze_free_energy(
         structure=structure,
         t_max=t_max,
         pressure=pressure,
-        formula_units=next(iter(set(formula_units))),
+        formula_units=formula_units.pop(),
         eos_type=eos_type,
         **kwargs,
     )
@@ -12,6 +12,10 @@ from atomate2 import SETTINGS
 if TYPE_CHECKING:
     from pymatgen.core import Structure
 
+    from atomate2.common.schemas.gruneisen import GruneisenParameterDocument
+    from atomate2.common.schemas.phonons import PhononBSDOSDoc
+    from atomate2.common.schemas.qha import PhononQHADoc
+
 
 @job
 def structure_to_primitive(
@@ -57,6 +61,25 @@ def structure_to_conventional(
     return sga.get_conventional_standard_structure()
 
 
+@job
+def render_plots(
+    document: PhononBSDOSDoc | GruneisenParameterDocument | PhononQHADoc,
+) -> None:
+    """
+    Job that renders the deferred plots of a document.
+
+    The plots are only recorded in the document if it was created with the "deferred"
+    plot policy. Rendering jobs can run in parallel, independently of the
+    calculations.
+
+    Parameters
+    ----------
+    document : .PhononBSDOSDoc or .GruneisenParameterDocument or .PhononQHADoc
+        The document with the deferred plots.
+    """
+    document.render_plots()
+
+
 @job
 def retrieve_structure_from_materials_project(
     material_id_or_task_id: str,
@@ -2,37 +2,28 @@
 
 import logging
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import phonopy
 from emmet.core.structure import StructureMetadata
-from matplotlib import colors
-from matplotlib.colors import LinearSegmentedColormap
 from phonopy.api_gruneisen import PhonopyGruneisen
 from phonopy.phonon.band_structure import get_band_qpoints_and_path_connections
 from pydantic import BaseModel, Field
 from pymatgen.core.structure import Structure
-from pymatgen.io.phonopy import (
-    get_gruneisen_ph_bs_symm_line,
-    get_gruneisenparameter,
-    get_pmg_structure,
-)
+from pymatgen.io.phonopy import get_pmg_structure
 from pymatgen.io.vasp import Kpoints
 from pymatgen.phonon.gruneisen import (
     GruneisenParameter,
     GruneisenPhononBandStructureSymmLine,
 )
-from pymatgen.phonon.plotter import (
-    GruneisenPhononBSPlotter,
-    GruneisenPlotter,
-    freq_units,
-)
-from pymatgen.util.plotting import pretty_plot
 from typing_extensions import Self
 
 from atomate2.common.schemas.phonons import PhononBSDOSDoc
+from atomate2.common.utils import get_plot_policy
+
+if TYPE_CHECKING:
+    from pymatgen.phonon.plotter import GruneisenPhononBSPlotter
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +93,11 @@ class GruneisenParameterDocument(StructureMetadata):
     derived_properties: Optional[GruneisenDerivedProperties] = Field(
         None, description="Properties derived from the Grueneisen parameter."
     )
+    deferred_plots: Optional[dict[str, dict]] = Field(
+        None,
+        description="Settings of the plots that were deferred, to be rendered with "
+        "render_plots",
+    )
 
     @classmethod
     def from_phonon_yamls(
@@ -145,7 +141,10 @@ class GruneisenParameterDocument(StructureMetadata):
             Code to compute forces
         compute_gruneisen_param_kwargs:
             kwargs for phonopy Grueneisen
-            api and pymatgen plotters
+            api and pymatgen plotters. The Grueneisen parameters
+            are converted from phonopy in memory; set
+            ``write_gruneisen_yamls`` to also write the yaml files.
+            ``plot_policy`` overrides the ``PLOT_POLICY`` setting.
 
         Returns
         -------
@@ -193,22 +192,15 @@ class GruneisenParameterDocument(StructureMetadata):
                     "is_mesh_symmetry", True
                 ),
             )
-        gruneisen_mesh_yaml = compute_gruneisen_param_kwargs.get(
-            "filename_mesh_yaml", "gruneisen_mesh.yaml"
-        )
-        gru._mesh.write_yaml(filename=gruneisen_mesh_yaml)  # noqa: SLF001
-        gruneisen_parameter = get_gruneisenparameter(
-            gruneisen_path=gruneisen_mesh_yaml, structure=structure
-        )
-        gp_plot = GruneisenPlotter(gruneisen=gruneisen_parameter)
-        gruneisen_mesh_plot = compute_gruneisen_param_kwargs.get(
-            "gruneisen_mesh", "gruneisen_mesh.pdf"
-        )
-        gp_plot.save_plot(
-            filename=gruneisen_mesh_plot,
-            units=compute_gruneisen_param_kwargs.get("units", "thz"),
-            img_format=compute_gruneisen_param_kwargs.get("img_format", "pdf"),
-        )
+        # the yaml files are only needed for use outside of atomate2
+        write_yamls = compute_gruneisen_param_kwargs.get("write_gruneisen_yamls", False)
+        if write_yamls:
+            gru.write_yaml_mesh(
+                filename=compute_gruneisen_param_kwargs.get(
+                    "filename_mesh_yaml", "gruneisen_mesh.yaml"
+                )
+            )
+        gruneisen_parameter = get_gruneisen_parameter_from_phonopy(gru, structure)
         # get phonon band structure
         kpath_dict, kpath_concrete = PhononBSDOSDoc.get_kpath(
             structure=structure, kpath_scheme=kpath_scheme, symprec=symprec
@@ -217,22 +209,34 @@ class GruneisenParameterDocument(StructureMetadata):
             kpath_concrete,
             npoints=compute_gruneisen_param_kwargs.get("npoints_band", 101),
         )
-        gruneisen_band_yaml = compute_gruneisen_param_kwargs.get(
-            "filename_band_yaml", "gruneisen_band.yaml"
-        )
         gru.set_band_structure(bands=qpoints)
-        gru._band_structure.write_yaml(filename=gruneisen_band_yaml)  # noqa: SLF001
-        gruneisen_band_structure = get_gruneisen_ph_bs_symm_line(
-            gruneisen_path=gruneisen_band_yaml,
-            structure=structure,
-            labels_dict=kpath_dict,
-        )
-        gp_bs_plot = GruneisenPhononBSPlotter(bs=gruneisen_band_structure)
-        GruneisenParameterDocument.get_gruneisen_weighted_bandstructure(
-            gruneisen_band_symline_plotter=gp_bs_plot,
-            save_fig=True,
-            **compute_gruneisen_param_kwargs,
+        if write_yamls:
+            gru.write_yaml_band_structure(
+                filename=compute_gruneisen_param_kwargs.get(
+                    "filename_band_yaml", "gruneisen_band.yaml"
+                )
+            )
+        gruneisen_band_structure = get_gruneisen_ph_bs_symm_line_from_phonopy(
+            gru, structure, labels_dict=kpath_dict
         )
+
+        plot_policy = get_plot_policy(compute_gruneisen_param_kwargs.get("plot_policy"))
+        plots = {
+            "gruneisen_parameter": {
+                "filename": compute_gruneisen_param_kwargs.get(
+                    "gruneisen_mesh", "gruneisen_mesh.pdf"
+                ),
+                "units": compute_gruneisen_param_kwargs.get("units", "thz"),
+                "img_format": compute_gruneisen_param_kwargs.get("img_format", "pdf"),
+            },
+            "gruneisen_band_structure": {
+                key: compute_gruneisen_param_kwargs[key]
+                for key in ("units", "mycmap", "gruneisen_bs")
+                if key in compute_gruneisen_param_kwargs
+            },
+        }
+        if plot_policy == "inline":
+            _save_gruneisen_plots(plots, gruneisen_parameter, gruneisen_band_structure)
         gruneisen_parameter_inputs = {
             "ground": phonopy_yaml_paths_dict["ground"],
             "plus": phonopy_yaml_paths_dict["plus"],
@@ -260,11 +264,20 @@ class GruneisenParameterDocument(StructureMetadata):
             gruneisen_parameter=gruneisen_parameter,
             gruneisen_band_structure=gruneisen_band_structure,
             derived_properties=derived_properties,
+            deferred_plots=plots if plot_policy == "deferred" else None,
+        )
+
+    def render_plots(self) -> None:
+        """Render the deferred plots in the current directory."""
+        _save_gruneisen_plots(
+            self.deferred_plots or {},
+            self.gruneisen_parameter,
+            self.gruneisen_band_structure,
         )
 
     @staticmethod
     def get_gruneisen_weighted_bandstructure(
-        gruneisen_band_symline_plotter: GruneisenPhononBSPlotter,
+        gruneisen_band_symline_plotter: "GruneisenPhononBSPlotter",
         save_fig: bool = True,
         **kwargs,
     ) -> None:
@@ -283,6 +296,12 @@ class GruneisenParameterDocument(StructureMetadata):
         -------
         None
         """
+        import matplotlib.pyplot as plt
+        from matplotlib import colors
+        from matplotlib.colors import LinearSegmentedColormap
+        from pymatgen.phonon.plotter import freq_units
+        from pymatgen.util.plotting import pretty_plot
+
         u = freq_units(kwargs.get("units", "THz"))
         ax = pretty_plot(12, 8)
         gruneisen_band_symline_plotter._make_ticks(ax)  # noqa: SLF001
@@ -340,3 +359,100 @@ class GruneisenParameterDocument(StructureMetadata):
             plt.close()
         else:
             plt.close()
+
+
+def get_gruneisen_parameter_from_phonopy(
+    gruneisen: PhonopyGruneisen, structure: Structure
+) -> GruneisenParameter:
+    """
+    Get the Grueneisen parameters on the mesh set on a phonopy Grueneisen object.
+
+    This is equivalent to writing the mesh yaml with phonopy and reading it with
+    :obj:`pymatgen.io.phonopy.get_gruneisenparameter`, without the round trip
+    through the file.
+
+    Parameters
+    ----------
+    gruneisen : PhonopyGruneisen
+        The phonopy Grueneisen object, on which the mesh has been set.
+    structure : Structure
+        The structure used for the Grueneisen parameters.
+
+    Returns
+    -------
+    GruneisenParameter
+        The Grueneisen parameters on the mesh.
+    """
+    qpoints, weights, frequencies, _eigenvectors, gruneisen_params = (
+        gruneisen.get_mesh()
+    )
+    return GruneisenParameter(
+        gruneisen=np.transpose(gruneisen_params),
+        qpoints=np.asarray(qpoints),
+        multiplicities=np.asarray(weights),
+        frequencies=np.transpose(frequencies),
+        structure=structure,
+    )
+
+
+def get_gruneisen_ph_bs_symm_line_from_phonopy(
+    gruneisen: PhonopyGruneisen,
+    structure: Structure,
+    labels_dict: Optional[dict] = None,
+) -> GruneisenPhononBandStructureSymmLine:
+    """
+    Get the Grueneisen band structure set on a phonopy Grueneisen object.
+
+    This is equivalent to writing the band yaml with phonopy and reading it with
+    :obj:`pymatgen.io.phonopy.get_gruneisen_ph_bs_symm_line`, without the round trip
+    through the file.
+
+    Parameters
+    ----------
+    gruneisen : PhonopyGruneisen
+        The phonopy Grueneisen object, on which the band structure has been set.
+    structure : Structure
+        The structure used for the band structure and its reciprocal lattice.
+    labels_dict : dict or None
+        Dict that links a q-point in fractional coordinates to a label.
+
+    Returns
+    -------
+    GruneisenPhononBandStructureSymmLine
+        The Grueneisen band structure.
+    """
+    qpoints, _distances, frequencies, _eigenvectors, gruneisen_params = (
+        gruneisen.get_band_structure()
+    )
+    return GruneisenPhononBandStructureSymmLine(
+        qpoints=np.concatenate(qpoints),
+        # transpose to match the convention in PhononBandStructure
+        frequencies=np.concatenate(frequencies).T,
+        gruneisenparameters=np.concatenate(gruneisen_params).T,
+        lattice=structure.lattice.reciprocal_lattice,
+        labels_dict=labels_dict or {},
+        structure=structure,
+        eigendisplacements=None,
+    )
+
+
+def _save_gruneisen_plots(
+    plots: dict[str, dict],
+    gruneisen_parameter: GruneisenParameter,
+    gruneisen_band_structure: GruneisenPhononBandStructureSymmLine,
+) -> None:
+    """Save the Grueneisen parameter and weighted band structure plots."""
+    from pymatgen.phonon.plotter import GruneisenPhononBSPlotter, GruneisenPlotter
+
+    if "gruneisen_parameter" in plots:
+        GruneisenPlotter(gruneisen=gruneisen_parameter).save_plot(
+            **plots["gruneisen_parameter"]
+        )
+    if "gruneisen_band_structure" in plots:
+        GruneisenParameterDocument.get_gruneisen_weighted_bandstructure(
+            gruneisen_band_symline_plotter=GruneisenPhononBSPlotter(
+                bs=gruneisen_band_structure
+            ),
+            save_fig=True,
+            **plots["gruneisen_band_structure"],
+        )
@@ -11,25 +11,23 @@ from emmet.core.structure import StructureMetadata
 from monty.json import MSONable
 from phonopy import Phonopy
 from phonopy.phonon.band_structure import get_band_qpoints_and_path_connections
+from phonopy.structure.atoms import PhonopyAtoms
 from phonopy.structure.symmetry import symmetrize_borns_and_epsilon
 from phonopy.units import VaspToTHz
 from pydantic import BaseModel, Field
-from pymatgen.core import Structure
-from pymatgen.io.phonopy import (
-    get_ph_bs_symm_line,
-    get_ph_dos,
-    get_phonopy_structure,
-    get_pmg_structure,
-)
+from pymatgen.core import Lattice, Structure
+from pymatgen.io.phonopy import get_phonopy_structure, get_pmg_structure
 from pymatgen.io.vasp import Kpoints
 from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
-from pymatgen.phonon.dos import PhononDos
-from pymatgen.phonon.plotter import PhononBSPlotter, PhononDosPlotter
+from pymatgen.phonon.dos import BOLTZ_THZ_PER_K, THZ_TO_J, PhononDos
 from pymatgen.symmetry.bandstructure import HighSymmKpath
 from pymatgen.symmetry.kpath import KPathSeek
+from scipy import constants as const
+from scipy.integrate import trapezoid
 from typing_extensions import Self
 
 from atomate2.aims.utils.units import omegaToTHz
+from atomate2.common.utils import decode_array, encode_array, get_plot_policy
 
 logger = logging.getLogger(__name__)
 
@@ -107,10 +105,120 @@ class PhononUUIDs(BaseModel):
 
 
 class ForceConstants(MSONable):
-    """A force constants class."""
+    """
+    A force constants class.
 
-    def __init__(self, force_constants: list[list[Matrix3D]]) -> None:
-        self.force_constants = force_constants
+    The force constants are either stored as nested lists or in a compact form, in
+    which they are stored as base64 encoded binary arrays. The compact form can
+    optionally only contain the pairs of atoms within a cutoff distance. It is only
+    expanded to the dense force constants on first access.
+
+    Parameters
+    ----------
+    force_constants : list or np.ndarray or None
+        Dense force constants with shape (n_atoms, n_atoms, 3, 3).
+    compact : dict or None
+        The compact form, as generated by :obj:`ForceConstants.from_array`.
+    """
+
+    def __init__(
+        self,
+        force_constants: Optional[Union[list[list[Matrix3D]], np.ndarray]] = None,
+        compact: Optional[dict] = None,
+    ) -> None:
+        if force_constants is None and compact is None:
+            raise ValueError("Either force_constants or compact must be provided")
+        self._force_constants = force_constants
+        self.compact = compact
+
+    @property
+    def force_constants(self) -> Union[list[list[Matrix3D]], np.ndarray]:
+        """The dense force constants with shape (n_atoms, n_atoms, 3, 3)."""
+        if self._force_constants is None:
+            n_atoms = self.compact["n_atoms"]
+            data = decode_array(self.compact["data"]).reshape(-1, 3, 3)
+            if self.compact.get("pairs") is None:
+                fcs = data.reshape(n_atoms, n_atoms, 3, 3)
+            else:
+                idx_i, idx_j = decode_array(self.compact["pairs"]).reshape(2, -1)
+                fcs = np.zeros((n_atoms, n_atoms, 3, 3))
+                fcs[idx_i, idx_j] = data
+            self._force_constants = fcs
+        return self._force_constants
+
+    @force_constants.setter
+    def force_constants(
+        self, force_constants: Union[list[list[Matrix3D]], np.ndarray]
+    ) -> None:
+        self._force_constants = force_constants
+        self.compact = None
+
+    @property
+    def pairs(self) -> Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        The sparse force constants if only pairs within a cutoff are stored.
+
+        Returns
+        -------
+        tuple of np.ndarray or None
+            The indices of the first and second atom of each pair and the force
+            constants of each pair with shape (n_pairs, 3, 3), or None if the dense
+            force constants are stored.
+        """
+        if self.compact is None or self.compact.get("pairs") is None:
+            return None
+        idx_i, idx_j = decode_array(self.compact["pairs"]).reshape(2, -1)
+        return idx_i, idx_j, decode_array(self.compact["data"]).reshape(-1, 3, 3)
+
+    @classmethod
+    def from_array(
+        cls,
+        force_constants: np.ndarray,
+        structure: Optional[Structure] = None,
+        cutoff: Optional[float] = None,
+    ) -> Self:
+        """
+        Create force constants in the compact binary form.
+
+        Parameters
+        ----------
+        force_constants : np.ndarray
+            Dense force constants with shape (n_atoms, n_atoms, 3, 3).
+        structure : Structure or None
+            The supercell the force constants were calculated for. Only required if
+            a cutoff is given.
+        cutoff : float or None
+            Only keep the force constants of pairs of atoms within this distance
+            (in Å, using the minimum image convention). If None, all pairs are kept.
+
+        Returns
+        -------
+        ForceConstants
+            The force constants.
+        """
+        force_constants = np.asarray(force_constants, dtype=np.float64)
+        compact: dict = {"n_atoms": len(force_constants), "cutoff": cutoff}
+        if cutoff is None:
+            compact["pairs"] = None
+            compact["data"] = encode_array(force_constants)
+        else:
+            if structure is None:
+                raise ValueError("A structure is required to apply a cutoff")
+            idx_i, idx_j = np.nonzero(structure.distance_matrix <= cutoff)
+            compact["pairs"] = encode_array(np.stack([idx_i, idx_j]).astype(np.int32))
+            compact["data"] = encode_array(force_constants[idx_i, idx_j])
+        return cls(compact=compact)
+
+    def as_dict(self) -> dict:
+        """Get a JSON serializable dict representation of the force constants."""
+        dct = {"@module": type(self).__module__, "@class": type(self).__name__}
+        if self.compact is not None:
+            dct["compact"] = self.compact
+        elif isinstance(self._force_constants, np.ndarray):
+            dct["force_constants"] = self._force_constants.tolist()
+        else:
+            dct["force_constants"] = self._force_constants
+        return dct
 
 
 class PhononJobDirs(BaseModel):
@@ -237,6 +345,12 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
         None, description="Field including all relevant uuids"
     )
 
+    deferred_plots: Optional[dict[str, dict]] = Field(
+        None,
+        description="Settings of the plots that were deferred, to be rendered with "
+        "render_plots",
+    )
+
     @classmethod
     def from_forces_born(
         cls,
@@ -252,6 +366,7 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
         total_dft_energy: float,
         epsilon_static: Matrix3D = None,
         born: Matrix3D = None,
+        displacement_dataset: Optional[dict] = None,
         **kwargs,
     ) -> Self:
         """Generate collection of phonon data.
@@ -281,8 +396,16 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             The high-frequency dielectric constant
         born: Matrix3D
             born charges
+        displacement_dataset: dict
+            The displacement dataset from the generation of the displacements, see
+            :obj:`get_displacement_dataset`. If None, the displacements are
+            generated again.
         **kwargs:
-            additional arguments
+            additional arguments. The band structure and DOS are converted from
+            phonopy in memory; set ``write_phonon_yamls`` to also write them to
+            ``filename_band_yaml`` and ``filename_dos_yaml``. ``plot_policy``
+            overrides the ``PLOT_POLICY`` setting for the band structure and DOS
+            plots.
         """
         additional_fields = kwargs.get("additional_fields", {})
         factor = get_factor(code)
@@ -313,7 +436,10 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             symprec=symprec,
             is_symmetry=sym_reduce,
         )
-        phonon.generate_displacements(distance=displacement)
+        if displacement_dataset is None:
+            phonon.generate_displacements(distance=displacement)
+        else:
+            set_displacement_dataset(phonon, displacement_dataset)
         set_of_forces = [np.array(forces) for forces in displacement_data["forces"]]
 
         if born is not None and epsilon_static is not None:
@@ -353,8 +479,9 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
         phonon.save(filename_phonopy_yaml)
 
         # get phonon band structure
+        primitive_structure = get_pmg_structure(phonon.primitive)
         kpath_dict, kpath_concrete = PhononBSDOSDoc.get_kpath(
-            structure=get_pmg_structure(phonon.primitive),
+            structure=primitive_structure,
             kpath_scheme=kpath_scheme,
             symprec=symprec,
         )
@@ -365,11 +492,6 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
         )
 
         # phonon band structures will always be computed
-        filename_band_yaml = kwargs.get(
-            "filename_band_yaml", "phonon_band_structure.yaml"
-        )
-        # filename_band_yaml = "phonon_band_structure.yaml"
-
         # TODO: potentially add kwargs to avoid computation of eigenvectors
         phonon.run_band_structure(
             qpoints,
@@ -377,15 +499,15 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             with_eigenvectors=kwargs.get("band_structure_eigenvectors", False),
             is_band_connection=kwargs.get("band_structure_eigenvectors", False),
         )
-        phonon.write_yaml_band_structure(filename=filename_band_yaml)
-        bs_symm_line = get_ph_bs_symm_line(
-            filename_band_yaml, labels_dict=kpath_dict, has_nac=born is not None
-        )
-        new_plotter = PhononBSPlotter(bs=bs_symm_line)
-        new_plotter.save_plot(
-            filename=kwargs.get("filename_bs", "phonon_band_structure.pdf"),
-            units=kwargs.get("units", "THz"),
+        bs_symm_line = get_ph_bs_symm_line_from_phonopy(
+            phonon, labels_dict=kpath_dict, has_nac=born is not None
         )
+        # the yaml files are only needed for use outside of atomate2
+        write_yamls = kwargs.get("write_phonon_yamls", False)
+        if write_yamls:
+            phonon.write_yaml_band_structure(
+                filename=kwargs.get("filename_band_yaml", "phonon_band_structure.yaml")
+            )
 
         # will determine if imaginary modes are present in the structure
         imaginary_modes = bs_symm_line.has_imaginary_freq(
@@ -397,12 +519,9 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             bs_symm_line.write_phononwebsite("phonon_website.json")
 
         # get phonon density of states
-        filename_dos_yaml = kwargs.get("filename_dos_yaml", "phonon_dos.yaml")
-        # filename_dos_yaml = "phonon_dos.yaml"
-
         kpoint_density_dos = kwargs.get("kpoint_density_dos", 7_000)
         kpoint = Kpoints.automatic_density(
-            structure=get_pmg_structure(phonon.primitive),
+            structure=primitive_structure,
             kppa=kpoint_density_dos,
             force_gamma=True,
         )
@@ -412,43 +531,38 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
         phonon.run_total_dos(
             sigma=phonon_dos_sigma, use_tetrahedron_method=dos_use_tetrahedron_method
         )
-        phonon.write_total_dos(filename=filename_dos_yaml)
-        dos = get_ph_dos(filename_dos_yaml)
-        new_plotter_dos = PhononDosPlotter()
-        new_plotter_dos.add_dos(label="total", dos=dos)
-        new_plotter_dos.save_plot(
-            filename=kwargs.get("filename_dos", "phonon_dos.pdf"),
-            units=kwargs.get("units", "THz"),
-        )
+        dos = get_ph_dos_from_phonopy(phonon)
+        if write_yamls:
+            phonon.write_total_dos(
+                filename=kwargs.get("filename_dos_yaml", "phonon_dos.yaml")
+            )
+
+        plot_policy = get_plot_policy(kwargs.get("plot_policy"))
+        plots = {
+            "phonon_bandstructure": {
+                "filename": kwargs.get("filename_bs", "phonon_band_structure.pdf"),
+                "units": kwargs.get("units", "THz"),
+            },
+            "phonon_dos": {
+                "filename": kwargs.get("filename_dos", "phonon_dos.pdf"),
+                "units": kwargs.get("units", "THz"),
+            },
+        }
+        if plot_policy == "inline":
+            _save_phonon_plots(plots, bs_symm_line, dos)
 
         # compute vibrational part of free energies per formula unit
         temperature_range = np.arange(
             kwargs.get("tmin", 0), kwargs.get("tmax", 500), kwargs.get("tstep", 10)
         )
 
-        free_energies = [
-            dos.helmholtz_free_energy(
-                temp=temp, structure=get_pmg_structure(phonon.primitive)
-            )
-            for temp in temperature_range
-        ]
-
-        entropies = [
-            dos.entropy(temp=temp, structure=get_pmg_structure(phonon.primitive))
-            for temp in temperature_range
-        ]
-
-        internal_energies = [
-            dos.internal_energy(
-                temp=temp, structure=get_pmg_structure(phonon.primitive)
-            )
-            for temp in temperature_range
-        ]
-
-        heat_capacities = [
-            dos.cv(temp=temp, structure=get_pmg_structure(phonon.primitive))
-            for temp in temperature_range
-        ]
+        thermal_properties = get_thermal_properties(
+            dos, temperature_range, structure=primitive_structure
+        )
+        free_energies = thermal_properties["free_energy"].tolist()
+        entropies = thermal_properties["entropy"].tolist()
+        internal_energies = thermal_properties["internal_energy"].tolist()
+        heat_capacities = thermal_properties["heat_capacity"].tolist()
 
         # will compute thermal displacement matrices
         # for the primitive cell (phonon.primitive!)
@@ -510,7 +624,7 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             volume_per_formula_unit=volume_per_formula_unit,
             formula_units=formula_units,
             has_imaginary_modes=imaginary_modes,
-            force_constants={"force_constants": phonon.force_constants.tolist()}
+            force_constants=_get_force_constants_doc(phonon, **kwargs)
             if kwargs["store_force_constants"]
             else None,
             born=borns.tolist() if borns is not None else None,
@@ -544,10 +658,17 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
                 "kpath_scheme": kpath_scheme,
                 "kpoint_density_dos": kpoint_density_dos,
             },
+            deferred_plots=plots if plot_policy == "deferred" else None,
         )
 
         return doc.model_copy(update=additional_fields)
 
+    def render_plots(self) -> None:
+        """Render the deferred plots in the current directory."""
+        _save_phonon_plots(
+            self.deferred_plots or {}, self.phonon_bandstructure, self.phonon_dos
+        )
+
     @staticmethod
     def get_kpath(
         structure: Structure, kpath_scheme: str, symprec: float, **kpath_kwargs
@@ -581,3 +702,270 @@ class PhononBSDOSDoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg
             for lbl_idx, label in enumerate(label_set):
                 path[set_idx][lbl_idx] = kpath["kpoints"][label]
         return kpath["kpoints"], path
+
+
+def get_ph_bs_symm_line_from_phonopy(
+    phonon: Phonopy,
+    labels_dict: Optional[dict] = None,
+    has_nac: bool = False,
+) -> PhononBandStructureSymmLine:
+    """
+    Get the band structure from the results of ``Phonopy.run_band_structure``.
+
+    This is equivalent to writing the band structure yaml with phonopy and reading it
+    with :obj:`pymatgen.io.phonopy.get_ph_bs_symm_line`, without the round trip
+    through the file.
+
+    Parameters
+    ----------
+    phonon : Phonopy
+        A phonopy object on which the band structure has been run.
+    labels_dict : dict or None
+        Dict that links a q-point in fractional coordinates to a label.
+    has_nac : bool
+        Whether the non-analytical correction was used.
+
+    Returns
+    -------
+    PhononBandStructureSymmLine
+        The phonon band structure, with eigendisplacements if the eigenvectors were
+        computed.
+    """
+    structure = get_structure_with_masses(phonon.primitive)
+    band_structure = phonon.get_band_structure_dict()
+    qpoints = np.concatenate(band_structure["qpoints"])
+    frequencies = np.concatenate(band_structure["frequencies"]).T
+
+    eigendisplacements: Union[list, np.ndarray] = []
+    if band_structure["eigenvectors"] is not None:
+        # eigenvectors are columns of shape (n_qpoints, 3 * n_atoms, n_bands)
+        eigenvectors = np.concatenate(band_structure["eigenvectors"])
+        n_qpoints, _, n_bands = eigenvectors.shape
+        eigenvectors = eigenvectors.transpose(0, 2, 1).reshape(
+            n_qpoints, n_bands, len(structure), 3
+        )
+        phases = np.exp(2j * np.pi * qpoints @ structure.frac_coords.T) / np.sqrt(
+            structure.site_properties["phonopy_masses"]
+        )
+        eigendisplacements = (eigenvectors * phases[:, None, :, None]).transpose(
+            1, 0, 2, 3
+        )
+
+    # phonopy uses the reciprocal lattice without the factor of 2 pi
+    reciprocal_lattice = Lattice(np.linalg.inv(phonon.primitive.cell).T)
+    return PhononBandStructureSymmLine(
+        qpoints,
+        frequencies,
+        reciprocal_lattice,
+        has_nac=has_nac,
+        labels_dict=labels_dict or {},
+        structure=structure,
+        eigendisplacements=eigendisplacements,
+    )
+
+
+def get_ph_dos_from_phonopy(phonon: Phonopy) -> PhononDos:
+    """
+    Get the density of states from the results of ``Phonopy.run_total_dos``.
+
+    Parameters
+    ----------
+    phonon : Phonopy
+        A phonopy object on which the total DOS has been run.
+
+    Returns
+    -------
+    PhononDos
+        The total phonon density of states.
+    """
+    total_dos = phonon.get_total_dos_dict()
+    return PhononDos(total_dos["frequency_points"], total_dos["total_dos"])
+
+
+def get_displacement_dataset(phonon: Phonopy) -> dict:
+    """
+    Get the displacement dataset of a phonopy object in a serializable form.
+
+    The dataset includes a summary of the symmetry of the supercell, which is checked
+    when the dataset is set on another phonopy object with
+    :obj:`set_displacement_dataset`.
+
+    Parameters
+    ----------
+    phonon : Phonopy
+        A phonopy object on which the displacements have been generated.
+
+    Returns
+    -------
+    dict
+        The number of atoms in the supercell ("natom"), the displaced atoms and
+        displacements ("first_atoms") and the supercell symmetry ("symmetry").
+    """
+    return {
+        "natom": int(phonon.dataset["natom"]),
+        "first_atoms": [
+            {
+                "number": int(first_atom["number"]),
+                "displacement": np.asarray(first_atom["displacement"]).tolist(),
+            }
+            for first_atom in phonon.dataset["first_atoms"]
+        ],
+        "symmetry": _get_symmetry_summary(phonon),
+    }
+
+
+def set_displacement_dataset(phonon: Phonopy, dataset: dict) -> None:
+    """
+    Set a displacement dataset from :obj:`get_displacement_dataset` on phonopy.
+
+    Parameters
+    ----------
+    phonon : Phonopy
+        The phonopy object, created with the same structure and settings as the one
+        used to generate the displacements.
+    dataset : dict
+        The displacement dataset.
+    """
+    if dataset["natom"] != len(phonon.supercell) or dataset[
+        "symmetry"
+    ] != _get_symmetry_summary(phonon):
+        raise ValueError(
+            "The displacement dataset does not match the supercell or symmetry of "
+            "the phonopy object"
+        )
+    phonon.dataset = {
+        "natom": dataset["natom"],
+        "first_atoms": dataset["first_atoms"],
+    }
+
+
+def get_thermal_properties(
+    dos: PhononDos,
+    temperatures: Union[list[float], np.ndarray],
+    structure: Optional[Structure] = None,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the thermodynamic properties of a phonon DOS on a temperature grid.
+
+    All temperatures are evaluated in a single pass over the DOS. The results are
+    identical to those of the :obj:`PhononDos` methods evaluated per temperature.
+
+    Parameters
+    ----------
+    dos : PhononDos
+        The phonon density of states. Only positive frequencies are used.
+    temperatures : list of float or np.ndarray
+        The temperatures in K.
+    structure : Structure or None
+        If given, the properties are normalized per formula unit of the structure.
+
+    Returns
+    -------
+    dict of str to np.ndarray
+        The Helmholtz "free_energy" (J/mol), "entropy" (J/K/mol), "internal_energy"
+        (J/mol) and "heat_capacity" (J/K/mol) at each temperature.
+    """
+    temperatures = np.asarray(temperatures, dtype=float)
+    positive = dos.frequencies > 0
+    freqs = dos.frequencies[positive]
+    dens = dos.densities[positive]
+    zero_point_energy = dos.zero_point_energy(structure=structure)
+
+    formula_units = 1.0
+    if structure is not None:
+        formula_units = (
+            structure.composition.num_atoms
+            / structure.composition.reduced_composition.num_atoms
+        )
+
+    # follows the order of operations in PhononDos, such that results are identical
+    zero = temperatures == 0
+    temps = np.where(zero, 1, temperatures)[:, None]
+    wd2kt = freqs / (2 * BOLTZ_THZ_PER_K * temps)
+    log_2sinh = np.log(2 * np.sinh(wd2kt))
+
+    free_energy = trapezoid(log_2sinh * dens, x=freqs, axis=1)
+    free_energy *= const.Boltzmann * const.Avogadro * temps[:, 0]
+
+    entropy = trapezoid((wd2kt / np.tanh(wd2kt) - log_2sinh) * dens, x=freqs, axis=1)
+    entropy *= const.Boltzmann * const.Avogadro
+
+    internal_energy = trapezoid(freqs / np.tanh(wd2kt) * dens, x=freqs, axis=1) / 2
+    internal_energy *= THZ_TO_J * const.Avogadro
+
+    csch2 = 1.0 / (np.sinh(wd2kt) ** 2)
+    heat_capacity = trapezoid(wd2kt**2 * csch2 * dens, x=freqs, axis=1)
+    heat_capacity *= const.Boltzmann * const.Avogadro
+
+    free_energy /= formula_units
+    entropy /= formula_units
+    internal_energy /= formula_units
+    heat_capacity /= formula_units
+
+    return {
+        "free_energy": np.where(zero, zero_point_energy, free_energy),
+        "entropy": np.where(zero, 0.0, entropy),
+        "internal_energy": np.where(zero, zero_point_energy, internal_energy),
+        "heat_capacity": np.where(zero, 0.0, heat_capacity),
+    }
+
+
+def get_structure_with_masses(cell: PhonopyAtoms) -> Structure:
+    """
+    Convert a phonopy cell to a structure with the phonopy masses as site property.
+
+    The structure is identical to the one read from the yaml files written by phonopy.
+
+    Parameters
+    ----------
+    cell : PhonopyAtoms
+        The phonopy cell.
+
+    Returns
+    -------
+    Structure
+        The structure with the "phonopy_masses" site property.
+    """
+    return Structure(
+        cell.cell,
+        cell.symbols,
+        cell.scaled_positions,
+        site_properties={"phonopy_masses": np.asarray(cell.masses).tolist()},
+    )
+
+
+def _get_symmetry_summary(phonon: Phonopy) -> dict:
+    """Get the space group and number of symmetry operations of the supercell."""
+    return {
+        "international": phonon.symmetry.get_international_table(),
+        "n_operations": len(phonon.symmetry.symmetry_operations["rotations"]),
+    }
+
+
+def _save_phonon_plots(
+    plots: dict[str, dict],
+    bs_symm_line: PhononBandStructureSymmLine,
+    dos: PhononDos,
+) -> None:
+    """Save the phonon band structure and DOS plots."""
+    from pymatgen.phonon.plotter import PhononBSPlotter, PhononDosPlotter
+
+    if "phonon_bandstructure" in plots:
+        PhononBSPlotter(bs=bs_symm_line).save_plot(**plots["phonon_bandstructure"])
+    if "phonon_dos" in plots:
+        dos_plotter = PhononDosPlotter()
+        dos_plotter.add_dos(label="total", dos=dos)
+        dos_plotter.save_plot(**plots["phonon_dos"])
+
+
+def _get_force_constants_doc(phonon: Phonopy, **kwargs) -> ForceConstants:
+    """Get the force constants to store, in compact form if requested."""
+    cutoff = kwargs.get("force_constants_cutoff")
+    if not kwargs.get("compact_force_constants") and cutoff is None:
+        return ForceConstants(force_constants=phonon.force_constants.tolist())
+
+    return ForceConstants.from_array(
+        phonon.force_constants,
+        structure=get_pmg_structure(phonon.supercell),
+        cutoff=cutoff,
+    )
@@ -1,17 +1,39 @@
 """Schemas for qha documents."""
 
 import logging
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Optional, Union
 
 import numpy as np
+import phonopy
 from emmet.core.structure import StructureMetadata
 from phonopy.api_qha import PhonopyQHA
+from phonopy.qha.core import QHA
+from phonopy.qha.eos import fit_to_eos, get_eos
+from phonopy.units import EVAngstromToGPa
 from pydantic import Field
 from pymatgen.core import Structure
 from typing_extensions import Self
 
+from atomate2.common.utils import decode_array, encode_array, get_plot_policy
+
 logger = logging.getLogger(__name__)
 
+# phonopy versions for which _ParallelQHA.run follows QHA.run (start inclusive, end
+# exclusive). QHA.run also sets the entropy and enthalpy from phonopy 4.6.0.
+_PARALLEL_QHA_PHONOPY_VERSIONS = ((2, 20, 0), (4, 6, 0))
+
+# fields of shape (temperatures, volumes) that can be stored in compact form
+_COMPACT_FIELDS = (
+    "helmholtz_volume",
+    "free_energies",
+    "heat_capacities",
+    "entropies",
+    "electronic_energies",
+)
+
 
 class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
     """Collection of all data produced by the qha workflow."""
@@ -87,21 +109,42 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
         "Shape: (temperatuers, volumes) ",
     )
     formula_units: Optional[int] = Field(None, description="Formula units")
+    electronic_energies: Optional[list[list[float]]] = Field(
+        None,
+        description="Electronic energies in eV per formula unit. "
+        "Shape: (temperatures, volumes)",
+    )
+    eos_type: Optional[str] = Field(
+        None, description="Equation of state used for the fit"
+    )
+    deferred_plots: Optional[dict[str, dict]] = Field(
+        None,
+        description="Settings of the plots that were deferred, to be rendered with "
+        "render_plots",
+    )
+    compact_arrays: Optional[dict[str, dict]] = Field(
+        None,
+        description="The fields of shape (temperatures, volumes) as base64 encoded "
+        "binary arrays, stored instead of the nested lists if requested. Use "
+        "get_array to access these fields in either form.",
+    )
 
     @classmethod
     def from_phonon_runs(
         cls,
         structure: Structure,
-        volumes: list[float],
-        temperatures: list[float],
-        electronic_energies: list[list[float]],
-        free_energies: list[list[float]],
-        heat_capacities: list[list[float]],
-        entropies: list[list[float]],
+        volumes: Union[list[float], np.ndarray],
+        temperatures: Union[list[float], np.ndarray],
+        electronic_energies: Union[list[list[float]], np.ndarray],
+        free_energies: Union[list[list[float]], np.ndarray],
+        heat_capacities: Union[list[list[float]], np.ndarray],
+        entropies: Union[list[list[float]], np.ndarray],
         t_max: float = None,
         pressure: float = None,
         formula_units: Union[int, None] = None,
         eos_type: str = "vinet",
+        n_workers: int = 1,
+        compact_arrays: bool = False,
         **kwargs,
     ) -> Self:
         """Generate qha results.
@@ -109,18 +152,30 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
         Parameters
         ----------
         structure: Structure object
-        volumes: list of floats
-        temperatures: list of floats
-        electronic_energies: list of list of floats
-        free_energies: list of list of floats
-        heat_capacities: list of list of floats
-        entropies: list of list of floats
+        volumes: list of floats or np.ndarray
+        temperatures: list of floats or np.ndarray
+        electronic_energies: list of list of floats or np.ndarray
+            shape (temperatures, volumes)
+        free_energies: list of list of floats or np.ndarray
+            shape (temperatures, volumes)
+        heat_capacities: list of list of floats or np.ndarray
+            shape (temperatures, volumes)
+        entropies: list of list of floats or np.ndarray
+            shape (temperatures, volumes)
         t_max: float
         pressure: float
         eos_type: string
             determines eos type used for the fit
+        n_workers: int
+            number of processes used to fit the equations of state at the
+            different temperatures. Only supported for the phonopy versions in
+            ``_PARALLEL_QHA_PHONOPY_VERSIONS``, otherwise the fits are serial.
+        compact_arrays: bool
+            store the fields of shape (temperatures, volumes) as base64 encoded
+            binary arrays in ``compact_arrays`` instead of nested lists
         kwargs: dict
-            Additional keywords to pass to this method
+            Additional keywords to pass to this method. ``plot_policy`` overrides
+            the ``PLOT_POLICY`` setting.
 
         Returns
         -------
@@ -132,49 +187,29 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
             # Phonopy messes with the warnings
             # Turns all warnings into errors
 
-            qha = PhonopyQHA(
-                volumes=np.array(volumes),
-                electronic_energies=np.array(electronic_energies),
-                temperatures=np.array(temperatures),
-                free_energy=np.array(free_energies),
-                cv=np.array(heat_capacities),
-                entropy=np.array(entropies),
+            qha = _get_phonopy_qha(
+                volumes=np.asarray(volumes),
+                electronic_energies=np.asarray(electronic_energies),
+                temperatures=np.asarray(temperatures),
+                free_energies=np.asarray(free_energies),
+                heat_capacities=np.asarray(heat_capacities),
+                entropies=np.asarray(entropies),
                 t_max=t_max,
                 pressure=pressure,
-                eos=eos_type,
+                eos_type=eos_type,
+                n_workers=n_workers,
             )
 
         # create some plots here
         # add kwargs to change the names and file types
-        qha.plot_helmholtz_volume().savefig(
-            f"{kwargs.get('helmholtz_volume_filename', 'helmholtz_volume')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
-        qha.plot_volume_temperature().savefig(
-            f"{kwargs.get('volume_temperature_plot', 'volume_temperature')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
-        qha.plot_thermal_expansion().savefig(
-            f"{kwargs.get('thermal_expansion_plot', 'thermal_expansion')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
-        qha.plot_gibbs_temperature().savefig(
-            f"{kwargs.get('gibbs_temperature_plot', 'gibbs_temperature')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
-        qha.plot_bulk_modulus_temperature().savefig(
-            f"{kwargs.get('bulk_modulus_plot', 'bulk_modulus_temperature')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
-        qha.plot_heat_capacity_P_numerical().savefig(
-            f"{kwargs.get('heat_capacity_plot', 'heat_capacity_P_numerical')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
-        # qha.plot_heat_capacity_P_polyfit().savefig("heat_capacity_P_polyfit.eps")
-        qha.plot_gruneisen_temperature().savefig(
-            f"{kwargs.get('gruneisen_temperature_plot', 'gruneisen_temperature')}"
-            f".{kwargs.get('plot_type', 'pdf')}"
-        )
+        plot_type = kwargs.get("plot_type", "pdf")
+        plots = {
+            name: {"filename": f"{kwargs.get(filename_key, name)}.{plot_type}"}
+            for name, filename_key in _QHA_PLOT_FILENAME_KEYS.items()
+        }
+        plot_policy = get_plot_policy(kwargs.get("plot_policy"))
+        if plot_policy == "inline":
+            _save_qha_plots(plots, qha)
 
         qha.write_helmholtz_volume(
             filename=kwargs.get("helmholtz_volume_datafile", "helmholtz_volume.dat")
@@ -212,13 +247,29 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
 
         # write files as well - might be easier for plotting
 
+        arrays = {
+            "helmholtz_volume": np.asarray(qha.helmholtz_volume),
+            "free_energies": np.asarray(free_energies) * 1000.0,
+            "heat_capacities": np.asarray(heat_capacities),
+            "entropies": np.asarray(entropies),
+            "electronic_energies": np.asarray(electronic_energies),
+        }
+        if compact_arrays:
+            array_fields = {
+                "compact_arrays": {
+                    name: encode_array(array.astype(np.float64))
+                    for name, array in arrays.items()
+                }
+            }
+        else:
+            array_fields = {name: array.tolist() for name, array in arrays.items()}
+
         return cls.from_structure(
             structure=structure,
             meta_structure=structure,
-            bulk_modulus=qha.bulk_modulus[0],  # all bulk moduli are the same
-            # (if electronic effects are not treated)
+            # all bulk moduli are the same (if electronic effects are not treated)
+            bulk_modulus=np.atleast_1d(qha.bulk_modulus)[0],
             thermal_expansion=qha.thermal_expansion,
-            helmholtz_volume=qha.helmholtz_volume,
             volume_temperature=qha.volume_temperature,
             gibbs_temperature=qha.gibbs_temperature,
             bulk_modulus_temperature=qha.bulk_modulus_temperature,
@@ -226,10 +277,198 @@ class PhononQHADoc(StructureMetadata, extra="allow"):  # type: ignore[call-arg]
             gruneisen_temperature=qha.gruneisen_temperature,
             pressure=pressure,
             t_max=t_max,
-            temperatures=temperatures,
-            volumes=volumes,
-            free_energies=np.array(np.array(free_energies) * 1000.0).tolist(),
-            heat_capacities=heat_capacities,
-            entropies=entropies,
+            temperatures=np.asarray(temperatures).tolist(),
+            volumes=np.asarray(volumes).tolist(),
             formula_units=formula_units,
+            eos_type=eos_type,
+            deferred_plots=plots if plot_policy == "deferred" else None,
+            **array_fields,
+        )
+
+    def get_array(self, name: str) -> Optional[np.ndarray]:
+        """
+        Get a field of shape (temperatures, volumes) as an array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the field, e.g. "free_energies".
+
+        Returns
+        -------
+        np.ndarray or None
+            The array, from either the compact or the nested list form.
+        """
+        if name not in _COMPACT_FIELDS:
+            raise ValueError(f"{name} is not a field of shape (temperatures, volumes)")
+        if self.compact_arrays is not None and name in self.compact_arrays:
+            return decode_array(self.compact_arrays[name])
+        value = getattr(self, name)
+        return None if value is None else np.asarray(value)
+
+    def render_plots(self) -> None:
+        """Render the deferred plots in the current directory."""
+        qha = _get_phonopy_qha(
+            volumes=np.array(self.volumes),
+            electronic_energies=self.get_array("electronic_energies"),
+            temperatures=np.array(self.temperatures),
+            # convert from J/mol back to kJ/mol
+            free_energies=self.get_array("free_energies") / 1000.0,
+            heat_capacities=self.get_array("heat_capacities"),
+            entropies=self.get_array("entropies"),
+            t_max=self.t_max,
+            pressure=self.pressure,
+            eos_type=self.eos_type,
         )
+        _save_qha_plots(self.deferred_plots or {}, qha)
+
+
+def _get_phonopy_qha(
+    volumes: np.ndarray,
+    electronic_energies: np.ndarray,
+    temperatures: np.ndarray,
+    free_energies: np.ndarray,
+    heat_capacities: np.ndarray,
+    entropies: np.ndarray,
+    t_max: Optional[float],
+    pressure: Optional[float],
+    eos_type: str,
+    n_workers: int = 1,
+) -> PhonopyQHA:
+    """Run the QHA with phonopy, fitting the EOS in parallel if n_workers > 1."""
+    # phonopy fits the bulk modulus at every temperature for temperature dependent
+    # electronic energies, which is only needed if they actually differ
+    if electronic_energies.ndim == 2 and np.all(
+        electronic_energies == electronic_energies[0]
+    ):
+        electronic_energies = electronic_energies[0]
+
+    if n_workers > 1 and not _is_parallel_qha_supported():
+        logger.warning(
+            f"Fitting the EOS in parallel is not supported for phonopy "
+            f"{phonopy.__version__}, fitting serially instead."
+        )
+        n_workers = 1
+
+    if n_workers <= 1:
+        return PhonopyQHA(
+            volumes=volumes,
+            electronic_energies=electronic_energies,
+            temperatures=temperatures,
+            free_energy=free_energies,
+            cv=heat_capacities,
+            entropy=entropies,
+            t_max=t_max,
+            pressure=pressure,
+            eos=eos_type,
+        )
+
+    # without temperatures, phonopy only fits the bulk modulus
+    qha = PhonopyQHA(
+        volumes=volumes,
+        electronic_energies=electronic_energies,
+        pressure=pressure,
+        eos=eos_type,
+    )
+    qha._qha = _ParallelQHA(  # noqa: SLF001
+        volumes,
+        electronic_energies,
+        temperatures,
+        heat_capacities,
+        entropies,
+        free_energies,
+        pressure=pressure,
+        eos=eos_type,
+        t_max=t_max,
+        n_workers=n_workers,
+    )
+    qha._qha.run()  # noqa: SLF001
+    return qha
+
+
+def _is_parallel_qha_supported() -> bool:
+    """Check if _ParallelQHA supports the installed phonopy version."""
+    version = tuple(int(part) for part in re.findall(r"\d+", phonopy.__version__)[:3])
+    start, end = _PARALLEL_QHA_PHONOPY_VERSIONS
+    return start <= version < end
+
+
+class _ParallelQHA(QHA):
+    """
+    Phonopy QHA that fits the equations of state in a pool of processes.
+
+    This replaces :obj:`QHA.run`, and therefore relies on the private attributes of
+    phonopy's QHA. It is only used for the phonopy versions in
+    ``_PARALLEL_QHA_PHONOPY_VERSIONS``, for which the results are tested to be
+    identical to those of :obj:`QHA.run`.
+    """
+
+    def __init__(self, *args, eos: str = "vinet", n_workers: int = 2, **kwargs) -> None:
+        super().__init__(*args, eos=eos, **kwargs)
+        self._eos_type = eos
+        self._n_workers = n_workers
+
+    def run(self, verbose: bool = False) -> None:
+        """Fit parameters to EOS at temperatures, following :obj:`QHA.run`."""
+        # one more temperature point is needed for computing e.g. beta
+        num_elems = min(
+            self._get_num_elems(self._all_temperatures) + 1,
+            len(self._all_temperatures),
+        )
+        free_energies = (
+            self._fe_phonon
+            + np.broadcast_to(self._electronic_energies, self._fe_phonon.shape)
+        )[:num_elems]
+
+        with ProcessPoolExecutor(max_workers=self._n_workers) as executor:
+            parameters = list(
+                executor.map(
+                    partial(_fit_to_eos, self._volumes, eos_type=self._eos_type),
+                    free_energies,
+                    chunksize=max(1, num_elems // (4 * self._n_workers)),
+                )
+            )
+
+        # simply omit temperatures where the fitting failed
+        fitted = [idx for idx, params in enumerate(parameters) if params is not None]
+        self._free_energies = free_energies[fitted]
+        self._temperatures = self._all_temperatures[fitted]
+        self._equiv_parameters = np.array([parameters[idx] for idx in fitted])
+        self._equiv_volumes = self._equiv_parameters[:, 3]
+        self._equiv_energies = self._equiv_parameters[:, 0]
+        self._equiv_bulk_modulus = self._equiv_parameters[:, 1] * EVAngstromToGPa
+        self._num_elems = len(self._temperatures)
+
+        self._set_thermal_expansion()
+        self._set_heat_capacity_P_numerical()
+        self._set_heat_capacity_P_polyfit()
+        self._set_gruneisen_parameter()  # To be run after thermal expansion.
+        self._len = len(self._thermal_expansions)
+
+
+def _fit_to_eos(
+    volumes: np.ndarray, free_energies: np.ndarray, eos_type: str
+) -> Optional[np.ndarray]:
+    """Fit an EOS to the free energies at one temperature, None if the fit fails."""
+    try:
+        return fit_to_eos(volumes, free_energies, get_eos(eos_type))
+    except TypeError:
+        return None
+
+
+# plot names and the keyword arguments used to set their file names
+_QHA_PLOT_FILENAME_KEYS = {
+    "helmholtz_volume": "helmholtz_volume_filename",
+    "volume_temperature": "volume_temperature_plot",
+    "thermal_expansion": "thermal_expansion_plot",
+    "gibbs_temperature": "gibbs_temperature_plot",
+    "bulk_modulus_temperature": "bulk_modulus_plot",
+    "heat_capacity_P_numerical": "heat_capacity_plot",
+    "gruneisen_temperature": "gruneisen_temperature_plot",
+}
+
+
+def _save_qha_plots(plots: dict[str, dict], qha: PhonopyQHA) -> None:
+    """Save the QHA plots, using the plot methods of phonopy."""
+    for name, plot_kwargs in plots.items():
+        getattr(qha, f"plot_{name}")().savefig(plot_kwargs["filename"])
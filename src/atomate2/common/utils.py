@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import base64
 import re
 from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from monty.serialization import loadfn
 
+from atomate2 import SETTINGS
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -125,3 +129,66 @@ def parse_additional_json(dir_name: Path) -> dict[str, Any]:
         if key not in ("custodian", "transformations", "FW"):
             additional_json[key] = loadfn(filename, cls=None)
     return additional_json
+
+
+def get_plot_policy(plot_policy: str | None = None) -> str:
+    """
+    Get the policy for making plots, defaulting to the ``PLOT_POLICY`` setting.
+
+    Parameters
+    ----------
+    plot_policy : str or None
+        One of "off" (no plots), "inline" (render the plots immediately) or
+        "deferred" (store the plot settings to render the plots later).
+
+    Returns
+    -------
+    str
+        The plot policy.
+    """
+    plot_policy = SETTINGS.PLOT_POLICY if plot_policy is None else plot_policy
+    if plot_policy not in ("off", "inline", "deferred"):
+        raise ValueError(f"Unknown {plot_policy=}")
+    return plot_policy
+
+
+def encode_array(array: np.ndarray) -> dict:
+    """
+    Encode a numpy array as base64 encoded little-endian binary data.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        The array to encode.
+
+    Returns
+    -------
+    dict
+        The dtype, shape and base64 encoded data of the array.
+    """
+    array = np.ascontiguousarray(array)
+    little_endian = array.astype(array.dtype.newbyteorder("<"), copy=False)
+    return {
+        "dtype": little_endian.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(little_endian.tobytes()).decode("ascii"),
+    }
+
+
+def decode_array(encoded: dict) -> np.ndarray:
+    """
+    Decode a numpy array encoded with :obj:`encode_array`.
+
+    Parameters
+    ----------
+    encoded : dict
+        The encoded array.
+
+    Returns
+    -------
+    np.ndarray
+        The decoded array.
+    """
+    data = base64.b64decode(encoded["data"])
+    array = np.frombuffer(data, dtype=np.dtype(encoded["dtype"]))
+    return array.reshape(encoded["shape"])
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Literal
+from dataclasses import MISSING, Field, dataclass, field, fields
+from typing import Any, Literal
 
 from atomate2 import SETTINGS
 from atomate2.common.flows.phonons import BasePhononMaker
-from atomate2.forcefields.jobs import ForceFieldRelaxMaker, ForceFieldStaticMaker
+from atomate2.forcefields.jobs import (
+    ForceFieldBatchStaticMaker,
+    ForceFieldRelaxMaker,
+    ForceFieldStaticMaker,
+)
 
 
 @dataclass
@@ -103,7 +107,9 @@ class PhononMaker(BasePhononMaker):
     store_force_constants: bool
         if True, force constants will be stored
     socket: bool
-        If True, use the socket for the calculation
+        If True, all displacements are evaluated in a single job using the same
+        loaded force field model (see :obj:`.ForceFieldBatchStaticMaker`) instead
+        of one job per displacement.
     """
 
     name: str = "phonon"
@@ -132,6 +138,37 @@ class PhononMaker(BasePhononMaker):
     code: str = "forcefields"
     born_maker: ForceFieldStaticMaker | None = None
 
+    def __post_init__(self) -> None:
+        """Use a batched displacement maker if all displacements run in one job.
+
+        All settings of the displacement maker are kept. Its name is only kept if
+        it was changed from the default.
+        """
+        maker = self.phonon_displacement_maker
+        if not self.socket or isinstance(maker, ForceFieldBatchStaticMaker):
+            return
+
+        batch_fields = {f.name for f in fields(ForceFieldBatchStaticMaker) if f.init}
+        kwargs, unsupported = {}, []
+        for maker_field in fields(maker):
+            if not maker_field.init:
+                continue
+            value = getattr(maker, maker_field.name)
+            is_default = value == _get_field_default(maker_field)
+            if maker_field.name not in batch_fields:
+                if not is_default:
+                    unsupported.append(maker_field.name)
+            elif maker_field.name != "name" or not is_default:
+                kwargs[maker_field.name] = value
+
+        if unsupported:
+            raise ValueError(
+                f"The settings {unsupported} of {type(maker).__name__} are not "
+                "supported by ForceFieldBatchStaticMaker. Set socket=False or pass "
+                "a ForceFieldBatchStaticMaker as phonon_displacement_maker."
+            )
+        self.phonon_displacement_maker = ForceFieldBatchStaticMaker(**kwargs)
+
     @property
     def prev_calc_dir_argname(self) -> None:
         """Name of argument informing static maker of previous calculation directory.
@@ -143,3 +180,10 @@ class PhononMaker(BasePhononMaker):
         calculations are performed for each ordering (relax -> static)
         """
         return
+
+
+def _get_field_default(maker_field: Field) -> Any:
+    """Get the default value of a dataclass field."""
+    if maker_field.default_factory is not MISSING:
+        return maker_field.default_factory()
+    return maker_field.default
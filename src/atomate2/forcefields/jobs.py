@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import time
 import warnings
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ase.io import Trajectory as AseTrajectory
@@ -15,12 +17,18 @@ from pymatgen.core.trajectory import Trajectory as PmgTrajectory
 
 from atomate2.ase.jobs import AseRelaxMaker
 from atomate2.forcefields import MLFF, _get_formatted_ff_name
-from atomate2.forcefields.schemas import ForceFieldTaskDocument
-from atomate2.forcefields.utils import ase_calculator, revert_default_dtype
+from atomate2.forcefields.schemas import (
+    ForceFieldBatchTaskDocument,
+    ForceFieldTaskDocument,
+)
+from atomate2.forcefields.utils import (
+    cached_ase_calculator,
+    evaluate_structures,
+    revert_default_dtype,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from pathlib import Path
 
     from ase.calculators.calculator import Calculator
     from pymatgen.core.structure import Structure
@@ -184,7 +192,7 @@ class ForceFieldRelaxMaker(AseRelaxMaker):
     @property
     def calculator(self) -> Calculator:
         """ASE calculator, can be overwritten by user."""
-        return ase_calculator(
+        return cached_ase_calculator(
             str(self.force_field_name),  # make mypy happy
             **self.calculator_kwargs,
         )
@@ -221,6 +229,70 @@ class ForceFieldStaticMaker(ForceFieldRelaxMaker):
     task_document_kwargs: dict = field(default_factory=dict)
 
 
+@dataclass
+class ForceFieldBatchStaticMaker(ForceFieldStaticMaker):
+    """
+    Maker to calculate forces of many structures in a single force field job.
+
+    All structures are evaluated in the same process using one loaded model.
+    Force fields which support batched inference (e.g., CHGNet) evaluate the
+    structures in mini-batches. This avoids the overhead of one job per structure,
+    e.g., for phonon displacement calculations.
+
+    Parameters
+    ----------
+    name : str
+        The job name.
+    force_field_name : str or .MLFF
+        The name of the force field.
+    calculator_kwargs : dict
+        Keyword arguments that will get passed to the ASE calculator.
+    batch_size : int
+        Number of structures to evaluate at once, if batching is supported.
+    """
+
+    name: str = "Force field batch static"
+    batch_size: int = 16
+
+    @job(data=["all_forces"], output_schema=ForceFieldBatchTaskDocument)
+    def make(
+        self,
+        structure: Structure | list[Structure],
+        prev_dir: str | Path | None = None,
+    ) -> ForceFieldBatchTaskDocument:
+        """
+        Calculate the energies and forces of several structures using a force field.
+
+        Parameters
+        ----------
+        structure: .Structure or list of .Structure
+            pymatgen structure or structures.
+        prev_dir : str or Path or None
+            A previous calculation directory to copy output files from. Unused, just
+                added to match the method signature of other makers.
+        """
+        if not isinstance(structure, list):
+            structure = [structure]
+
+        t_i = time.perf_counter()
+        with revert_default_dtype():
+            energies, forces = evaluate_structures(
+                self.calculator, structure, batch_size=self.batch_size
+            )
+        elapsed_time = time.perf_counter() - t_i
+        logger.info(f"Evaluated {len(structure)} structures in {elapsed_time:.2f} s")
+
+        return ForceFieldBatchTaskDocument.from_results(
+            str(self.force_field_name),  # make mypy happy
+            structure,
+            energies,
+            forces,
+            dir_name=str(Path.cwd()),
+            elapsed_time=elapsed_time,
+            tags=self.tags,
+        )
+
+
 @deprecated(
     replacement=ForceFieldRelaxMaker,
     deadline=(2025, 1, 1),
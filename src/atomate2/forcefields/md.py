@@ -16,7 +16,7 @@ from atomate2.forcefields.jobs import (
     _FORCEFIELD_DATA_OBJECTS,
 )
 from atomate2.forcefields.schemas import ForceFieldTaskDocument
-from atomate2.forcefields.utils import ase_calculator, revert_default_dtype
+from atomate2.forcefields.utils import cached_ase_calculator, revert_default_dtype
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -96,6 +96,14 @@ class ForceFieldMDMaker(AseMDMaker):
         If "xdatcar, writes a VASP-style XDATCAR
     traj_interval : int
         The step interval for saving the trajectories.
+    traj_store_dir : str | Path | None = None
+        If a str or Path, frames are streamed in chunks to an on-disk store in this
+        directory during the run, which bounds the memory required for long MD runs.
+        The task document then stores the path of the store instead of the
+        trajectory, see :obj:`.load_trajectory_store`. If None, all frames are kept
+        in memory.
+    traj_chunk_size : int = 1000
+        Number of frames kept in memory before writing them to `traj_store_dir`.
     mb_velocity_seed : int or None
         If an int, a random number seed for generating initial velocities
         from a Maxwell-Boltzmann distribution.
@@ -174,7 +182,7 @@ class ForceFieldMDMaker(AseMDMaker):
     @property
     def calculator(self) -> Calculator:
         """ASE calculator, can be overwritten by user."""
-        return ase_calculator(
+        return cached_ase_calculator(
             str(self.force_field_name),  # make mypy happy
             **self.calculator_kwargs,
         )
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
+import numpy as np
+from emmet.core.math import Vector3D
 from emmet.core.utils import ValueEnum
 from emmet.core.vasp.calculation import StoreTrajectoryOption
 from monty.dev import deprecated
-from pydantic import Field
+from pydantic import BaseModel, Field
 from pymatgen.core import Structure
 
 from atomate2.ase.schemas import AseObject, AseResult, AseStructureTaskDoc, AseTaskDoc
@@ -135,21 +137,8 @@ class ForceFieldTaskDocument(AseStructureTaskDoc):
             )
         }
 
-        # map force field name to its package name
-        model_to_pkg_map = {
-            MLFF.M3GNet: "matgl",
-            MLFF.CHGNet: "chgnet",
-            MLFF.MACE: "mace-torch",
-            MLFF.GAP: "quippy-ase",
-            MLFF.Nequip: "nequip",
-        }
-
-        if pkg_name := {str(k): v for k, v in model_to_pkg_map.items()}.get(
-            ff_kwargs["forcefield_name"]
-        ):
-            import importlib.metadata
-
-            ff_kwargs["forcefield_version"] = importlib.metadata.version(pkg_name)
+        if forcefield_version := _get_forcefield_version(ff_kwargs["forcefield_name"]):
+            ff_kwargs["forcefield_version"] = forcefield_version
 
         return cls.from_ase_task_doc(ase_task_doc, **ff_kwargs)
 
@@ -157,3 +146,96 @@ class ForceFieldTaskDocument(AseStructureTaskDoc):
     def forcefield_objects(self) -> Optional[dict[AseObject, Any]]:
         """Alias `objects` attr for backwards compatibility."""
         return self.objects
+
+
+class ForceFieldBatchOutput(BaseModel):
+    """The outputs of a batch of force field static calculations."""
+
+    energies: Optional[list[float]] = Field(
+        None, description="Total energy of each structure in units of eV."
+    )
+    all_forces: Optional[list[list[Vector3D]]] = Field(
+        None, description="The force on each atom of each structure in units of eV/A."
+    )
+    elapsed_time: Optional[float] = Field(
+        None, description="The time taken to evaluate all structures in seconds."
+    )
+
+
+class ForceFieldBatchTaskDocument(BaseModel):
+    """Document containing the results of force field evaluations on many structures."""
+
+    structures: Optional[list[Structure]] = Field(
+        None, description="The structures evaluated in this task."
+    )
+    output: Optional[ForceFieldBatchOutput] = Field(
+        None, description="The output information from this job."
+    )
+    forcefield_name: Optional[str] = Field(
+        None, description="name of the interatomic potential used."
+    )
+    forcefield_version: Optional[str] = Field(
+        "Unknown", description="version of the interatomic potential used."
+    )
+    dir_name: Optional[str] = Field(
+        None, description="Directory where the force field calculations are performed."
+    )
+    tags: Optional[list[str]] = Field(None, description="List of tags for the task.")
+
+    @classmethod
+    def from_results(
+        cls,
+        forcefield_name: str,
+        structures: list[Structure],
+        energies: list[float],
+        forces: list,
+        **task_document_kwargs,
+    ) -> ForceFieldBatchTaskDocument:
+        """Create a ForceFieldBatchTaskDocument from evaluated energies and forces.
+
+        Parameters
+        ----------
+        forcefield_name : str
+            Name of the force field used.
+        structures : list of .Structure
+            The evaluated structures.
+        energies : list of float
+            The total energy of each structure.
+        forces : list of numpy arrays
+            The forces on the atoms of each structure.
+        task_document_kwargs : dict
+            Additional keyword args passed to :obj:`.ForceFieldBatchTaskDocument()`.
+        """
+        output = ForceFieldBatchOutput(
+            energies=[float(energy) for energy in energies],
+            all_forces=[np.asarray(force).tolist() for force in forces],
+            elapsed_time=task_document_kwargs.pop("elapsed_time", None),
+        )
+        if forcefield_version := _get_forcefield_version(forcefield_name):
+            task_document_kwargs["forcefield_version"] = forcefield_version
+        return cls(
+            structures=structures,
+            output=output,
+            forcefield_name=forcefield_name,
+            **task_document_kwargs,
+        )
+
+
+def _get_forcefield_version(forcefield_name: str) -> str | None:
+    """Get the version of the package providing a force field, if known."""
+    # map force field name to its package name
+    model_to_pkg_map = {
+        MLFF.M3GNet: "matgl",
+        MLFF.CHGNet: "chgnet",
+        MLFF.MACE: "mace-torch",
+        MLFF.GAP: "quippy-ase",
+        MLFF.Nequip: "nequip",
+    }
+
+    if pkg_name := {str(k): v for k, v in model_to_pkg_map.items()}.get(
+        forcefield_name
+    ):
+        import importlib.metadata
+
+        return importlib.metadata.version(pkg_name)
+    return None
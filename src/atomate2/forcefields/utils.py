@@ -3,18 +3,28 @@
 from __future__ import annotations
 
 import json
+import logging
+import sys
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
-from monty.json import MontyDecoder
+import numpy as np
+from monty.json import MontyDecoder, jsanitize
+from pymatgen.io.ase import AseAtomsAdaptor
 
-from atomate2.forcefields import MLFF
+from atomate2 import SETTINGS
+from atomate2.forcefields import MLFF, _get_formatted_ff_name
 
 if TYPE_CHECKING:
     from collections.abc import Generator
     from typing import Any
 
     from ase.calculators.calculator import Calculator
+    from pymatgen.core import Structure
+
+logger = logging.getLogger(__name__)
 
 
 def ase_calculator(calculator_meta: str | dict, **kwargs: Any) -> Calculator | None:
@@ -93,6 +103,270 @@ def ase_calculator(calculator_meta: str | dict, **kwargs: Any) -> Calculator | N
     return calculator
 
 
+class CacheInfo(NamedTuple):
+    """Usage statistics of a :obj:`CalculatorCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    memory: int
+    max_memory: int | None
+
+
+class CalculatorCache:
+    """
+    Least recently used cache of ASE calculators.
+
+    Loading a machine learned force field (importing the backend and reading the model
+    weights) is often more expensive than evaluating it. The cache keeps the most
+    recently used calculators alive so that jobs running in the same process can
+    share them.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of calculators to keep. A value of 0 disables caching.
+    max_memory : int or None
+        Maximum memory (in bytes) occupied by the model parameters of the cached
+        calculators. Only calculators wrapping torch modules are accounted for.
+    """
+
+    def __init__(self, max_size: int = 1, max_memory: int | None = None) -> None:
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._calculators: OrderedDict[str, tuple[Calculator, int, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, calculator_meta: str | dict | MLFF, **kwargs: Any) -> Calculator:
+        """
+        Get a calculator from the cache, loading it if necessary.
+
+        Parameters
+        ----------
+        calculator_meta : str or dict
+            The calculator metadata, see :obj:`ase_calculator`.
+        **kwargs
+            Keyword arguments to pass to the calculator.
+
+        Returns
+        -------
+        ASE .Calculator
+        """
+        key = _calculator_cache_key(calculator_meta, kwargs)
+        if key is None or self.max_size < 1:
+            with self._lock:
+                self.misses += 1
+            return ase_calculator(calculator_meta, **kwargs)
+
+        with self._lock:
+            if key in self._calculators:
+                self.hits += 1
+                self._calculators.move_to_end(key)
+                calculator, _, dtype = self._calculators[key]
+                # some calculators (e.g., MACE) set the torch default dtype when
+                # loaded and rely on it during evaluation
+                if dtype is not None:
+                    import torch
+
+                    torch.set_default_dtype(dtype)
+                return calculator
+
+            self.misses += 1
+            calculator = ase_calculator(calculator_meta, **kwargs)
+            self._calculators[key] = (
+                calculator,
+                _get_calculator_memory(calculator),
+                _get_torch_default_dtype(),
+            )
+            self._evict()
+            return calculator
+
+    def _evict(self) -> None:
+        """Remove least recently used calculators until the limits are satisfied."""
+        # the most recently added calculator is always kept
+        while len(self._calculators) > 1 and (
+            len(self._calculators) > self.max_size
+            or (self.max_memory is not None and self.memory > self.max_memory)
+        ):
+            key, _ = self._calculators.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Evicted force field calculator {key} from cache")
+
+    @property
+    def memory(self) -> int:
+        """Estimated memory in bytes occupied by the cached models."""
+        return sum(memory for _, memory, _ in self._calculators.values())
+
+    def info(self) -> CacheInfo:
+        """Get the cache usage statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                size=len(self._calculators),
+                max_size=self.max_size,
+                memory=self.memory,
+                max_memory=self.max_memory,
+            )
+
+    def clear(self) -> None:
+        """Remove all calculators from the cache and reset the statistics."""
+        with self._lock:
+            self._calculators.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached calculators."""
+        return len(self._calculators)
+
+
+def _calculator_cache_key(
+    calculator_meta: str | dict | MLFF, kwargs: dict[str, Any]
+) -> str | None:
+    """
+    Get a normalized key identifying a calculator.
+
+    Returns None if the calculator kwargs cannot be serialized, in which case the
+    calculator should not be cached.
+    """
+    if isinstance(calculator_meta, str | MLFF):
+        calculator_meta = _get_formatted_ff_name(calculator_meta)
+    try:
+        return json.dumps(
+            jsanitize([calculator_meta, kwargs], strict=True, enum_values=True),
+            sort_keys=True,
+        )
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _get_torch_default_dtype() -> Any:
+    """Get the torch default dtype, if torch has been imported."""
+    if "torch" not in sys.modules:
+        return None
+    return sys.modules["torch"].get_default_dtype()
+
+
+def _get_calculator_memory(calculator: Calculator) -> int:
+    """Estimate the memory in bytes taken up by the torch modules of a calculator."""
+    try:
+        from torch.nn import Module
+    except ImportError:
+        return 0
+
+    modules = []
+    for value in vars(calculator).values():
+        candidates = value if isinstance(value, list | tuple) else [value]
+        modules.extend(module for module in candidates if isinstance(module, Module))
+        # e.g., matgl wraps the torch model in a Potential module
+        if not isinstance(value, Module) and isinstance(
+            getattr(value, "model", None), Module
+        ):
+            modules.append(value.model)
+
+    return sum(
+        tensor.numel() * tensor.element_size()
+        for module in modules
+        for tensor in (*module.parameters(), *module.buffers())
+    )
+
+
+_CALCULATOR_CACHE = CalculatorCache(
+    max_size=SETTINGS.FORCEFIELD_CALCULATOR_CACHE_SIZE,
+    max_memory=(
+        None
+        if SETTINGS.FORCEFIELD_CALCULATOR_CACHE_MAX_MEMORY is None
+        else int(SETTINGS.FORCEFIELD_CALCULATOR_CACHE_MAX_MEMORY * 1024**3)
+    ),
+)
+
+
+def cached_ase_calculator(calculator_meta: str | dict, **kwargs: Any) -> Calculator:
+    """
+    Get an ASE calculator, reusing a previously loaded one if possible.
+
+    Calculators are cached per process and identified by the calculator metadata and
+    keyword arguments. The size of the cache is controlled by the
+    ``FORCEFIELD_CALCULATOR_CACHE_SIZE`` and ``FORCEFIELD_CALCULATOR_CACHE_MAX_MEMORY``
+    settings.
+
+    Parameters
+    ----------
+    calculator_meta : str or dict
+        The calculator metadata, see :obj:`ase_calculator`.
+    kwargs : optional kwargs to pass to a calculator
+
+    Returns
+    -------
+    ASE .Calculator
+    """
+    return _CALCULATOR_CACHE.get(calculator_meta, **kwargs)
+
+
+def calculator_cache_info() -> CacheInfo:
+    """Get the hit and miss statistics of the process-wide calculator cache."""
+    return _CALCULATOR_CACHE.info()
+
+
+def clear_calculator_cache() -> None:
+    """Remove all calculators from the process-wide calculator cache."""
+    _CALCULATOR_CACHE.clear()
+
+
+def evaluate_structures(
+    calculator: Calculator, structures: list[Structure], batch_size: int = 16
+) -> tuple[list[float], list[np.ndarray]]:
+    """
+    Evaluate the energies and forces of many structures with one calculator.
+
+    Force fields which support batched inference (currently CHGNet) evaluate the
+    structures in mini-batches of ``batch_size``. For all other calculators, the
+    structures are evaluated one after another.
+
+    Parameters
+    ----------
+    calculator : ASE .Calculator
+        The calculator to use.
+    structures : list of .Structure
+        The structures to evaluate.
+    batch_size : int
+        Number of structures to evaluate at once, if batching is supported.
+
+    Returns
+    -------
+    tuple of (list of float, list of np.ndarray)
+        The total energy (in eV) and forces (in eV/A) of each structure.
+    """
+    model = getattr(calculator, "model", None)
+    if hasattr(model, "predict_structure"):
+        # CHGNet graph batching; energies are returned per atom
+        predictions = model.predict_structure(
+            structures, task="ef", batch_size=batch_size
+        )
+        if isinstance(predictions, dict):
+            predictions = [predictions]
+        energies = [
+            float(pred["e"]) * len(structure)
+            for pred, structure in zip(predictions, structures, strict=True)
+        ]
+        return energies, [np.asarray(pred["f"]) for pred in predictions]
+
+    energies, forces = [], []
+    adaptor = AseAtomsAdaptor()
+    for structure in structures:
+        atoms = adaptor.get_atoms(structure)
+        atoms.calc = calculator
+        energies.append(float(atoms.get_potential_energy()))
+        forces.append(atoms.get_forces())
+    return energies, forces
+
+
 @contextmanager
 def revert_default_dtype() -> Generator[None, None, None]:
     """Context manager for torch.default_dtype.
@@ -3,9 +3,15 @@
 import gzip
 import json
 import logging
+import struct
 import time
+import warnings
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, BinaryIO, NamedTuple, Optional, Union
 
 import numpy as np
 from emmet.core.structure import StructureMetadata
@@ -29,6 +35,7 @@ from pymatgen.io.lobster import (
     MadelungEnergies,
     SitePotential,
 )
+from pymatgen.io.vasp import Vasprun
 from typing_extensions import Self
 
 from atomate2 import __version__
@@ -46,12 +53,175 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# parsed files sent to the processes running the bonding analyses and the
+# calculation quality summary, if they have already been parsed
+_BONDING_FILES = (
+    "POSCAR",
+    "ICOHPLIST.lobster",
+    "ICOOPLIST.lobster",
+    "ICOBILIST.lobster",
+    "COHPCAR.lobster",
+    "CHARGE.lobster",
+)
+_QUALITY_FILES = ("POSCAR", "lobsterin", "lobsterout", "CHARGE.lobster")
+
 
 def zpath(pathname: Union[str, Path]) -> str:
     """Kludge to fix monty zpath bug."""
     return monty_zpath(str(pathname))
 
 
+class LobsterOutputCache:
+    """
+    Parse the output files in a LOBSTER directory at most once.
+
+    The parsed objects are shared between the task document and the LobsterPy
+    analyses. The time spent parsing each file is logged and kept in ``timings``.
+
+    Parameters
+    ----------
+    dir_name : path or str
+        The path to the folder containing the calculation outputs.
+    """
+
+    def __init__(self, dir_name: Union[str, Path]) -> None:
+        self.dir_name = Path(dir_name)
+        self.timings: dict[str, float] = {}
+        self._parsed: dict[tuple, Any] = {}
+
+    def path(self, filename: str) -> Path:
+        """Get the path of a (possibly compressed) file in the directory."""
+        return Path(zpath(str((self.dir_name / filename).as_posix())))
+
+    def structure(self) -> Optional[Structure]:
+        """Get the structure from the POSCAR."""
+        return self._parse("POSCAR", Structure.from_file)
+
+    def lobsterin(self) -> Optional[Lobsterin]:
+        """Get the lobsterin."""
+        return self._parse("lobsterin", Lobsterin.from_file)
+
+    def lobsterout(self) -> Optional[Lobsterout]:
+        """Get the lobsterout."""
+        return self._parse("lobsterout", Lobsterout)
+
+    def charge(self) -> Optional[Charge]:
+        """Get the charges from CHARGE.lobster."""
+        return self._parse("CHARGE.lobster", lambda path: Charge(filename=path))
+
+    def icohplist(
+        self,
+        filename: str = "ICOHPLIST.lobster",
+        are_coops: bool = False,
+        are_cobis: bool = False,
+    ) -> Optional[Icohplist]:
+        """Get the integrated bond properties from an ICOHPLIST/ICOOPLIST/ICOBILIST."""
+        return self._parse(
+            filename,
+            lambda path: Icohplist(
+                filename=path, are_coops=are_coops, are_cobis=are_cobis
+            ),
+            are_coops,
+            are_cobis,
+        )
+
+    def complete_cohp(
+        self,
+        filename: str = "COHPCAR.lobster",
+        are_coops: bool = False,
+        are_cobis: bool = False,
+    ) -> Optional[CompleteCohp]:
+        """Get the bond properties from a COHPCAR/COOPCAR/COBICAR."""
+        return self._parse(
+            filename,
+            lambda path: CompleteCohp.from_file(
+                fmt="LOBSTER",
+                structure_file=self.path("POSCAR"),
+                filename=path,
+                are_coops=are_coops,
+                are_cobis=are_cobis,
+            ),
+            are_coops,
+            are_cobis,
+        )
+
+    def dos(self, filename: str = "DOSCAR.lobster") -> Optional[LobsterCompleteDos]:
+        """Get the complete DOS from a DOSCAR.lobster or DOSCAR.LSO.lobster."""
+        return self._parse(
+            filename,
+            lambda path: Doscar(
+                doscar=path, structure_file=None, structure=self.structure()
+            ).completedos,
+        )
+
+    def madelung_energies(self) -> Optional[MadelungEnergies]:
+        """Get the Madelung energies from MadelungEnergies.lobster."""
+        return self._parse(
+            "MadelungEnergies.lobster", lambda path: MadelungEnergies(filename=path)
+        )
+
+    def site_potentials(self) -> Optional[SitePotential]:
+        """Get the site potentials from SitePotentials.lobster."""
+        return self._parse(
+            "SitePotentials.lobster", lambda path: SitePotential(filename=path)
+        )
+
+    def gross_populations(self) -> Optional[Grosspop]:
+        """Get the gross populations from GROSSPOP.lobster."""
+        return self._parse("GROSSPOP.lobster", lambda path: Grosspop(filename=path))
+
+    def band_overlaps(self) -> Optional[Bandoverlaps]:
+        """Get the band overlaps from bandOverlaps.lobster."""
+        return self._parse(
+            "bandOverlaps.lobster", lambda path: Bandoverlaps(filename=path)
+        )
+
+    def vasprun(self) -> Optional[Vasprun]:
+        """Get the vasprun.xml of the preceding VASP calculation."""
+        return self._parse(
+            "vasprun.xml",
+            lambda path: Vasprun(path, parse_potcar_file=False, parse_eigen=False),
+        )
+
+    def share(self, filenames: Sequence[str]) -> "LobsterOutputCache":
+        """
+        Get a new cache with the objects already parsed from some of the files.
+
+        The new cache can be sent to another process, which then does not need to
+        parse the files again. Its timings only include files parsed afterwards.
+
+        Parameters
+        ----------
+        filenames : list of str
+            The names of the files to share, as passed to the parsing methods.
+
+        Returns
+        -------
+        .LobsterOutputCache
+            A cache holding the shared parsed objects.
+        """
+        output_cache = LobsterOutputCache(self.dir_name)
+        output_cache._parsed = {  # noqa: SLF001
+            key: parsed for key, parsed in self._parsed.items() if key[0] in filenames
+        }
+        return output_cache
+
+    def _parse(self, filename: str, parser: Callable, *flags: bool) -> Any:
+        """Parse a file on first access, or get None if the file does not exist."""
+        key = (filename, *flags)
+        if key not in self._parsed:
+            path = self.path(filename)
+            parsed = None
+            if path.exists():
+                start = time.perf_counter()
+                parsed = parser(path)
+                run_time = time.perf_counter() - start
+                self.timings[path.name] = self.timings.get(path.name, 0) + run_time
+                logger.info(f"Parsed {path.name} in {run_time:.2f} s")
+            self._parsed[key] = parsed
+        return self._parsed[key]
+
+
 class LobsteroutModel(BaseModel):
     """Definition of computational settings from the LOBSTER computation."""
 
@@ -310,6 +480,7 @@ class CondensedBondingAnalysis(BaseModel):
         lobsterpy_kwargs: dict = None,
         plot_kwargs: dict = None,
         which_bonds: str = "all",
+        output_cache: LobsterOutputCache = None,
     ) -> tuple:
         """Create a task document from a directory containing LOBSTER files.
 
@@ -326,16 +497,14 @@ class CondensedBondingAnalysis(BaseModel):
             kwargs to change plotting options in lobsterpy.
         which_bonds: str.
             mode for condensed bonding analysis: "cation-anion" and "all".
+        output_cache : .LobsterOutputCache.
+            Cache of the parsed output files in the directory. Pass the same cache
+            to several analyses to parse each file only once.
         """
         plot_kwargs = plot_kwargs or {}
         lobsterpy_kwargs = lobsterpy_kwargs or {}
         dir_name = Path(dir_name)
-        cohpcar_path = Path(zpath(str((dir_name / "COHPCAR.lobster").as_posix())))
-        charge_path = Path(zpath(str((dir_name / "CHARGE.lobster").as_posix())))
-        structure_path = Path(zpath(str((dir_name / "POSCAR").as_posix())))
-        icohplist_path = Path(zpath(str((dir_name / "ICOHPLIST.lobster").as_posix())))
-        icobilist_path = Path(zpath(str((dir_name / "ICOBILIST.lobster").as_posix())))
-        icooplist_path = Path(zpath(str((dir_name / "ICOOPLIST.lobster").as_posix())))
+        output_cache = output_cache or LobsterOutputCache(dir_name)
 
         # Update lobsterpy analysis parameters with user supplied parameters
         lobsterpy_kwargs_updated = {
@@ -353,11 +522,19 @@ class CondensedBondingAnalysis(BaseModel):
 
         try:
             start = time.time()
+            are_coops = lobsterpy_kwargs_updated["are_coops"]
+            are_cobis = lobsterpy_kwargs_updated["are_cobis"]
             analyse = Analysis(
-                path_to_poscar=structure_path,
-                path_to_icohplist=icohplist_path,
-                path_to_cohpcar=cohpcar_path,
-                path_to_charge=charge_path,
+                path_to_poscar=None,
+                path_to_icohplist=None,
+                path_to_cohpcar=None,
+                icohplist_obj=output_cache.icohplist(
+                    are_coops=are_coops, are_cobis=are_cobis
+                ),
+                completecohp_obj=output_cache.complete_cohp(
+                    are_coops=are_coops, are_cobis=are_cobis
+                ),
+                charge_obj=output_cache.charge(),
                 which_bonds=which_bonds,
                 **lobsterpy_kwargs_updated,
             )
@@ -416,12 +593,7 @@ class CondensedBondingAnalysis(BaseModel):
                         fp.write(f"{line}\n")
 
             # Read in strongest icohp values
-            sb = _identify_strongest_bonds(
-                analyse=analyse,
-                icobilist_path=icobilist_path,
-                icohplist_path=icohplist_path,
-                icooplist_path=icooplist_path,
-            )
+            sb = _identify_strongest_bonds(analyse=analyse, output_cache=output_cache)
 
         except ValueError:
             return None, None, None
@@ -553,6 +725,7 @@ class CalcQualitySummary(BaseModel):
         cls,
         dir_name: Union[Path, str],
         calc_quality_kwargs: dict = None,
+        output_cache: LobsterOutputCache = None,
     ) -> Self:
         """Make a LOBSTER calculation quality summary from directory with LOBSTER files.
 
@@ -562,6 +735,8 @@ class CalcQualitySummary(BaseModel):
             The path to the folder containing the calculation outputs.
         calc_quality_kwargs : dict
             kwargs to change calc quality analysis options in lobsterpy.
+        output_cache : .LobsterOutputCache
+            Cache of the parsed output files in the directory.
 
         Returns
         -------
@@ -570,24 +745,13 @@ class CalcQualitySummary(BaseModel):
         """
         dir_name = Path(dir_name)
         calc_quality_kwargs = calc_quality_kwargs or {}
-        band_overlaps_path = Path(
-            zpath(str((dir_name / "bandOverlaps.lobster").as_posix()))
-        )
-        charge_path = Path(zpath(str((dir_name / "CHARGE.lobster").as_posix())))
-        doscar_path = Path(
-            zpath(str((dir_name / "DOSCAR.LSO.lobster").as_posix()))
-            if Path(zpath(str((dir_name / "DOSCAR.LSO.lobster").as_posix()))).exists()
-            else Path(zpath(str((dir_name / "DOSCAR.lobster").as_posix())))
-        )
-        lobsterin_path = Path(zpath(str((dir_name / "lobsterin").as_posix())))
-        lobsterout_path = Path(zpath(str((dir_name / "lobsterout").as_posix())))
+        output_cache = output_cache or LobsterOutputCache(dir_name)
+        use_lso_dos = output_cache.path("DOSCAR.LSO.lobster").exists()
         potcar_path = (
-            Path(zpath(str((dir_name / "POTCAR").as_posix())))
-            if Path(zpath(str((dir_name / "POTCAR").as_posix()))).exists()
+            output_cache.path("POTCAR")
+            if output_cache.path("POTCAR").exists()
             else None
         )
-        structure_path = Path(zpath(str((dir_name / "POSCAR").as_posix())))
-        vasprun_path = Path(zpath(str((dir_name / "vasprun.xml").as_posix())))
 
         # Update calc quality kwargs supplied by user
         calc_quality_kwargs_updated = {
@@ -597,17 +761,26 @@ class CalcQualitySummary(BaseModel):
             "bva_comp": True,
             **calc_quality_kwargs,
         }
-        cal_quality_dict = Analysis.get_lobster_calc_quality_summary(
-            path_to_poscar=structure_path,
-            path_to_vasprun=vasprun_path,
-            path_to_charge=charge_path,
-            path_to_potcar=potcar_path,
-            path_to_doscar=doscar_path,
-            path_to_lobsterin=lobsterin_path,
-            path_to_lobsterout=lobsterout_path,
-            path_to_bandoverlaps=band_overlaps_path,
-            **calc_quality_kwargs_updated,
-        )
+        dos_comparison = calc_quality_kwargs_updated["dos_comparison"]
+        with warnings.catch_warnings():
+            if use_lso_dos:
+                # lobsterpy can only tell the LSO DOS from its file name
+                warnings.filterwarnings("ignore", "Consider using DOSCAR.LSO.lobster")
+            cal_quality_dict = Analysis.get_lobster_calc_quality_summary(
+                path_to_potcar=potcar_path,
+                structure_obj=output_cache.structure(),
+                vasprun_obj=output_cache.vasprun(),
+                charge_obj=output_cache.charge(),
+                lobster_completedos_obj=output_cache.dos(
+                    "DOSCAR.LSO.lobster" if use_lso_dos else "DOSCAR.lobster"
+                )
+                if dos_comparison
+                else None,
+                lobsterin_obj=output_cache.lobsterin(),
+                lobsterout_obj=output_cache.lobsterout(),
+                bandoverlaps_obj=output_cache.band_overlaps(),
+                **calc_quality_kwargs_updated,
+            )
         return CalcQualitySummary(**cal_quality_dict)
 
 
@@ -752,6 +925,7 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
         save_cohp_plots: bool = True,
         save_cba_jsons: bool = True,
         save_computational_data_jsons: bool = False,
+        n_workers: int = 1,
     ) -> Self:
         """Create a task document from a directory containing LOBSTER files.
 
@@ -784,6 +958,11 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
         save_computational_data_jsons : bool.
             Bool to indicate whether computational data jsons
             should be saved
+        n_workers : int.
+            Number of processes used to run the lobsterpy analyses and to parse
+            the output files concurrently. The files needed by both bonding
+            analyses are parsed once and copied to their processes, so this
+            trades memory for wall time.
 
         Returns
         -------
@@ -792,169 +971,96 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
         """
         additional_fields = {} if additional_fields is None else additional_fields
         dir_name = Path(dir_name)
+        output_cache = LobsterOutputCache(dir_name)
 
         # Read in lobsterout and lobsterin
-        lobsterout_doc = Lobsterout(
-            Path(zpath(str((dir_name / "lobsterout").as_posix())))
-        ).get_doc()
-        lobster_out = LobsteroutModel(**lobsterout_doc)
-        lobster_in = LobsterinModel(
-            **Lobsterin.from_file(Path(zpath(str((dir_name / "lobsterin").as_posix()))))
-        )
+        lobster_out = LobsteroutModel(**output_cache.lobsterout().get_doc())
+        lobster_in = LobsterinModel(**output_cache.lobsterin())
 
-        icohplist_path = Path(zpath(str((dir_name / "ICOHPLIST.lobster").as_posix())))
-        icooplist_path = Path(zpath(str((dir_name / "ICOOPLIST.lobster").as_posix())))
-        icobilist_path = Path(zpath(str((dir_name / "ICOBILIST.lobster").as_posix())))
-        cohpcar_path = Path(zpath(str((dir_name / "COHPCAR.lobster").as_posix())))
-        charge_path = Path(zpath(str((dir_name / "CHARGE.lobster").as_posix())))
-        cobicar_path = Path(zpath(str((dir_name / "COBICAR.lobster").as_posix())))
-        coopcar_path = Path(zpath(str((dir_name / "COOPCAR.lobster").as_posix())))
-        doscar_path = Path(zpath(str((dir_name / "DOSCAR.lobster").as_posix())))
-        structure_path = Path(zpath(str((dir_name / "POSCAR").as_posix())))
-        madelung_energies_path = Path(
-            zpath(str((dir_name / "MadelungEnergies.lobster").as_posix()))
-        )
-        site_potentials_path = Path(
-            zpath(str((dir_name / "SitePotentials.lobster").as_posix()))
-        )
-        gross_populations_path = Path(
-            zpath(str((dir_name / "GROSSPOP.lobster").as_posix()))
-        )
-        band_overlaps_path = Path(
-            zpath(str((dir_name / "bandOverlaps.lobster").as_posix()))
-        )
-
-        icohp_list = icoop_list = icobi_list = None
-        if icohplist_path.exists():
-            icohp_list = Icohplist(filename=icohplist_path)
-        if icooplist_path.exists():
-            icoop_list = Icohplist(filename=icooplist_path, are_coops=True)
-        if icobilist_path.exists():
-            icobi_list = Icohplist(filename=icobilist_path, are_cobis=True)
+        icohp_list = output_cache.icohplist()
+        icoop_list = output_cache.icohplist("ICOOPLIST.lobster", are_coops=True)
+        icobi_list = output_cache.icohplist("ICOBILIST.lobster", are_cobis=True)
 
         # Do automatic bonding analysis with LobsterPy
-        struct = Structure.from_file(structure_path)
-
-        # will perform two condensed bonding analysis computations
-        condensed_bonding_analysis = None
-        condensed_bonding_analysis_ionic = None
-        sb_all = None
-        sb_ionic = None
-        calc_quality_summary = None
-        calc_quality_text = None
-        describe = None
-        describe_ionic = None
+        struct = output_cache.structure()
+
+        # The condensed bonding analyses, the calculation quality summary and the
+        # parsing of the remaining outputs are independent of each other and run
+        # as separate groups of tasks. Large files needed by several groups are
+        # parsed once here and the parsed objects are shared with the groups.
+        task_groups: list[_TaskGroup] = []
+        quality_tasks: dict[str, Callable] = {}
         if analyze_outputs:
             if (
-                icohplist_path.exists()
-                and cohpcar_path.exists()
-                and charge_path.exists()
+                icohp_list is not None
+                and output_cache.path("COHPCAR.lobster").exists()
+                and output_cache.path("CHARGE.lobster").exists()
             ):
-                (
-                    condensed_bonding_analysis,
-                    describe,
-                    sb_all,
-                ) = CondensedBondingAnalysis.from_directory(
-                    dir_name,
-                    save_cohp_plots=save_cohp_plots,
-                    plot_kwargs=plot_kwargs,
-                    lobsterpy_kwargs=lobsterpy_kwargs,
-                    which_bonds="all",
-                )
-                (
-                    condensed_bonding_analysis_ionic,
-                    describe_ionic,
-                    sb_ionic,
-                ) = CondensedBondingAnalysis.from_directory(
-                    dir_name,
-                    save_cohp_plots=save_cohp_plots,
-                    plot_kwargs=plot_kwargs,
-                    lobsterpy_kwargs=lobsterpy_kwargs,
-                    which_bonds="cation-anion",
-                )
+                flags = {
+                    flag: (lobsterpy_kwargs or {}).get(flag, False)
+                    for flag in ("are_coops", "are_cobis")
+                }
+                output_cache.icohplist(**flags)
+                output_cache.complete_cohp(**flags)
+                output_cache.charge()
+
+                # will perform two condensed bonding analysis computations
+                for which_bonds in ("all", "cation-anion"):
+                    task = partial(
+                        _get_condensed_bonding_analysis,
+                        save_cohp_plots=save_cohp_plots,
+                        plot_kwargs=plot_kwargs,
+                        lobsterpy_kwargs=lobsterpy_kwargs,
+                        which_bonds=which_bonds,
+                    )
+                    task_groups.append(_TaskGroup({which_bonds: task}, _BONDING_FILES))
             # Get lobster calculation quality summary data
-
-            calc_quality_summary = CalcQualitySummary.from_directory(
-                dir_name,
-                calc_quality_kwargs=calc_quality_kwargs,
+            quality_tasks["calc_quality_summary"] = partial(
+                _get_calc_quality_summary, calc_quality_kwargs=calc_quality_kwargs
             )
 
-            calc_quality_text = Description.get_calc_quality_description(
-                calc_quality_summary.model_dump()
-            )
-
-        # Read in charges
-        charges = None
-        if charge_path.exists():
-            charges = Charge(filename=charge_path)
-
-        # Read in DOS
-        dos = None
-        if doscar_path.exists():
-            doscar_lobster = Doscar(doscar=doscar_path, structure_file=structure_path)
-            dos = doscar_lobster.completedos
-
-        # Read in LSO DOS
-        lso_dos = None
-        doscar_lso_path = Path(zpath(str((dir_name / "DOSCAR.LSO.lobster").as_posix())))
-        if store_lso_dos and doscar_lso_path.exists():
-            doscar_lso_lobster = Doscar(
-                doscar=doscar_lso_path, structure_file=structure_path
+        # Read in COHPCAR, COBICAR, COOPCAR, DOS (and LSO DOS), charges, Madelung
+        # energies, site potentials, gross populations and band overlaps
+        coxxcar_kwargs = {
+            "cohp_data": {},
+            "coop_data": {"filename": "COOPCAR.lobster", "are_coops": True},
+            "cobi_data": {"filename": "COBICAR.lobster", "are_cobis": True},
+        }
+        if add_coxxcar_to_task_document or save_computational_data_jsons:
+            for field, kwargs in coxxcar_kwargs.items():
+                task = partial(_parse_lobster_output, method="complete_cohp", **kwargs)
+                filename = kwargs.get("filename", "COHPCAR.lobster")
+                task_groups.append(_TaskGroup({field: task}, (filename,)))
+        task = partial(_parse_lobster_output, method="charge")
+        task_groups.append(_TaskGroup({"charge": task}, ("CHARGE.lobster",)))
+
+        # the quality summary reads the DOS and band overlaps, so they are parsed
+        # in the same group
+        quality_tasks["dos"] = partial(_parse_lobster_output, method="dos")
+        if store_lso_dos:
+            quality_tasks["lso_dos"] = partial(
+                _parse_lobster_output, method="dos", filename="DOSCAR.LSO.lobster"
             )
-            lso_dos = doscar_lso_lobster.completedos
-
-        # Read in Madelung energies
-        madelung_energies = None
-        if madelung_energies_path.exists():
-            madelung_energies = MadelungEnergies(filename=madelung_energies_path)
-
-        # Read in Site Potentials
-        site_potentials = None
-        if site_potentials_path.exists():
-            site_potentials = SitePotential(filename=site_potentials_path)
-
-        # Read in Gross Populations
-        gross_populations = None
-        if gross_populations_path.exists():
-            gross_populations = Grosspop(filename=gross_populations_path)
-
-        # Read in Band overlaps
-        band_overlaps = None
-        if band_overlaps_path.exists():
-            band_overlaps = Bandoverlaps(filename=band_overlaps_path)
-
-        # Read in COHPCAR, COBICAR, COOPCAR
-        cohp_obj = None
-        coop_obj = None
-        cobi_obj = None
-
-        if add_coxxcar_to_task_document:
-            if cohpcar_path.exists():
-                cohp_obj = CompleteCohp.from_file(
-                    fmt="LOBSTER",
-                    structure_file=structure_path,
-                    filename=cohpcar_path,
-                    are_coops=False,
-                    are_cobis=False,
-                )
-
-            if coopcar_path.exists():
-                coop_obj = CompleteCohp.from_file(
-                    fmt="LOBSTER",
-                    structure_file=structure_path,
-                    filename=coopcar_path,
-                    are_coops=True,
-                    are_cobis=False,
-                )
-
-            if cobicar_path.exists():
-                cobi_obj = CompleteCohp.from_file(
-                    fmt="LOBSTER",
-                    structure_file=structure_path,
-                    filename=cobicar_path,
-                    are_coops=False,
-                    are_cobis=True,
-                )
+        quality_tasks["band_overlaps"] = partial(
+            _parse_lobster_output, method="band_overlaps"
+        )
+        task_groups.append(_TaskGroup(quality_tasks, _QUALITY_FILES))
+        for field in ("madelung_energies", "site_potentials", "gross_populations"):
+            task = partial(_parse_lobster_output, method=field)
+            task_groups.append(_TaskGroup({field: task}))
+
+        results = _run_lobster_tasks(task_groups, output_cache, n_workers)
+        cba, text, sb_all = results.get("all", (None, None, None))
+        cba_ionic, text_ionic, sb_ionic = results.get(
+            "cation-anion", (None, None, None)
+        )
+        calc_quality_summary, calc_quality_text = results.get(
+            "calc_quality_summary", (None, None)
+        )
+        coxxcar_data = {
+            field: results.get(field) if add_coxxcar_to_task_document else None
+            for field in coxxcar_kwargs
+        }
 
         doc = cls.from_structure(
             structure=struct,
@@ -963,29 +1069,23 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
             lobsterin=lobster_in,
             lobsterout=lobster_out,
             # include additional fields for cation-anion
-            lobsterpy_data=condensed_bonding_analysis,
-            lobsterpy_text=" ".join(describe.text) if describe is not None else None,
+            lobsterpy_data=cba,
+            lobsterpy_text=text,
             strongest_bonds=sb_all,
-            lobsterpy_data_cation_anion=condensed_bonding_analysis_ionic,
-            lobsterpy_text_cation_anion=" ".join(describe_ionic.text)
-            if describe_ionic is not None
-            else None,
+            lobsterpy_data_cation_anion=cba_ionic,
+            lobsterpy_text_cation_anion=text_ionic,
             strongest_bonds_cation_anion=sb_ionic,
             calc_quality_summary=calc_quality_summary,
-            calc_quality_text=" ".join(calc_quality_text)
-            if calc_quality_text is not None
-            else None,
-            dos=dos,
-            lso_dos=lso_dos,
-            charges=charges,
-            madelung_energies=madelung_energies,
-            site_potentials=site_potentials,
-            gross_populations=gross_populations,
-            band_overlaps=band_overlaps,
+            calc_quality_text=calc_quality_text,
+            dos=results["dos"],
+            lso_dos=results.get("lso_dos"),
+            charges=results["charge"],
+            madelung_energies=results["madelung_energies"],
+            site_potentials=results["site_potentials"],
+            gross_populations=results["gross_populations"],
+            band_overlaps=results["band_overlaps"],
             # include additional fields for all bonds
-            cohp_data=cohp_obj,
-            coop_data=coop_obj,
-            cobi_data=cobi_obj,
+            **coxxcar_data,
             icohp_list=icohp_list,
             icoop_list=icoop_list,
             icobi_list=icobi_list,
@@ -993,10 +1093,7 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
 
         if save_cba_jsons and analyze_outputs:
             cba_json_save_dir = dir_name / "cba.json.gz"
-            with gzip.open(cba_json_save_dir, "wt", encoding="UTF-8") as file:
-                # Write the json in iterable format
-                # (Necessary to load large JSON files via ijson)
-                file.write("[")
+            with _IndexedJsonWriter(cba_json_save_dir) as file:
                 if (
                     doc.lobsterpy_data_cation_anion is not None
                 ):  # check if cation-anion analysis failed
@@ -1017,8 +1114,7 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 # add all-bonds data
                 lobsterpy_analysis_type = doc.lobsterpy_data.which_bonds
                 data = {
@@ -1031,57 +1127,49 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {
                     "madelung_energies": doc.madelung_energies
                 }  # add madelung energies
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {"charges": doc.charges}  # add charges
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {
                     "calc_quality_summary": doc.calc_quality_summary
                 }  # add calc quality summary dict
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {
                     "calc_quality_text": ["".join(doc.calc_quality_text)]  # type: ignore[dict-item]
                 }  # add calc quality summary dict
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {"dos": doc.dos}  # add NON LSO of lobster
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {"lso_dos": doc.lso_dos}  # add LSO DOS of lobster
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=True, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
-                file.write(",")
+                file.write(monty_encoded_json_doc)
                 data = {"builder_meta": doc.builder_meta}  # add builder metadata
                 monty_encoded_json_doc = jsanitize(
                     data, allow_bson=False, strict=True, enum_values=True
                 )
-                json.dump(monty_encoded_json_doc, file)
+                file.write(monty_encoded_json_doc)
                 del data, monty_encoded_json_doc
-                file.write("]")
 
         if save_computational_data_jsons:
             computational_data_json_save_dir = dir_name / "computational_data.json.gz"
@@ -1097,41 +1185,10 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                 "symmetry",
             ]
             # Always add cohp, cobi and coop data to the jsons if files exists
-            if cohpcar_path.exists() and doc.cohp_data is None:
-                cohp_obj = CompleteCohp.from_file(
-                    fmt="LOBSTER",
-                    structure_file=structure_path,
-                    filename=cohpcar_path,
-                    are_coops=False,
-                    are_cobis=False,
-                )
-                doc.cohp_data = cohp_obj
-
-            if coopcar_path.exists() and doc.coop_data is None:
-                coop_obj = CompleteCohp.from_file(
-                    fmt="LOBSTER",
-                    structure_file=structure_path,
-                    filename=coopcar_path,
-                    are_coops=True,
-                    are_cobis=False,
-                )
-                doc.coop_data = coop_obj
-
-            if cobicar_path.exists() and doc.cobi_data is None:
-                cobi_obj = CompleteCohp.from_file(
-                    fmt="LOBSTER",
-                    structure_file=structure_path,
-                    filename=cobicar_path,
-                    are_coops=False,
-                    are_cobis=True,
-                )
-                doc.cobi_data = cobi_obj
-            with gzip.open(
-                computational_data_json_save_dir, "wt", encoding="UTF-8"
-            ) as file:
-                # Write the json in iterable format
-                # (Necessary to load large JSON files via ijson)
-                file.write("[")
+            for field in coxxcar_kwargs:
+                setattr(doc, field, results[field])
+
+            with _IndexedJsonWriter(computational_data_json_save_dir) as file:
                 for attribute in doc.model_fields:
                     if attribute not in fields_to_exclude:
                         # Use monty encoder to automatically convert pymatgen
@@ -1144,11 +1201,8 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                                 enum_values=True,
                             )
                         }
-                        json.dump(data, file)
-                        if attribute != list(doc.model_fields.keys())[-1]:
-                            file.write(",")  # add comma separator between two dicts
+                        file.write(data)
                         del data
-                file.write("]")
 
             # Again unset the cohp, cobi and coop data fields if not desired in the DB
             if not add_coxxcar_to_task_document:
@@ -1156,6 +1210,10 @@ class LobsterTaskDocument(StructureMetadata, extra="allow"):  # type: ignore[cal
                 doc.coop_data = None
                 doc.cobi_data = None
 
+        logger.info(
+            f"Parsed LOBSTER outputs in {dir_name} in "
+            f"{sum(output_cache.timings.values()):.2f} s"
+        )
         return doc.model_copy(update=additional_fields)
 
 
@@ -1192,11 +1250,112 @@ def _replace_inf_values(data: Union[dict[Any, Any], list[Any]]) -> None:
                 data[index] = "-Infinity"  # Replace -inf with a string representation
 
 
+def _get_condensed_bonding_analysis(
+    output_cache: LobsterOutputCache, **kwargs
+) -> tuple[Optional[CondensedBondingAnalysis], Optional[str], Optional[StrongestBonds]]:
+    """Run a condensed bonding analysis and describe it in text."""
+    cba, describe, sb = CondensedBondingAnalysis.from_directory(
+        output_cache.dir_name, output_cache=output_cache, **kwargs
+    )
+    return cba, " ".join(describe.text) if describe is not None else None, sb
+
+
+def _get_calc_quality_summary(
+    output_cache: LobsterOutputCache, **kwargs
+) -> tuple[CalcQualitySummary, str]:
+    """Summarize the calculation quality and describe it in text."""
+    calc_quality_summary = CalcQualitySummary.from_directory(
+        output_cache.dir_name, output_cache=output_cache, **kwargs
+    )
+    calc_quality_text = Description.get_calc_quality_description(
+        calc_quality_summary.model_dump()
+    )
+    return calc_quality_summary, " ".join(calc_quality_text)
+
+
+def _parse_lobster_output(
+    output_cache: LobsterOutputCache, method: str, **kwargs
+) -> Any:
+    """Parse an output file using a method of the output cache."""
+    return getattr(output_cache, method)(**kwargs)
+
+
+class _TaskGroup(NamedTuple):
+    """Tasks that run in the same process, and the parsed files shared with them."""
+
+    tasks: dict[str, Callable]
+    shared_files: tuple[str, ...] = ()
+
+
+def _run_lobster_tasks(
+    task_groups: list[_TaskGroup],
+    output_cache: LobsterOutputCache,
+    n_workers: int,
+) -> dict[str, Any]:
+    """
+    Run independent groups of analysis and parsing tasks.
+
+    The groups run concurrently if n_workers > 1. The tasks of a group run in
+    the same process and share its output cache, so files needed by several
+    tasks of a group are parsed once and objects shared between their results
+    are sent back once. The objects already parsed from the shared files of a
+    group are sent to its process, rather than parsed again.
+
+    Parameters
+    ----------
+    task_groups : list of _TaskGroup
+        The groups of tasks, each task taking the output cache as the only
+        argument.
+    output_cache : .LobsterOutputCache
+        Cache of the parsed output files, shared by all tasks if run serially.
+    n_workers : int
+        Number of processes to run the groups of tasks.
+
+    Returns
+    -------
+    dict
+        The result of each task.
+    """
+    task_groups = [group for group in task_groups if group.tasks]
+    if n_workers <= 1 or len(task_groups) <= 1:
+        return {
+            name: task(output_cache)
+            for group in task_groups
+            for name, task in group.tasks.items()
+        }
+
+    max_workers = min(n_workers, len(task_groups))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _run_with_output_cache,
+                group.tasks,
+                output_cache.share(group.shared_files),
+            )
+            for group in task_groups
+        ]
+        results = {}
+        for future in futures:
+            group_results, timings = future.result()
+            results.update(group_results)
+            for filename, run_time in timings.items():
+                output_cache.timings[filename] = (
+                    output_cache.timings.get(filename, 0) + run_time
+                )
+    return results
+
+
+def _run_with_output_cache(
+    tasks: dict[str, Callable], output_cache: LobsterOutputCache
+) -> tuple[dict[str, Any], dict]:
+    """Run a group of tasks in a worker process with their own output cache."""
+    results = {name: task(output_cache) for name, task in tasks.items()}
+    return results, output_cache.timings
+
+
 def _identify_strongest_bonds(
     analyse: Analysis,
-    icobilist_path: Path,
-    icohplist_path: Path,
-    icooplist_path: Path,
+    output_cache: LobsterOutputCache,
 ) -> StrongestBonds:
     """
     Identify the strongest bonds and convert them into StrongestBonds objects.
@@ -1205,31 +1364,25 @@ def _identify_strongest_bonds(
     ----------
     analyse : .Analysis
         Analysis object from lobsterpy automatic analysis
-    icobilist_path : Path or str
-        Path to ICOBILIST.lobster
-    icohplist_path : Path or str
-        Path to ICOHPLIST.lobster
-    icooplist_path : Path or str
-        Path to ICOOPLIST.lobster
+    output_cache : .LobsterOutputCache
+        Cache of the parsed ICOHPLIST, ICOBILIST and ICOOPLIST files.
 
     Returns
     -------
     StrongestBonds
     """
     data = [
-        (icohplist_path, False, False, "icohp"),
-        (icobilist_path, True, False, "icobi"),
-        (icooplist_path, False, True, "icoop"),
+        ("ICOHPLIST.lobster", False, False, "icohp"),
+        ("ICOBILIST.lobster", True, False, "icobi"),
+        ("ICOOPLIST.lobster", False, True, "icoop"),
     ]
     output = []
     model_data = {"which_bonds": analyse.which_bonds}
-    for file, are_cobis, are_coops, prop in data:
-        if file.exists():
-            icohplist = Icohplist(
-                filename=file,
-                are_cobis=are_cobis,
-                are_coops=are_coops,
-            )
+    for filename, are_cobis, are_coops, prop in data:
+        icohplist = output_cache.icohplist(
+            filename, are_coops=are_coops, are_cobis=are_cobis
+        )
+        if icohplist is not None:
             bond_dict = _get_strong_bonds(
                 icohplist.icohpcollection.as_dict(),
                 relevant_bonds=analyse.final_dict_bonds,
@@ -1330,13 +1483,137 @@ def _get_strong_bonds(
     return bond_dict
 
 
+# ID of the gzip extra subfields holding the position of the index of saved JSONs
+# and the index itself
+_INDEX_SUBFIELD_ID = b"AI"
+
+
+class _IndexedJsonWriter:
+    """
+    Write a JSON list of dicts as a gzip file with one gzip member per dict.
+
+    Gzip readers concatenate the members, so the file can be read as a whole by any
+    gzip and JSON reader. In addition, an extra field in the header of the first
+    member points to the last member, which holds the byte range of the member of
+    each dict key in its header. This allows reading a single key with
+    :obj:`read_saved_json` without decompressing the whole file.
+
+    Parameters
+    ----------
+    filename : path or str
+        The file to write.
+    """
+
+    def __init__(self, filename: Union[str, Path]) -> None:
+        self._file = open(filename, "wb")  # noqa: SIM115
+        self._index: dict[str, tuple[int, int]] = {}
+        # the position of the index is only known on closing, reserve space for it
+        self._write_member("[", extra=struct.pack("<Q", 0))
+
+    def write(self, data: dict) -> None:
+        """Add a dict to the JSON list."""
+        start = self._file.tell()
+        self._write_member("," if self._index else "", data)
+        self._index |= {key: (start, self._file.tell()) for key in data}
+
+    def close(self) -> None:
+        """Write the index and close the file."""
+        index_start = self._file.tell()
+        index = json.dumps(self._index).encode()
+        if len(index) > _MAX_GZIP_SUBFIELD_LENGTH:
+            # too many keys for the index, the file can still be read in full
+            self._write_member("]")
+        else:
+            self._write_member("]", extra=index)
+            self._file.seek(_INDEX_POSITION_OFFSET)
+            self._file.write(struct.pack("<Q", index_start))
+        self._file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _write_member(
+        self, prefix: str, data: Optional[dict] = None, extra: bytes = b""
+    ) -> None:
+        """Write a gzip member with a prefix and a JSON dump of some data."""
+        member = _GzipMemberWriter(self._file, extra=extra)
+        member.write(prefix)
+        if data is not None:
+            json.dump(data, member)
+        member.close()
+
+
+class _GzipMemberWriter:
+    """Text writer of a single gzip member, with an optional index subfield."""
+
+    def __init__(self, file: BinaryIO, extra: bytes = b"") -> None:
+        self._file = file
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._crc = self._size = 0
+        # magic number, deflate, flags, no modification time and unknown OS
+        flags = 4 if extra else 0  # FEXTRA
+        file.write(b"\x1f\x8b\x08" + bytes([flags]) + bytes(4) + b"\x00\xff")
+        if extra:
+            subfield = _INDEX_SUBFIELD_ID + struct.pack("<H", len(extra)) + extra
+            file.write(struct.pack("<H", len(subfield)) + subfield)
+
+    def write(self, text: str) -> int:
+        """Compress and write text."""
+        chunk = text.encode()
+        self._crc = zlib.crc32(chunk, self._crc)
+        self._size += len(chunk)
+        self._file.write(self._compressor.compress(chunk))
+        return len(text)
+
+    def close(self) -> None:
+        """Finish the member."""
+        self._file.write(self._compressor.flush())
+        self._file.write(struct.pack("<II", self._crc, self._size & 0xFFFFFFFF))
+
+
+# gzip header (10 bytes), extra field length (2 bytes) and subfield header (4 bytes)
+_INDEX_POSITION_OFFSET = 16
+_MAX_GZIP_SUBFIELD_LENGTH = 65531
+
+
+def _read_index(file: BinaryIO) -> Optional[dict[str, list[int]]]:
+    """Read the index of a saved JSON, or None if it was written without index."""
+    position = _read_index_subfield(file, 0)
+    if position is None or len(position) != 8:
+        return None
+    (index_start,) = struct.unpack("<Q", position)
+    index = _read_index_subfield(file, index_start) if index_start else None
+    return json.loads(index) if index is not None else None
+
+
+def _read_index_subfield(file: BinaryIO, offset: int) -> Optional[bytes]:
+    """Read the index subfield of the gzip member header at an offset."""
+    file.seek(offset)
+    header = file.read(12)
+    if len(header) < 12 or header[:3] != b"\x1f\x8b\x08" or not header[3] & 4:
+        return None
+    (extra_length,) = struct.unpack("<H", header[10:])
+    extra = file.read(extra_length)
+    while len(extra) >= 4:
+        (length,) = struct.unpack("<H", extra[2:4])
+        if extra[:2] == _INDEX_SUBFIELD_ID:
+            return extra[4 : 4 + length]
+        extra = extra[4 + length :]
+    return None
+
+
 def read_saved_json(
     filename: str, pymatgen_objs: bool = True, query: str = "structure"
 ) -> dict[str, Any]:
     r"""
     Read the data from  \*.json.gz files corresponding to query.
 
-    Uses ijson to parse specific keys(memory efficient)
+    Files written by atomate2 with an index are read by decompressing only the
+    part of the file holding the queried field. Other files are streamed using ijson
+    to parse specific keys (memory efficient).
 
     Parameters
     ----------
@@ -1352,19 +1629,30 @@ def read_saved_json(
     dict
         Returns a dictionary with lobster task json data corresponding to query.
     """
-    with gzip.open(filename, "rb") as file:
-        lobster_data = {
-            field: data
-            for obj in ijson.items(file, "item", use_float=True)
-            for field, data in obj.items()
-            if query is None or query in obj
-        }
-        if not lobster_data:
-            raise ValueError(
-                "Please recheck the query argument. "
-                f"No data associated to the requested 'query={query}' "
-                f"found in the JSON file"
-            )
+    with open(filename, "rb") as file:
+        index = _read_index(file)
+        if index is not None:
+            lobster_data = {}
+            byte_ranges = index.values() if query is None else [index.get(query)]
+            for start, end in sorted({tuple(rng) for rng in byte_ranges if rng}):
+                file.seek(start)
+                member = zlib.decompress(file.read(end - start), wbits=31)
+                lobster_data |= json.loads(member.lstrip(b","))
+        else:
+            file.seek(0)
+            with gzip.open(file, "rb") as gzip_file:
+                lobster_data = {
+                    field: data
+                    for obj in ijson.items(gzip_file, "item", use_float=True)
+                    for field, data in obj.items()
+                    if query is None or query in obj
+                }
+    if not lobster_data:
+        raise ValueError(
+            "Please recheck the query argument. "
+            f"No data associated to the requested 'query={query}' "
+            f"found in the JSON file"
+        )
     if pymatgen_objs:
         for query_key, value in lobster_data.items():
             if isinstance(value, dict):
@@ -29,13 +29,28 @@ def _get_calcs_reversed(job: Job | Flow) -> list[Calculation | list]:
 
 
 def _flatten_calcs(nested_calcs: list) -> list[Calculation]:
-    """Flattening nested calcs."""
+    """Flatten nested calcs of jobs in order into reversed calcs.
+
+    The calcs of a single job are already reversed and are kept in order.
+    """
+    if not any(isinstance(item, list) for item in nested_calcs):
+        return list(nested_calcs)
     flattened = []
-    for item in nested_calcs:
-        if isinstance(item, list):
-            flattened.extend(_flatten_calcs(item))
+    for item in reversed(nested_calcs):
+        flattened.extend(_flatten_calcs(item))
+    return flattened
+
+
+def _flatten_makers(
+    makers: list[BaseOpenMMMaker | OpenMMFlowMaker],
+) -> list[BaseOpenMMMaker]:
+    """Unwrap the makers of nested OpenMMFlowMakers."""
+    flattened = []
+    for maker in makers:
+        if isinstance(maker, OpenMMFlowMaker):
+            flattened.extend(_flatten_makers(maker.makers))
         else:
-            flattened.append(item)
+            flattened.append(maker)
     return flattened
 
 
@@ -54,9 +69,7 @@ def collect_outputs(
 
     # this must be done here because we cannot unwrap the calcs
     # when they are an output reference
-    calcs = _flatten_calcs(calcs_reversed)
-    calcs.reverse()
-    task_doc.calcs_reversed = calcs
+    task_doc.calcs_reversed = _flatten_calcs(calcs_reversed)
     task_doc.tags = tags
     task_doc.job_uuids = job_uuids
     task_doc.task_type = task_type
@@ -67,12 +80,71 @@ def collect_outputs(
     return Response(output=task_doc)
 
 
+@openmm_job
+def run_single_context(
+    makers: list[BaseOpenMMMaker],
+    interchange: Interchange | OpenMMInterchange | str | None,
+    prev_dir: str | None = None,
+    store_interchange: bool = True,
+    continue_from_state: bool = False,
+) -> Response:
+    """Run the stages of several OpenMM makers on a single simulation.
+
+    The simulation is created once by the first maker. Each following maker
+    copies the settings of its integrator onto the existing one and runs its
+    stage on the same context, adding its own reporters. The output task
+    document contains one calculation per stage.
+    """
+    dir_name = Path.cwd()
+
+    prev_task = makers[0]._load_prev_task(prev_dir)  # noqa: SLF001
+    sim, interchange, serialized_system = makers[0]._setup_simulation(  # noqa: SLF001
+        interchange, prev_dir, prev_task, continue_from_state=continue_from_state
+    )
+
+    calcs_reversed: list[Calculation] = []
+    for i, maker in enumerate(makers):
+        if i > 0:
+            maker._update_integrator(sim, prev_task)  # noqa: SLF001
+        elapsed_time = maker._run_stage(sim, dir_name, prev_task)  # noqa: SLF001
+
+        stage_interchange, structure = None, None
+        if i == len(makers) - 1:
+            stage_interchange, structure = maker._finalize_simulation(  # noqa: SLF001
+                sim,
+                dir_name,
+                interchange,
+                serialized_system,
+                prev_task,
+                store_interchange=store_interchange,
+            )
+
+        task_doc = maker._create_task_doc(  # noqa: SLF001
+            stage_interchange, structure, elapsed_time, dir_name, prev_task
+        )
+        maker._remove_reporters(sim)  # noqa: SLF001
+
+        # the following stages resolve their attributes from this task document
+        calcs_reversed = task_doc.calcs_reversed + calcs_reversed
+        task_doc.calcs_reversed = calcs_reversed
+        prev_task = task_doc
+    del sim
+
+    with open(dir_name / "taskdoc.json", "w") as file:
+        json.dump(task_doc.model_dump(), file, cls=MontyEncoder)
+
+    return Response(output=task_doc)
+
+
 @dataclass
 class OpenMMFlowMaker(Maker):
     """Run a production simulation.
 
     This flexible flow links together any flows of OpenMM jobs in
-    a linear sequence.
+    a linear sequence. The jobs hand the simulation state to each other
+    through binary files in their output directories, so the interchange
+    is only read by the first job. It is passed to the last job to be updated
+    with the final state and stored.
 
     Attributes
     ----------
@@ -85,6 +157,11 @@ class OpenMMFlowMaker(Maker):
     collect_outputs : bool
         If True, a final job is added that collects all jobs into a single
         task document.
+    single_context : bool
+        If True, the stages of all makers, including those of nested flows,
+        are run in a single job on one OpenMM context, rather than creating a
+        new simulation for each job. The task document still contains one
+        calculation per stage.
     """
 
     name: str = "flexible"
@@ -92,11 +169,14 @@ class OpenMMFlowMaker(Maker):
     makers: list[BaseOpenMMMaker | OpenMMFlowMaker] = field(default_factory=list)
     collect_outputs: bool = True
     final_task_type: str = "collect"
+    single_context: bool = False
 
     def make(
         self,
-        interchange: Interchange | OpenMMInterchange | str,
+        interchange: Interchange | OpenMMInterchange | str | None,
         prev_dir: str | None = None,
+        store_interchange: bool = True,
+        continue_from_state: bool = False,
     ) -> Flow:
         """Run the production simulation using the provided Interchange object.
 
@@ -109,6 +189,12 @@ class OpenMMFlowMaker(Maker):
             The directory of the previous task.
         output_dir : Optional[Union[str, Path]]
             The directory to write reporter files to.
+        store_interchange : bool
+            Whether the last job should store the interchange, updated
+            with the final state of the simulation, in its task document.
+        continue_from_state : bool
+            Whether the first job should continue from the state in
+            ``prev_dir`` even if an interchange is given.
 
         Returns
         -------
@@ -121,21 +207,43 @@ class OpenMMFlowMaker(Maker):
         jobs: list = []
         job_uuids: list = []
         calcs_reversed = []
-        for maker in self.makers:
-            job = maker.make(
-                interchange=interchange,
+        if self.single_context:
+            job = run_single_context(
+                _flatten_makers(self.makers),
+                interchange,
                 prev_dir=prev_dir,
+                store_interchange=store_interchange,
+                continue_from_state=continue_from_state,
             )
-            interchange = job.output.interchange
+            job.name = self.name
             prev_dir = job.output.dir_name
             jobs.append(job)
-
-            # collect the uuids and calcs for the final collect job
-            if isinstance(job, Flow):
-                job_uuids.extend(job.job_uuids)
-            else:
-                job_uuids.append(job.uuid)
+            job_uuids.append(job.uuid)
             calcs_reversed.append(_get_calcs_reversed(job))
+        else:
+            for i, maker in enumerate(self.makers):
+                is_last = i == len(self.makers) - 1
+                # the following jobs continue from the state of the previous
+                # job, the last one only updates and stores the interchange
+                job = maker.make(
+                    interchange=(
+                        interchange
+                        if i == 0 or (is_last and store_interchange)
+                        else None
+                    ),
+                    prev_dir=prev_dir,
+                    store_interchange=is_last and store_interchange,
+                    continue_from_state=continue_from_state or i > 0,
+                )
+                prev_dir = job.output.dir_name
+                jobs.append(job)
+
+                # collect the uuids and calcs for the final collect job
+                if isinstance(job, Flow):
+                    job_uuids.extend(job.job_uuids)
+                else:
+                    job_uuids.append(job.uuid)
+                calcs_reversed.append(_get_calcs_reversed(job))
 
         if self.collect_outputs:
             collect_job = collect_outputs(
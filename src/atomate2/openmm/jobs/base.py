@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import copy
+import io
 import json
 import time
 import warnings
@@ -11,6 +12,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NoReturn
 
+import numpy as np
 from emmet.core.openmm import (
     Calculation,
     CalculationInput,
@@ -22,8 +24,8 @@ from jobflow import Maker, Response, job
 from mdareporter.mdareporter import MDAReporter
 from monty.json import MontyDecoder, MontyEncoder
 from openmm import Integrator, LangevinMiddleIntegrator, Platform, XmlSerializer
-from openmm.app import StateDataReporter
-from openmm.unit import angstrom, kelvin, picoseconds
+from openmm.app import PDBFile, Simulation, StateDataReporter
+from openmm.unit import angstrom, kelvin, nanometer, picoseconds
 from pymatgen.core import Structure
 
 from atomate2.openmm.utils import increment_name, task_reports
@@ -31,8 +33,6 @@ from atomate2.openmm.utils import increment_name, task_reports
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-    from openmm.app.simulation import Simulation
-
 
 try:
     # so we can load OpenMM Interchange created by openmmml
@@ -72,6 +72,9 @@ OPENMM_MAKER_DEFAULTS = {
     "save_structure": False,
 }
 
+# file used to hand the simulation state from one OpenMM job to the next
+OPENMM_STATE_FILE = "openmm_state.npz"
+
 
 def openmm_job(method: Callable) -> job:
     """Decorate the ``make`` method of ClassicalMD job makers.
@@ -187,8 +190,10 @@ class BaseOpenMMMaker(Maker):
     @openmm_job
     def make(
         self,
-        interchange: Interchange | OpenMMInterchange | str,
+        interchange: Interchange | OpenMMInterchange | str | None,
         prev_dir: str | None = None,
+        store_interchange: bool = True,
+        continue_from_state: bool = False,
     ) -> Response:
         """Run an OpenMM calculation.
 
@@ -196,50 +201,59 @@ class BaseOpenMMMaker(Maker):
         on the specific job logic defined in run_openmm, and closes the
         simulation. It returns a response containing the output task document.
 
+        Every job writes the final state of the simulation, together with the
+        serialized OpenMM system and topology, to a binary file in its directory.
+        If ``interchange`` is None or ``continue_from_state`` is True, the
+        simulation continues from the file in ``prev_dir``. The given interchange
+        is then only updated with the final state and stored, otherwise an
+        OpenMMInterchange of the final state is stored.
+
         Parameters
         ----------
-        interchange : Union[Interchange, OpenMMInterchange, str]
+        interchange : Union[Interchange, OpenMMInterchange, str, None]
             An Interchange object, OpenMMInterchange object or byte encoded equivalent.
-        prev_task : Optional[str]
+            If None, the simulation continues from the state of the previous OpenMM
+            job in ``prev_dir``.
+        prev_dir : Optional[str]
             The directory of the previous task.
+        store_interchange : bool
+            Whether to store the interchange, updated with the final state of the
+            simulation, in the task document. Chained jobs only need to store it in
+            the last job.
+        continue_from_state : bool
+            Whether to continue from the state of the previous OpenMM job in
+            ``prev_dir`` even if an interchange is given. Chained jobs use this to
+            pass the original interchange to the last job for storage only.
 
         Returns
         -------
         Response
             A response object containing the output task document.
         """
-        if prev_dir:
-            with open(Path(prev_dir) / "taskdoc.json") as file:
-                task_dict = json.load(file, cls=MontyDecoder)
-                prev_task = OpenMMTaskDocument.model_validate(task_dict)
-        else:
-            prev_task = None
-
-        interchange = self._load_interchange(interchange)
+        prev_task = self._load_prev_task(prev_dir)
 
         dir_name = Path.cwd()
 
-        sim = self._create_simulation(interchange, prev_task)
-
-        self._add_reporters(sim, dir_name, prev_task)
-
-        # Run the simulation
-        start = time.time()
-        self.run_openmm(sim, dir_name)
-        elapsed_time = time.time() - start
+        sim, interchange, serialized_system = self._setup_simulation(
+            interchange, prev_dir, prev_task, continue_from_state=continue_from_state
+        )
 
-        self._update_interchange(interchange, sim, prev_task)
+        elapsed_time = self._run_stage(sim, dir_name, prev_task)
 
-        structure = self._create_structure(sim, prev_task)
+        interchange, structure = self._finalize_simulation(
+            sim,
+            dir_name,
+            interchange,
+            serialized_system,
+            prev_task,
+            store_interchange=store_interchange,
+        )
 
         task_doc = self._create_task_doc(
             interchange, structure, elapsed_time, dir_name, prev_task
         )
 
-        # leaving the MDAReporter makes the builders fail
-        for _ in range(len(sim.reporters)):
-            reporter = sim.reporters.pop()
-            del reporter
+        self._remove_reporters(sim)
         del sim
 
         # write out task_doc json to output dir
@@ -248,6 +262,155 @@ class BaseOpenMMMaker(Maker):
 
         return Response(output=task_doc)
 
+    def _load_prev_task(self, prev_dir: str | None) -> OpenMMTaskDocument | None:
+        """Load the task document of the previous job.
+
+        Parameters
+        ----------
+        prev_dir : Optional[str]
+            The directory of the previous task.
+
+        Returns
+        -------
+        Optional[OpenMMTaskDocument]
+            The previous task document, None if there is no previous directory.
+        """
+        if not prev_dir:
+            return None
+        with open(Path(prev_dir) / "taskdoc.json") as file:
+            task_dict = json.load(file, cls=MontyDecoder)
+            return OpenMMTaskDocument.model_validate(task_dict)
+
+    def _setup_simulation(
+        self,
+        interchange: Interchange | OpenMMInterchange | str | None,
+        prev_dir: str | None = None,
+        prev_task: OpenMMTaskDocument | None = None,
+        continue_from_state: bool = False,
+    ) -> tuple[
+        Simulation, Interchange | OpenMMInterchange | None, dict[str, str] | None
+    ]:
+        """Create the OpenMM simulation for this maker.
+
+        The simulation is created from the interchange if one is given, otherwise,
+        or if ``continue_from_state`` is True, it continues from the state written
+        by the previous job in ``prev_dir``.
+
+        Parameters
+        ----------
+        interchange : Union[Interchange, OpenMMInterchange, str, None]
+            An Interchange object, OpenMMInterchange object or byte encoded equivalent.
+        prev_dir : Optional[str]
+            The directory of the previous task.
+        prev_task : Optional[OpenMMTaskDocument]
+            The previous task document.
+        continue_from_state : bool
+            Whether to continue from the state in ``prev_dir`` even if an
+            interchange is given.
+
+        Returns
+        -------
+        tuple[Simulation, Union[Interchange, OpenMMInterchange, None], dict]
+            The created OpenMM simulation object, the loaded interchange and, if the
+            simulation was created from a state, the serialized system and topology.
+        """
+        if interchange is not None:
+            interchange = self._load_interchange(interchange)
+            if not continue_from_state:
+                sim = self._create_simulation(interchange, prev_task)
+                return sim, interchange, None
+
+        if not prev_dir or not (Path(prev_dir) / OPENMM_STATE_FILE).exists():
+            raise ValueError(
+                "prev_dir must contain the state of a previous OpenMM job if no "
+                "interchange is given or continue_from_state is True."
+            )
+        sim, serialized_system = self._create_simulation_from_state(
+            Path(prev_dir) / OPENMM_STATE_FILE, prev_task
+        )
+        return sim, interchange, serialized_system
+
+    def _run_stage(
+        self,
+        sim: Simulation,
+        dir_name: Path,
+        prev_task: OpenMMTaskDocument | None = None,
+    ) -> float:
+        """Add the reporters of this maker and run the simulation.
+
+        Parameters
+        ----------
+        sim : Simulation
+            The OpenMM simulation object.
+        dir_name : Path
+            The directory to save the reporter output files.
+        prev_task : Optional[OpenMMTaskDocument]
+            The previous task document.
+
+        Returns
+        -------
+        float
+            The elapsed time of the simulation.
+        """
+        self._add_reporters(sim, dir_name, prev_task)
+
+        start = time.time()
+        self.run_openmm(sim, dir_name)
+        return time.time() - start
+
+    def _finalize_simulation(
+        self,
+        sim: Simulation,
+        dir_name: Path,
+        interchange: Interchange | OpenMMInterchange | None = None,
+        serialized_system: dict[str, str] | None = None,
+        prev_task: OpenMMTaskDocument | None = None,
+        store_interchange: bool = True,
+    ) -> tuple[Interchange | OpenMMInterchange | None, Structure | None]:
+        """Write the final state of the simulation and collect its outputs.
+
+        Parameters
+        ----------
+        sim : Simulation
+            The OpenMM simulation object.
+        dir_name : Path
+            The directory to write the state to.
+        interchange : Optional[Union[Interchange, OpenMMInterchange]]
+            The interchange to update and store. If None, an OpenMMInterchange is
+            created from the serialized system.
+        serialized_system : Optional[dict[str, str]]
+            The serialized system and topology, if the simulation was created
+            from a state.
+        prev_task : Optional[OpenMMTaskDocument]
+            The previous task document.
+        store_interchange : bool
+            Whether to return the interchange updated with the final state.
+
+        Returns
+        -------
+        tuple[Optional[Interchange], Optional[Structure]]
+            The updated interchange, None if it should not be stored, and the
+            final structure.
+        """
+        serialized_system = self._write_state(sim, dir_name, serialized_system)
+
+        if not store_interchange:
+            interchange = None
+        else:
+            if interchange is None:
+                interchange = OpenMMInterchange(**serialized_system)
+            self._update_interchange(interchange, sim, prev_task)
+
+        return interchange, self._create_structure(sim, prev_task)
+
+    @staticmethod
+    def _remove_reporters(sim: Simulation) -> None:
+        """Remove all reporters from the OpenMM simulation."""
+        # leaving the MDAReporter makes the builders fail
+        for _ in range(len(sim.reporters)):
+            reporter = sim.reporters.pop()
+            del reporter
+
     def _load_interchange(
         self, interchange: Interchange | OpenMMInterchange | str
     ) -> Interchange | OpenMMInterchange:
@@ -494,6 +657,149 @@ class BaseOpenMMMaker(Maker):
             platformProperties=platform_properties,
         )
 
+    def _update_integrator(
+        self,
+        sim: Simulation,
+        prev_task: OpenMMTaskDocument | None = None,
+    ) -> None:
+        """Update the integrator of an existing simulation for this maker.
+
+        The integrator of a context cannot be replaced, so the settings of the
+        integrator from :obj:`_create_integrator` are copied onto it instead.
+
+        Parameters
+        ----------
+        sim : Simulation
+            The OpenMM simulation object.
+        prev_task : Optional[OpenMMTaskDocument]
+            The previous task document.
+        """
+        integrator = self._create_integrator(prev_task)
+        if type(integrator) is not type(sim.integrator):
+            raise TypeError(
+                f"Cannot replace the {type(sim.integrator).__name__} of an existing "
+                f"simulation with a {type(integrator).__name__}."
+            )
+
+        sim.integrator.setStepSize(integrator.getStepSize())
+        if isinstance(integrator, LangevinMiddleIntegrator):
+            sim.integrator.setTemperature(integrator.getTemperature())
+            sim.integrator.setFriction(integrator.getFriction())
+
+    def _create_simulation_from_state(
+        self,
+        state_file: Path,
+        prev_task: OpenMMTaskDocument | None = None,
+    ) -> tuple[Simulation, dict[str, str]]:
+        """Create an OpenMM simulation from the state written by a previous job.
+
+        Parameters
+        ----------
+        state_file : Path
+            The state file written by :obj:`_write_state`.
+        prev_task : Optional[OpenMMTaskDocument]
+            The previous task document.
+
+        Returns
+        -------
+        tuple[Simulation, dict[str, str]]
+            The created OpenMM simulation object and the serialized system and
+            topology.
+        """
+        with np.load(state_file) as state:
+            serialized_system = {
+                key: state[key].tobytes().decode() for key in ("system", "topology")
+            }
+            system = XmlSerializer.deserialize(serialized_system["system"])
+            with io.StringIO(serialized_system["topology"]) as file:
+                topology = PDBFile(file).getTopology()
+
+            platform = Platform.getPlatformByName(
+                self._resolve_attr("platform_name", prev_task)
+            )
+            sim = Simulation(
+                topology,
+                system,
+                self._create_integrator(prev_task),
+                platform,
+                self._resolve_attr("platform_properties", prev_task),
+            )
+
+            context = sim.context
+            context.setTime(float(state["time"]) * picoseconds)
+            context.setStepCount(int(state["step_count"]))
+            context.setPeriodicBoxVectors(*(vec * nanometer for vec in state["box"]))
+            context.setPositions(state["positions"] * nanometer)
+            context.setVelocities(state["velocities"] * nanometer / picoseconds)
+            # forces added during a stage, e.g. a barostat, leave their parameters
+            # in the state after they are removed from the system
+            system_parameters = context.getParameters()
+            for name, value in json.loads(str(state["parameters"])).items():
+                if name in system_parameters:
+                    context.setParameter(name, value)
+        return sim, serialized_system
+
+    def _write_state(
+        self,
+        sim: Simulation,
+        dir_name: Path,
+        serialized_system: dict[str, str] | None = None,
+    ) -> dict[str, str]:
+        """Write the state of the simulation for the next job.
+
+        The positions, velocities and box vectors are written to a binary file,
+        together with the serialized system and topology, so that the next job
+        only needs this directory. The system and topology do not change between
+        jobs and are only serialized if the simulation was not created from the
+        state of a previous job.
+
+        Parameters
+        ----------
+        sim : Simulation
+            The OpenMM simulation object.
+        dir_name : Path
+            The directory to write the state to.
+        serialized_system : Optional[dict[str, str]]
+            The serialized system and topology, if the simulation was created from
+            the state of a previous job.
+
+        Returns
+        -------
+        dict[str, str]
+            The serialized system and topology.
+        """
+        if serialized_system is None:
+            with io.StringIO() as file:
+                PDBFile.writeFile(
+                    sim.topology, np.zeros((sim.topology.getNumAtoms(), 3)), file
+                )
+                topology = file.getvalue()
+            serialized_system = {
+                "system": XmlSerializer.serialize(sim.system),
+                "topology": topology,
+            }
+
+        state = sim.context.getState(
+            getPositions=True, getVelocities=True, getParameters=True
+        )
+        np.savez(
+            dir_name / OPENMM_STATE_FILE,
+            positions=state.getPositions(asNumpy=True).value_in_unit(nanometer),
+            velocities=state.getVelocities(asNumpy=True).value_in_unit(
+                nanometer / picoseconds
+            ),
+            box=state.getPeriodicBoxVectors(asNumpy=True).value_in_unit(nanometer),
+            time=state.getTime().value_in_unit(picoseconds),
+            step_count=state.getStepCount(),
+            parameters=json.dumps(dict(state.getParameters())),
+            # stored as bytes, numpy strings use four bytes per character
+            **{
+                key: np.frombuffer(value.encode(), dtype=np.uint8)
+                for key, value in serialized_system.items()
+            },
+        )
+        return serialized_system
+
     def _update_interchange(
         self,
         interchange: Interchange | OpenMMInterchange,
@@ -559,7 +865,7 @@ class BaseOpenMMMaker(Maker):
 
     def _create_task_doc(
         self,
-        interchange: Interchange | OpenMMInterchange,
+        interchange: Interchange | OpenMMInterchange | None,
         structure: Structure | None,
         elapsed_time: float | None = None,
         dir_name: Path | None = None,
@@ -572,8 +878,8 @@ class BaseOpenMMMaker(Maker):
 
         Parameters
         ----------
-        interchange : Interchange
-            The updated Interchange object.
+        interchange : Optional[Interchange]
+            The updated Interchange object, None if it should not be stored.
         structure : Structure
             The final structure of the simulation.
         elapsed_time : Optional[float]
@@ -613,7 +919,9 @@ class BaseOpenMMMaker(Maker):
 
         prev_task = prev_task or OpenMMTaskDocument()
 
-        if isinstance(interchange, Interchange):
+        if interchange is None:
+            interchange_json = None
+        elif isinstance(interchange, Interchange):
             interchange_json = interchange.json()
         else:
             interchange_json = interchange.model_dump_json()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import warnings
 from pathlib import Path
 from typing import Any, Literal, Optional, Union
@@ -36,6 +37,13 @@ class Atomate2Settings(BaseSettings):
     SYMPREC: float = Field(
         0.1, description="Symmetry precision for spglib symmetry finding."
     )
+    PLOT_POLICY: Literal["off", "inline", "deferred"] = Field(
+        "inline",
+        description="How the plots of phonon, Grueneisen and QHA results are made. "
+        "'off' skips plotting, 'inline' renders the plots in the job and 'deferred' "
+        "stores the plot settings in the output document so that the plots can be "
+        "rendered later with the render_plots job or the `atm plot` command.",
+    )
     BANDGAP_TOL: float = Field(
         1e-4,
         description="Tolerance for determining if a material is a semiconductor or "
@@ -44,6 +52,24 @@ class Atomate2Settings(BaseSettings):
     CUSTODIAN_SCRATCH_DIR: Optional[str] = Field(
         None, description="Path to scratch directory used by custodian."
     )
+    GZIP_N_THREADS: int = Field(
+        default_factory=lambda: min(4, os.cpu_count() or 1),
+        description="Number of threads used to gzip and gunzip files. Multiple files "
+        "are processed concurrently, a single large file is compressed in parallel "
+        "blocks.",
+    )
+    SSH_POOL_MAX_SIZE: int = Field(
+        0,
+        description="Maximum number of SSH connections kept open in the process-wide "
+        "connection pool shared by file operations on remote hosts. Pooling is "
+        "disabled by default, in which case a new connection is opened for every "
+        "file operation. Set to a positive number to enable pooling.",
+    )
+    SSH_POOL_IDLE_TIMEOUT: float = Field(
+        300,
+        description="Time in seconds after which unused pooled SSH connections are "
+        "closed.",
+    )
 
     # VASP specific settings
     VASP_CMD: str = Field(
@@ -184,6 +210,19 @@ class Atomate2Settings(BaseSettings):
         "aims.x > aims.out", description="The default command used run FHI-aims"
     )
 
+    # Forcefield settings
+    FORCEFIELD_CALCULATOR_CACHE_SIZE: int = Field(
+        1,
+        description="Maximum number of force field calculators kept loaded in memory "
+        "and reused between jobs running in the same process. Set to 0 to disable "
+        "caching and load the model for every job.",
+    )
+    FORCEFIELD_CALCULATOR_CACHE_MAX_MEMORY: Optional[float] = Field(
+        None,
+        description="Maximum memory in GB occupied by the parameters of cached force "
+        "field models. Least recently used calculators are evicted once exceeded.",
+    )
+
     # Elastic constant settings
     ELASTIC_FITTING_METHOD: str = Field(
         "finite_difference", description="Elastic constant fitting method"
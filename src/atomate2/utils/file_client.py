@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import atexit
 import errno
+import gzip
+import logging
 import os
+import shlex
 import shutil
 import stat
+import threading
+import time
 import warnings
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from glob import glob
 from gzip import GzipFile
@@ -17,10 +26,16 @@ import paramiko
 from monty.io import zopen
 from paramiko import SFTPClient, SSHClient
 
+from atomate2 import SETTINGS
+
 if TYPE_CHECKING:
     from collections.abc import Callable
     from types import TracebackType
 
+logger = logging.getLogger(__name__)
+
+_COPY_BUFFER_SIZE = 2**20
+
 
 class FileClient:
     """
@@ -40,15 +55,21 @@ class FileClient:
         Path to private key file (for remote connections only).
     config_filename : str or Path
         Path to OpenSSH config file defining host connection settings.
+    pool : .SSHConnectionPool or None
+        A pool to borrow connections from. Borrowed connections are returned to the
+        pool, rather than closed, when the client is closed. If ``None``, the client
+        opens and closes its own connections.
     """
 
     def __init__(
         self,
         key_filename: str | Path = "~/.ssh/id_rsa",
         config_filename: str | Path = "~/.ssh/config",
+        pool: SSHConnectionPool | None = None,
     ) -> None:
         self.key_filename = key_filename
         self.config_filename = config_filename
+        self.pool = pool
 
         self.connections: dict[str, dict[str, Any]] = {}
 
@@ -67,15 +88,13 @@ class FileClient:
         if host in self.connections:
             return
 
-        if "@" in host:
-            username, hostname = host.split("@", 1)
-        else:
-            username = None  # paramiko sets default username
-            hostname = host
+        if self.pool is not None:
+            self.connections[host] = self.pool.acquire(
+                host, self.key_filename, self.config_filename
+            )
+            return
 
-        ssh = get_ssh_connection(
-            username, hostname, self.key_filename, self.config_filename
-        )
+        ssh = _connect_host(host, self.key_filename, self.config_filename)
         self.connections[host] = {"ssh": ssh, "sftp": ssh.open_sftp()}
 
     def get_ssh(self, host: str) -> SSHClient:
@@ -211,6 +230,47 @@ class FileClient:
         path = str(self.abspath(path, host=host))
         return [Path(p) for p in self.get_sftp(host).listdir(path)]
 
+    def list_files(self, path: str | Path, host: str | None = None) -> dict[Path, int]:
+        """Get the regular files in a directory and their sizes.
+
+        Unlike :obj:`listdir` followed by :obj:`is_file`, this only requires a single
+        request to a remote host, plus one request per symbolic link. Symbolic links
+        are followed, and links that do not point to a regular file are skipped.
+
+        Parameters
+        ----------
+        path : str or Path
+            Full path to the directory.
+        host : str or None
+            A remote file system host on which to perform file operations.
+
+        Returns
+        -------
+        dict of Path to int
+            The filenames (relative to the directory) and sizes in bytes.
+        """
+        if host is None:
+            with os.scandir(path) as entries:
+                return {
+                    Path(entry.name): entry.stat().st_size
+                    for entry in entries
+                    if entry.is_file()
+                }
+
+        sftp = self.get_sftp(host)
+        files = {}
+        for attr in sftp.listdir_attr(str(path)):
+            filename = attr.filename
+            if stat.S_ISLNK(attr.st_mode):
+                # listdir_attr does not follow symbolic links
+                try:
+                    attr = sftp.stat(f"{path}/{filename}")  # noqa: PLW2901
+                except OSError:
+                    continue
+            if stat.S_ISREG(attr.st_mode):
+                files[Path(filename)] = attr.st_size
+        return files
+
     def copy(
         self,
         src_filename: str | Path,
@@ -257,6 +317,62 @@ class FileClient:
                 "Copying between two different remote hosts is not supported."
             )
 
+    def copy_many(
+        self,
+        filenames: dict[Path, Path],
+        src_host: str | None = None,
+        max_workers: int = 4,
+        compress: bool = False,
+    ) -> None:
+        """
+        Copy many files to the local machine concurrently.
+
+        For remote sources, each worker opens its own SFTP channel on the shared
+        SSH connection, such that several transfers are in flight at the same time.
+        Unlike :obj:`copy`, the paths are not resolved on the remote host and must
+        already be absolute.
+
+        Parameters
+        ----------
+        filenames : dict of Path to Path
+            Mapping of absolute source paths to absolute local destination paths.
+        src_host : str or None
+            A remote file system host for the source files.
+        max_workers : int
+            Maximum number of files to copy at the same time.
+        compress : bool
+            Whether to gzip remote files on the fly during the transfer, and
+            decompress them locally. Files that are already gzipped are transferred
+            as is. Useful for slow connections.
+        """
+        channels: list[SFTPClient] = []
+        if src_host is None:
+            copy_func = shutil.copy2
+        else:
+            ssh = self.get_ssh(src_host)
+            local = threading.local()
+
+            def copy_func(src_filename: Path, dest_filename: Path) -> None:
+                if compress and not src_filename.name.lower().endswith("gz"):
+                    _copy_compressed(ssh, src_filename, dest_filename)
+                    return
+                if not hasattr(local, "sftp"):
+                    local.sftp = ssh.open_sftp()
+                    channels.append(local.sftp)
+                local.sftp.get(str(src_filename), str(dest_filename))
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = [
+                    executor.submit(copy_func, src, dest)
+                    for src, dest in filenames.items()
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            for channel in channels:
+                channel.close()
+
     def link(
         self,
         src_filename: str | Path,
@@ -375,6 +491,8 @@ class FileClient:
         host: str | None = None,
         compresslevel: int = 6,
         force: bool | str = False,
+        n_threads: int = 1,
+        block_size: int = 2**23,
     ) -> None:
         """
         Gzip a file.
@@ -394,6 +512,13 @@ class FileClient:
             - `"force"` or `True`: Overwrite gzipped file if it already exists.
             - `"raise"` or `False`: Raise an error if file already exists.
             - `"skip"` Skip file if it already exists.
+        n_threads : int
+            Number of threads used to compress local files larger than
+            ``block_size``. The file is split into blocks that are compressed in
+            parallel and written as consecutive gzip members, which can be read by
+            any standard gunzip implementation.
+        block_size : int
+            Size of the blocks in bytes when compressing with multiple threads.
         """
         path = self.abspath(path, host=host)
         path_gz = path.parent / f"{path.name}.gz"
@@ -423,13 +548,18 @@ class FileClient:
                 )
 
         if host is None:
-            with (
-                open(path, "rb") as f_in,
-                GzipFile(path_gz, "wb", compresslevel=compresslevel) as f_out,
-            ):
-                shutil.copyfileobj(f_in, f_out)
+            t_i = time.perf_counter()
+            if n_threads > 1 and path.stat().st_size > block_size:
+                _parallel_gzip(path, path_gz, compresslevel, n_threads, block_size)
+            else:
+                with (
+                    open(path, "rb") as f_in,
+                    GzipFile(path_gz, "wb", compresslevel=compresslevel) as f_out,
+                ):
+                    shutil.copyfileobj(f_in, f_out)
             shutil.copystat(path, path_gz)
             path.unlink()
+            logger.info(f"Gzipped {path} in {time.perf_counter() - t_i:.2f} s")
         else:
             ssh = self.get_ssh(host)
             _, _stdout, _ = ssh.exec_command(f"gzip -f {path!s}")
@@ -481,18 +611,23 @@ class FileClient:
                 )
 
         if host is None:
+            t_i = time.perf_counter()
             with open(path_nongz, "wb") as f_out, zopen(path, "rb") as f_in:
-                f_out.writelines(f_in)
+                shutil.copyfileobj(f_in, f_out, _COPY_BUFFER_SIZE)
             path.unlink()
+            logger.info(f"Gunzipped {path} in {time.perf_counter() - t_i:.2f} s")
         else:
             ssh = self.get_ssh(host)
             _stdin, _stdout, _stderr = ssh.exec_command(f"gunzip -f {path!s}")
 
     def close(self) -> None:
-        """Close all connections."""
+        """Close all connections, or return them to the pool if one is used."""
         for connection in self.connections.values():
-            connection["ssh"].close()
-            connection["sftp"].close()
+            if self.pool is not None:
+                self.pool.release(connection)
+            else:
+                connection["ssh"].close()
+                connection["sftp"].close()
         self.connections = {}
 
     def __enter__(self) -> FileClient:  # noqa: PYI034
@@ -509,6 +644,258 @@ class FileClient:
         self.close()
 
 
+class SSHConnectionPool:
+    """
+    Pool of keep-alive SSH connections shared by file clients.
+
+    Connections are keyed by host and credentials and are reused across file clients
+    in the same process, avoiding a new SSH handshake for every file operation. Every
+    borrower opens its own SFTP channel on the shared SSH transport, so concurrent
+    borrowers never share an SFTP session. Each connection is health checked before it
+    is handed out and reopened if it has been dropped. Connections that have not been
+    used for ``idle_timeout`` seconds are closed, and the least recently used idle
+    connections are closed whenever the pool grows beyond ``max_size``.
+
+    Connections are not shared with forked child processes; the pool of a child
+    process starts out empty.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of connections to keep open. Connections that are still in use
+        are never closed, so the pool may temporarily exceed this size.
+    idle_timeout : float
+        Time in seconds after which unused connections are closed.
+    keepalive : int
+        Interval in seconds at which keep-alive packets are sent on open connections.
+        Set to 0 to disable keep-alive packets.
+    """
+
+    def __init__(
+        self, max_size: int = 8, idle_timeout: float = 300, keepalive: int = 30
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.keepalive = keepalive
+
+        self._connections: dict[tuple, dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def acquire(
+        self,
+        host: str,
+        key_filename: str | Path = "~/.ssh/id_rsa",
+        config_filename: str | Path = "~/.ssh/config",
+    ) -> dict[str, Any]:
+        """
+        Borrow a connection to a host, opening one if necessary.
+
+        Parameters
+        ----------
+        host : str
+            A remote host filesystem. The host can be specified as either
+            "username@remote_host" or just "remote_host".
+        key_filename : str or Path
+            Path to private key file.
+        config_filename : str or Path
+            Path to OpenSSH config file defining host connection settings.
+
+        Returns
+        -------
+        dict
+            The connection, with "ssh" and "sftp" keys. The SFTP channel belongs to
+            the borrower. The connection should be handed back with :obj:`release`
+            once finished with.
+        """
+        key = (host, str(key_filename), str(config_filename))
+        with self._lock:
+            self._prune()
+            connection = self._connections.get(key)
+            if connection is not None and not _is_alive(connection):
+                logger.info(f"Reconnecting to {host} as the connection was dropped")
+                self._connections.pop(key)
+                if connection["_in_use"] == 0:
+                    connection["ssh"].close()
+                connection = None
+
+            if connection is None:
+                ssh = _connect_host(host, key_filename, config_filename)
+                transport = ssh.get_transport()
+                if self.keepalive and transport is not None:
+                    transport.set_keepalive(self.keepalive)
+                connection = {"ssh": ssh, "_pool_key": key, "_pid": os.getpid()}
+                connection["_in_use"] = 0
+                self._connections[key] = connection
+
+            connection["_in_use"] += 1
+            connection["_last_used"] = time.monotonic()
+            self._prune()
+
+        try:
+            sftp = connection["ssh"].open_sftp()
+        except Exception:
+            self._release(connection)
+            raise
+        return {"ssh": connection["ssh"], "sftp": sftp, "_pooled": connection}
+
+    def release(self, connection: dict[str, Any]) -> None:
+        """
+        Hand back a connection borrowed with :obj:`acquire`.
+
+        The SFTP channel of the borrower is closed, the SSH connection is kept open
+        for reuse.
+
+        Parameters
+        ----------
+        connection : dict
+            The connection to release.
+        """
+        pooled = connection["_pooled"]
+        if pooled["_pid"] != os.getpid():
+            # borrowed before a fork, the socket belongs to the parent process
+            return
+        connection["sftp"].close()
+        self._release(pooled)
+
+    def clear(self) -> None:
+        """Close all connections that are not in use."""
+        with self._lock:
+            for key, connection in list(self._connections.items()):
+                if connection["_in_use"] == 0:
+                    self._connections.pop(key)["ssh"].close()
+
+    def _release(self, connection: dict[str, Any]) -> None:
+        """Decrease the number of borrowers of a pooled connection."""
+        with self._lock:
+            connection["_in_use"] = max(0, connection["_in_use"] - 1)
+            connection["_last_used"] = time.monotonic()
+            if self._connections.get(connection["_pool_key"]) is not connection:
+                # connection was replaced while borrowed
+                if connection["_in_use"] == 0:
+                    connection["ssh"].close()
+                return
+            self._prune()
+
+    def _prune(self) -> None:
+        """Close idle and dropped connections, then enforce the maximum size."""
+        now = time.monotonic()
+        idle = sorted(
+            (c for c in self._connections.values() if c["_in_use"] == 0),
+            key=lambda c: c["_last_used"],
+        )
+        n_excess = len(self._connections) - self.max_size
+        for connection in idle:
+            expired = now - connection["_last_used"] > self.idle_timeout
+            if expired or n_excess > 0 or not _is_alive(connection):
+                self._connections.pop(connection["_pool_key"])["ssh"].close()
+                n_excess -= 1
+
+    def _reset_after_fork(self) -> None:
+        """
+        Forget all connections in a forked child process.
+
+        The connections are not closed, as their sockets are shared with the parent
+        process.
+        """
+        self._connections = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Get the number of open connections."""
+        return len(self._connections)
+
+
+def _is_alive(connection: dict[str, Any]) -> bool:
+    """Check whether the SSH transport of a connection is still usable."""
+    transport = connection["ssh"].get_transport()
+    return transport is not None and transport.is_active()
+
+
+_CONNECTION_POOL = SSHConnectionPool(
+    max_size=SETTINGS.SSH_POOL_MAX_SIZE, idle_timeout=SETTINGS.SSH_POOL_IDLE_TIMEOUT
+)
+atexit.register(_CONNECTION_POOL.clear)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_CONNECTION_POOL._reset_after_fork)  # noqa: SLF001
+
+
+def get_connection_pool() -> SSHConnectionPool | None:
+    """
+    Get the process-wide SSH connection pool.
+
+    Returns
+    -------
+    .SSHConnectionPool or None
+        The pool, or ``None`` if pooling has not been enabled through the
+        ``SSH_POOL_MAX_SIZE`` setting.
+    """
+    return _CONNECTION_POOL if _CONNECTION_POOL.max_size > 0 else None
+
+
+def _parallel_gzip(
+    path: Path,
+    path_gz: Path,
+    compresslevel: int,
+    n_threads: int,
+    block_size: int,
+) -> None:
+    """
+    Gzip a file by compressing blocks of the file in parallel.
+
+    Each block is compressed to an independent gzip member. The members are
+    concatenated into a multi-member gzip file (RFC 1952), which any standard
+    gunzip can read. Unlike the output of ``pigz``, which is a single member, the
+    result differs from that of a serial gzip. zlib releases the GIL while
+    compressing, so threads give a real speed-up. At most ``2 * n_threads``
+    blocks are held in memory at any one time.
+    """
+    mtime = int(path.stat().st_mtime)
+    pending: deque = deque()
+    with (
+        open(path, "rb") as f_in,
+        open(path_gz, "wb") as f_out,
+        ThreadPoolExecutor(max_workers=n_threads) as executor,
+    ):
+        while block := f_in.read(block_size):
+            pending.append(
+                executor.submit(gzip.compress, block, compresslevel, mtime=mtime)
+            )
+            if len(pending) >= 2 * n_threads:
+                f_out.write(pending.popleft().result())
+        while pending:
+            f_out.write(pending.popleft().result())
+
+
+def _copy_compressed(ssh: SSHClient, src_filename: Path, dest_filename: Path) -> None:
+    """Stream a remote file gzipped through ssh and decompress it locally."""
+    _, stdout, stderr = ssh.exec_command(f"gzip -c -1 {shlex.quote(str(src_filename))}")
+    decompressor = zlib.decompressobj(wbits=31)
+    with open(dest_filename, "wb") as f_out:
+        while chunk := stdout.read(_COPY_BUFFER_SIZE):
+            f_out.write(decompressor.decompress(chunk))
+        f_out.write(decompressor.flush())
+
+    if stdout.channel.recv_exit_status() != 0:
+        Path(dest_filename).unlink(missing_ok=True)
+        error = stderr.read().decode()
+        if "No such file" in error:
+            raise FileNotFoundError(f"{src_filename} does not exist: {error}")
+        raise OSError(f"Compressed copy of {src_filename} failed: {error}")
+
+
+def _connect_host(
+    host: str, key_filename: str | Path, config_filename: str | Path
+) -> SSHClient:
+    """Open an SSH connection to a host given as "username@remote_host"."""
+    if "@" in host:
+        username, hostname = host.split("@", 1)
+    else:
+        username = None  # paramiko sets default username
+        hostname = host
+
+    return get_ssh_connection(username, hostname, key_filename, config_filename)
+
+
 def get_ssh_connection(
     username: str | None,
     hostname: str,
@@ -567,7 +954,10 @@ def auto_fileclient(method: Callable | None = None) -> Callable:
     This decorator should only be applied to functions with a ``file_client`` keyword
     argument. If a custom file client is not supplied when the function is called, it
     will automatically create a new FileClient, add it to the function arguments and
-    close the file client connects at the end of the function.
+    close the file client connects at the end of the function. If enabled through the
+    ``SSH_POOL_MAX_SIZE`` setting, the file client borrows connections from the
+    process-wide :obj:`SSHConnectionPool`, such that subsequent calls reuse the same
+    SSH connections.
 
     Parameters
     ----------
@@ -581,7 +971,7 @@ def auto_fileclient(method: Callable | None = None) -> Callable:
         def gen_file_client(*args, **kwargs) -> Any:
             file_client = kwargs.get("file_client")
             if file_client is None:
-                with FileClient() as file_client:
+                with FileClient(pool=get_connection_pool()) as file_client:
                     kwargs["file_client"] = file_client
                     return func(*args, **kwargs)
             else:
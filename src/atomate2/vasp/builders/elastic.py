@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
-from itertools import chain
+import logging
+from collections import defaultdict
+from functools import partial
+from itertools import chain, product
 from typing import TYPE_CHECKING
 
 import numpy as np
+from emmet.core.utils import jsanitize
 from maggma.builders import Builder
+from monty.json import MontyDecoder
 from pydash import get
 from pymatgen.analysis.elasticity import Deformation, Stress
 
 from atomate2 import SETTINGS
+from atomate2.common.builders.utils import (
+    get_source_timestamp,
+    get_updated_formulas,
+    run_in_process_pool,
+)
 from atomate2.common.schemas.elastic import ElasticDocument
 
 if TYPE_CHECKING:
@@ -18,6 +28,13 @@ if TYPE_CHECKING:
 
     from maggma.core import Store
 
+# relative tolerance used by np.allclose
+_ALLCLOSE_RTOL = 1e-5
+# width of the buckets used to group deformations, in multiples of the tolerance
+_BUCKET_SCALE = 1000
+# maximum number of dimensions along which neighbouring buckets are searched
+_MAX_EDGE_DIMENSIONS = 8
+
 
 class ElasticBuilder(Builder):
     """
@@ -47,6 +64,11 @@ class ElasticBuilder(Builder):
         - "pseudoinverse"
     structure_match_tol : float
         Numerical tolerance for structure equivalence.
+    incremental : bool
+        Only rebuild formulas with tasks that were added or updated since the
+        elasticity documents were last built. If False, all formulas are rebuilt.
+    n_workers : int
+        Number of processes used to process items when calling :obj:`run`.
     **kwargs
         Keyword arguments that will be passed to the Builder init.
     """
@@ -59,6 +81,8 @@ class ElasticBuilder(Builder):
         symprec: float = SETTINGS.SYMPREC,
         fitting_method: str = SETTINGS.ELASTIC_FITTING_METHOD,
         structure_match_tol: float = 1e-5,
+        incremental: bool = False,
+        n_workers: int = 1,
         **kwargs,
     ) -> None:
         self.tasks = tasks
@@ -68,6 +92,8 @@ class ElasticBuilder(Builder):
         self.symprec = symprec
         self.fitting_method = fitting_method
         self.structure_match_tol = structure_match_tol
+        self.incremental = incremental
+        self.n_workers = n_workers
 
         super().__init__(sources=[tasks], targets=[elasticity], **kwargs)
 
@@ -76,6 +102,8 @@ class ElasticBuilder(Builder):
         self.tasks.ensure_index("output.formula_pretty")
         self.tasks.ensure_index("last_updated")
         self.elasticity.ensure_index("fitting_data.uuids.0")
+        self.elasticity.ensure_index("fitting_data_uuid")
+        self.elasticity.ensure_index("formula_pretty")
         self.elasticity.ensure_index("last_updated")
 
     def get_items(self) -> Generator:
@@ -103,8 +131,14 @@ class ElasticBuilder(Builder):
             "output.output.stress",
             "output.formula_pretty",
             "output.dir_name",
+            self.tasks.last_updated_field,
         ]
 
+        if self.incremental:
+            formulas = get_updated_formulas(self.tasks, self.elasticity, qry)
+            self.logger.info(f"Found {len(formulas)} formulas with updated tasks")
+            qry["output.formula_pretty"] = {"$in": formulas}
+
         self.logger.info("Starting aggregation")
         n_formulas = len(self.tasks.distinct("output.formula_pretty", criteria=qry))
         results = self.tasks.groupby(
@@ -115,9 +149,9 @@ class ElasticBuilder(Builder):
         for idx, (keys, docs) in enumerate(results):
             formula = keys["output"]["formula_pretty"]
             self.logger.debug(f"Getting {formula} ({idx + 1} of {n_formulas})")
-            yield docs
+            yield MontyDecoder().process_decoded(docs)
 
-    def process_item(self, tasks: list[dict]) -> list[ElasticDocument]:
+    def process_item(self, tasks: list[dict]) -> list[dict]:
         """
         Process deformation tasks into elasticity documents.
 
@@ -131,48 +165,118 @@ class ElasticBuilder(Builder):
 
         Returns
         -------
-        list of .ElasticDocument
-            A list of elastic documents for each unique parent structure.
+        list of dict
+            A list of serialized elastic documents for each unique parent structure,
+            stamped with the last updated time of their deformation tasks.
         """
-        self.logger.debug(f"Processing {tasks[0]['output']['formula_pretty']}")
-
         if not tasks:
             return []
 
-        # group deformations by parent structure
-        grouped = _group_deformations(tasks, self.structure_match_tol)
-
-        elastic_docs = []
-        for group in grouped:
-            elastic_doc = _get_elastic_document(
-                group, self.symprec, self.fitting_method
-            )
-            elastic_docs.append(elastic_doc)
-
-        return elastic_docs
+        self.logger.debug(f"Processing {tasks[0]['output']['formula_pretty']}")
+        return _process_tasks(
+            tasks,
+            self.structure_match_tol,
+            self.symprec,
+            self.fitting_method,
+            self.tasks.last_updated_field,
+            self.elasticity.last_updated_field,
+        )
 
-    def update_targets(self, items: list[ElasticDocument]) -> None:
+    def update_targets(self, items: list[list[dict]]) -> None:
         """
         Insert new elastic documents into the elasticity store.
 
         Parameters
         ----------
-        items : list of .ElasticDocument
-            A list of elasticity documents.
+        items : list of list of dict
+            The serialized elasticity documents for each processed formula.
         """
-        _items = chain.from_iterable(filter(bool, items))
-
-        if len(list(_items)) > 0:
-            self.logger.info(f"Updating {len(list(_items))} elastic documents")
-            self.elasticity.update(_items, key="fitting_data.uuids.0")
+        docs = list(chain.from_iterable(filter(bool, items)))
+
+        if len(docs) > 0:
+            self.logger.info(f"Updating {len(docs)} elastic documents")
+            # documents built before fitting_data_uuid was added are only identified
+            # by the uuid of their first deformation; replace them, not duplicate them
+            self.elasticity.remove_docs(
+                {
+                    "fitting_data_uuid": {"$exists": False},
+                    "fitting_data.uuids.0": {
+                        "$in": [doc["fitting_data_uuid"] for doc in docs]
+                    },
+                }
+            )
+            self.elasticity.update(docs, key="fitting_data_uuid")
         else:
             self.logger.info("No items to update")
 
+    def run(self, log_level: int = logging.DEBUG) -> None:
+        """
+        Run the builder.
+
+        If ``n_workers`` is greater than 1, items are processed across a pool of
+        processes and the elasticity store is updated after every chunk of items.
+
+        Parameters
+        ----------
+        log_level : int
+            Logging level used when running serially.
+        """
+        if self.n_workers <= 1:
+            super().run(log_level=log_level)
+            return
+
+        process_func = partial(
+            _process_tasks,
+            tol=self.structure_match_tol,
+            symprec=self.symprec,
+            fitting_method=self.fitting_method,
+            tasks_last_updated_field=self.tasks.last_updated_field,
+            last_updated_field=self.elasticity.last_updated_field,
+        )
+        run_in_process_pool(self, process_func, self.n_workers)
+
+
+def _process_tasks(
+    tasks: list[dict],
+    tol: float,
+    symprec: float,
+    fitting_method: str,
+    tasks_last_updated_field: str = "last_updated",
+    last_updated_field: str = "last_updated",
+) -> list[dict]:
+    """Group deformation tasks of one formula and create their elastic documents."""
+    if not tasks:
+        return []
+
+    # group deformations by parent structure
+    docs = []
+    for group in _group_deformations(tasks, tol):
+        doc = _get_elastic_document(group, symprec, fitting_method)
+        # stores can only update on top-level keys, so the uuid of the first
+        # deformation task, which identifies the document, is copied to the top level
+        docs.append(
+            jsanitize(doc.model_dump(), allow_bson=True)
+            | {
+                "fitting_data_uuid": doc.fitting_data.uuids[0],
+                last_updated_field: get_source_timestamp(
+                    group, tasks_last_updated_field
+                ),
+            }
+        )
+    return docs
+
 
 def _group_deformations(tasks: list[dict], tol: float) -> list[list[dict]]:
     """
     Group deformation tasks by their parent structure.
 
+    To avoid comparing each task against every group, the groups are indexed by their
+    species and by their lattice matrix and fractional coordinates, quantized into
+    buckets much wider than ``tol``. Structures that match within ``tol`` can only
+    fall in a neighbouring bucket along the dimensions where they lie close to a
+    bucket edge, so only the groups in those buckets need to be compared. Tasks are
+    added to the first group (in order of creation) that matches.
+
     Parameters
     ----------
     tasks : list of dict
@@ -185,17 +289,39 @@ def _group_deformations(tasks: list[dict], tol: float) -> list[list[dict]]:
     list of list of dict
         The tasks grouped by their parent (undeformed structure).
     """
-    grouped_tasks = [[tasks[0]]]
-
-    for task in tasks[1:]:
-        orig_structure = get(task, "output.transformations.history.0.input_structure")
-
-        match = False
-        for group in grouped_tasks:
-            group_orig_structure = get(
-                group[0], "output.transformations.history.0.input_structure"
+    structures = [
+        get(task, "output.transformations.history.0.input_structure") for task in tasks
+    ]
+
+    # np.allclose also applies a relative tolerance, so the buckets must be at least
+    # as wide as the largest allowed difference
+    max_value = max(
+        max(np.abs(structure.lattice.matrix).max(), np.abs(structure.frac_coords).max())
+        for structure in structures
+    )
+    width = tol + _ALLCLOSE_RTOL * max_value
+
+    buckets: dict[tuple, list[int]] = defaultdict(list)
+    species_groups: dict[tuple, list[int]] = defaultdict(list)
+    grouped_tasks: list[list[dict]] = []
+    group_structures = []
+    for task, orig_structure in zip(tasks, structures, strict=True):
+        species = tuple(site.species_string for site in orig_structure)
+        values = np.concatenate(
+            [orig_structure.lattice.matrix.ravel(), orig_structure.frac_coords.ravel()]
+        )
+        keys = _get_bucket_keys(values, width)
+        if keys is None:
+            # too close to too many bucket edges, compare against all candidates
+            candidates = species_groups[species]
+        else:
+            candidates = sorted(
+                idx for key in keys for idx in buckets.get((species, key), [])
             )
 
+        for idx in candidates:
+            group_orig_structure = group_structures[idx]
+
             # strict but fast structure matching, the structures should be identical
             lattice_match = np.allclose(
                 orig_structure.lattice.matrix,
@@ -206,17 +332,49 @@ def _group_deformations(tasks: list[dict], tol: float) -> list[list[dict]]:
                 orig_structure.frac_coords, group_orig_structure.frac_coords, atol=tol
             )
             if lattice_match and coords_match:
-                group.append(task)
-                match = True
+                grouped_tasks[idx].append(task)
                 break
-
-        if not match:
+        else:
             # no match; start a new group
+            key = np.floor(_scale_to_buckets(values, width)).astype(int).tobytes()
+            buckets[(species, key)].append(len(grouped_tasks))
+            species_groups[species].append(len(grouped_tasks))
             grouped_tasks.append([task])
+            group_structures.append(orig_structure)
 
     return grouped_tasks
 
 
+def _get_bucket_keys(values: np.ndarray, width: float) -> list[bytes] | None:
+    """
+    Get the keys of all buckets that may hold values matching within ``width``.
+
+    Returns ``None`` if the values lie close to the edges of too many buckets.
+    """
+    scaled = _scale_to_buckets(values, width)
+    key = np.floor(scaled).astype(int)
+    offset = scaled - key
+    near_lower = offset < 1 / _BUCKET_SCALE
+    near_upper = offset > 1 - 1 / _BUCKET_SCALE
+    near_edge = np.flatnonzero(near_lower | near_upper)
+    if len(near_edge) > _MAX_EDGE_DIMENSIONS:
+        return None
+
+    directions = np.where(near_lower[near_edge], -1, 1)
+    keys = []
+    for shifts in product((0, 1), repeat=len(near_edge)):
+        shifted = key.copy()
+        shifted[near_edge] += directions * np.array(shifts, dtype=int)
+        keys.append(shifted.tobytes())
+    return keys
+
+
+def _scale_to_buckets(values: np.ndarray, width: float) -> np.ndarray:
+    """Scale values to bucket units, with zero in the middle of a bucket."""
+    # common values such as zero would otherwise always lie on a bucket edge
+    return values / (width * _BUCKET_SCALE) + 0.5
+
+
 def _get_elastic_document(
     tasks: list[dict],
     symprec: float,
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 import logging
+import math
 import re
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+from monty.io import zopen
+
 from atomate2 import SETTINGS
 from atomate2.common.files import copy_files, get_zfile, gunzip_files, rename_files
 from atomate2.utils.file_client import FileClient, auto_fileclient
@@ -91,6 +96,7 @@ def copy_vasp_outputs(
         src_host=src_host,
         include_files=required_files + optional_files,
         file_client=file_client,
+        bulk=src_host is not None,
     )
 
     gunzip_files(
@@ -202,3 +208,54 @@ def write_vasp_input_set(
 
     logger.info("Writing VASP input set.")
     vis.write_input(directory, **kwargs)
+
+
+def get_planar_averaged_locpot(filename: str | Path) -> dict[int, list[float]]:
+    """
+    Get the planar averages of a LOCPOT file along the three lattice vectors.
+
+    The potential is read one plane at a time, so the full grid is never held in
+    memory. The averages are the same as those of
+    :obj:`pymatgen.io.vasp.outputs.Locpot.get_average_along_axis`.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path to a (optionally gzipped) LOCPOT file.
+
+    Returns
+    -------
+    dict
+        The averaged potential along each lattice vector, given as
+        ``{axis: averages}``.
+    """
+    with zopen(filename, mode="rt") as file:
+        # the grid dimensions follow the first blank line after the structure
+        for line in file:
+            if not line.strip():
+                break
+        n_x, n_y, n_z = (int(dim) for dim in next(file).split())
+        plane_size = n_x * n_y
+
+        sum_x, sum_y, avg_z = np.zeros(n_x), np.zeros(n_y), np.zeros(n_z)
+        values = np.array(next(file).split(), dtype=float)
+        values_per_line = len(values)
+        for idx in range(n_z):
+            n_missing = plane_size - len(values)
+            if n_missing > 0:
+                lines = islice(file, math.ceil(n_missing / values_per_line))
+                values = np.concatenate(
+                    [values, np.array(" ".join(lines).split(), dtype=float)]
+                )
+            # x is the fastest running index in the file
+            plane = values[:plane_size].reshape(n_y, n_x)
+            values = values[plane_size:]
+            sum_x += plane.sum(axis=0)
+            sum_y += plane.sum(axis=1)
+            avg_z[idx] = plane.mean()
+
+    return {
+        0: (sum_x / (n_y * n_z)).tolist(),
+        1: (sum_y / (n_x * n_z)).tolist(),
+        2: avg_z.tolist(),
+    }
@@ -6,12 +6,12 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from emmet.core.tasks import TaskDoc
 from jobflow import Flow, Maker, OutputReference
 from jobflow.core.maker import recursive_call
 
 from atomate2.common.flows import defect as defect_flows
 from atomate2.vasp.flows.core import DoubleRelaxMaker
+from atomate2.vasp.jobs.base import get_vasp_task_document
 from atomate2.vasp.jobs.core import RelaxMaker, StaticMaker
 from atomate2.vasp.jobs.defect import calculate_finite_diff
 from atomate2.vasp.sets.defect import (
@@ -22,6 +22,7 @@ from atomate2.vasp.sets.defect import (
 )
 
 if TYPE_CHECKING:
+    from emmet.core.tasks import TaskDoc
     from pymatgen.core.structure import Structure
     from pymatgen.entries.computed_entries import ComputedStructureEntry
 
@@ -191,7 +192,7 @@ class FormationEnergyMaker(defect_flows.FormationEnergyMaker):
         -------
         ComputedStructureEntry
         """
-        task_doc = TaskDoc.from_directory(previous_dir)
+        task_doc = get_vasp_task_document(previous_dir)
         return task_doc.structure_entry, task_doc.calcs_reversed[0].output.locpot
 
     def get_planar_locpot(self, task_doc: TaskDoc) -> dict:
@@ -53,6 +53,10 @@ class ElectrodeInsertionMaker(electrode_flows.ElectrodeInsertionMaker):
         A maker to perform static calculations.
     structure_matcher: StructureMatcher
         The structure matcher to use to determine if additional insertion is needed.
+    charge_density_coarsening: int
+        Factor by which the charge density grid is coarse-grained along each axis
+        before searching for insertion sites. Coarser grids are faster to analyze
+        but can miss small insertion sites.
     """
 
     def get_charge_density(self, prev_dir: Path | str) -> VolumetricData:
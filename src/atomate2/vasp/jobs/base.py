@@ -21,7 +21,11 @@ from pymatgen.io.vasp import Chgcar, Locpot, Wavecar
 
 from atomate2 import SETTINGS
 from atomate2.common.files import gzip_output_folder
-from atomate2.vasp.files import copy_vasp_outputs, write_vasp_input_set
+from atomate2.vasp.files import (
+    copy_vasp_outputs,
+    get_planar_averaged_locpot,
+    write_vasp_input_set,
+)
 from atomate2.vasp.run import run_vasp, should_stop_children
 from atomate2.vasp.sets.base import VaspInputGenerator
 
@@ -290,4 +294,18 @@ def get_vasp_task_document(path: Path | str, **kwargs) -> TaskDoc:
 
     kwargs.setdefault("store_volumetric_data", SETTINGS.VASP_STORE_VOLUMETRIC_DATA)
 
-    return TaskDoc.from_directory(path, **kwargs)
+    # Stream the planar averages of the LOCPOT files, unless the full LOCPOT is
+    # loaded anyway to be stored
+    stored_data = {
+        str(getattr(data, "value", data)).lower()
+        for data in kwargs["store_volumetric_data"] or ()
+    }
+    if not kwargs.get("average_locpot", True) or "locpot" in stored_data:
+        return TaskDoc.from_directory(path, **kwargs)
+
+    task_doc = TaskDoc.from_directory(path, **{**kwargs, "average_locpot": False})
+    for calc in task_doc.calcs_reversed:
+        if "locpot" in (calc.output_file_paths or {}):
+            locpot_file = Path(calc.dir_name) / calc.output_file_paths["locpot"]
+            calc.output.locpot = get_planar_averaged_locpot(locpot_file)
+    return task_doc
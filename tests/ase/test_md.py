@@ -9,9 +9,11 @@ import os
 
 import pytest
 from jobflow import run_locally
+from numpy.testing import assert_allclose
 
 from atomate2.ase.md import GFNxTBMDMaker, LennardJonesMDMaker
 from atomate2.ase.schemas import AseStructureTaskDoc
+from atomate2.ase.utils import load_trajectory_store
 
 try:
     from tblite.ase import TBLite
@@ -89,3 +91,33 @@ def test_ase_npt_maker(calculator_name, lj_fcc_ne_pars, fcc_ne_structure, tmp_di
     assert os.path.isfile("XDATCAR")
 
     assert len(output.objects["trajectory"]) == n_steps
+
+
+def test_ase_md_maker_streaming(lj_fcc_ne_pars, fcc_ne_structure, clean_dir):
+    outputs = []
+    for kwargs in ({}, {"traj_store_dir": "traj_store", "traj_chunk_size": 7}):
+        md_job = LennardJonesMDMaker(
+            calculator_kwargs=lj_fcc_ne_pars,
+            mb_velocity_seed=_mb_velocity_seed,
+            temperature=1000,
+            ensemble="nvt",
+            n_steps=20,
+            store_trajectory="partial",
+            **kwargs,
+        ).make(fcc_ne_structure)
+        response = run_locally(md_job)
+        outputs.append(response[md_job.uuid][1].output)
+
+    assert os.path.isfile("traj_store/atom_positions.bin")
+    assert outputs[1].output.energy == pytest.approx(outputs[0].output.energy)
+    assert outputs[1].output.forces == pytest.approx(outputs[0].output.forces)
+    assert outputs[1].output.n_steps == outputs[0].output.n_steps == 21
+
+    # the streamed trajectory is referenced rather than stored in the document
+    assert "trajectory" not in outputs[1].objects
+    store = load_trajectory_store(outputs[1].objects["trajectory_store"])
+    assert store["n_frames"] == 21
+    assert_allclose(store["forces"][-1], outputs[0].output.forces)
+
+    with pytest.raises(ValueError, match="ionic_step_data cannot be used"):
+        LennardJonesMDMaker(traj_store_dir="traj_store", ionic_step_data=("energy",))
@@ -14,7 +14,12 @@ if TYPE_CHECKING:
     from pymatgen.core import Structure
 
 
-from atomate2.ase.utils import AseRelaxer, TrajectoryObserver
+from atomate2.ase.utils import (
+    AseRelaxer,
+    StreamingTrajectoryObserver,
+    TrajectoryObserver,
+    load_trajectory_store,
+)
 
 
 def test_trajectory_observer(si_structure: Structure, test_dir, tmp_dir):
@@ -51,6 +56,59 @@ def test_trajectory_observer(si_structure: Structure, test_dir, tmp_dir):
     assert os.path.isfile(save_file_name)
 
 
+def test_streaming_trajectory_observer(si_structure: Structure, tmp_dir):
+    from ase.md.verlet import VelocityVerlet
+
+    trajs = {}
+    for observer_cls, kwargs in (
+        (TrajectoryObserver, {}),
+        (StreamingTrajectoryObserver, {"directory": "traj_store", "chunk_size": 3}),
+    ):
+        atoms = si_structure.to_ase_atoms()
+        atoms.rattle(0.05, seed=42)
+        atoms.calc = LennardJones()
+        observer = observer_cls(atoms, store_md_outputs=True, **kwargs)
+        dyn = VelocityVerlet(atoms, timestep=1.0)
+        dyn.attach(observer, interval=1)
+        dyn.run(10)
+        trajs[observer_cls] = observer
+
+    streaming = trajs[StreamingTrajectoryObserver]
+    # only the frames of the last incomplete chunk are kept in memory
+    assert len(streaming.cells) == 11 % 3
+    assert os.path.isfile("traj_store/forces.bin")
+    assert streaming.get_column("forces").shape == (11, 2, 3)
+
+    ref_traj = trajs[TrajectoryObserver].to_pymatgen_trajectory(None)
+    traj = streaming.to_pymatgen_trajectory(None)
+    assert len(traj) == len(ref_traj) == 11
+    for idx in (0, 5, 10):
+        assert_allclose(traj[idx].cart_coords, ref_traj[idx].cart_coords, atol=1e-8)
+        for key in ("energy", "forces", "stress", "velocities", "temperature"):
+            assert_allclose(
+                traj.frame_properties[idx][key], ref_traj.frame_properties[idx][key]
+            )
+
+    partial_traj = streaming.to_pymatgen_trajectory(None, frame_indices=[0, 10])
+    assert len(partial_traj) == 2
+    assert_allclose(partial_traj[1].cart_coords, ref_traj[10].cart_coords, atol=1e-8)
+    assert_allclose(
+        partial_traj.frame_properties[1]["forces"],
+        ref_traj.frame_properties[10]["forces"],
+    )
+
+    store = load_trajectory_store("traj_store")
+    assert store["n_frames"] == 11
+    assert store["species"] == ["Si", "Si"]
+    assert_allclose(store["forces"], streaming.get_column("forces"))
+
+    ase_traj = streaming.to_ase_trajectory("streamed.traj")
+    assert len(ase_traj) == 11
+    assert ase_traj[-1].get_potential_energy() == pytest.approx(
+        ref_traj.frame_properties[-1]["energy"]
+    )
+
+
 @pytest.mark.parametrize(
     ("optimizer", "traj_file"),
     [("BFGS", None), (None, None), (BFGS, "log_file.traj")],
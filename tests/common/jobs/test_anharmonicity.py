@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from pymatgen.core import Lattice, Structure
+
+from atomate2.common.jobs.anharmonicity import (
+    calc_sigma_a,
+    get_harmonic_forces,
+    get_sigma_per_element,
+)
+
+
+def test_get_harmonic_forces():
+    rng = np.random.default_rng(42)
+    n_atoms, n_samples = 6, 4
+    force_constants = rng.normal(size=(n_atoms, n_atoms, 3, 3))
+    displacements = rng.normal(size=(n_samples, n_atoms, 3))
+
+    forces = get_harmonic_forces(force_constants, displacements)
+
+    fc_2d = force_constants.swapaxes(1, 2).reshape(3 * n_atoms, 3 * n_atoms)
+    expected = [-(fc_2d @ disp.flatten()).reshape(-1, 3) for disp in displacements]
+    assert forces.shape == (n_samples, n_atoms, 3)
+    np.testing.assert_allclose(forces, expected)
+
+
+def test_get_sigma_per_element():
+    structure = Structure(
+        Lattice.cubic(5.0),
+        ["Na", "Cl", "Na", "Cl"],
+        [[0, 0, 0], [0.5, 0.5, 0.5], [0.5, 0, 0], [0, 0.5, 0]],
+    )
+    rng = np.random.default_rng(42)
+    forces_dft = rng.normal(size=(3, 4, 3))
+    forces_harmonic = rng.normal(size=(3, 4, 3))
+
+    sigmas = get_sigma_per_element(structure, forces_dft, forces_harmonic)
+
+    for symbol, sigma in sigmas:
+        mask = [site.specie.symbol == symbol for site in structure]
+        f_dft = forces_dft[:, mask]
+        expected = calc_sigma_a(f_dft - forces_harmonic[:, mask], f_dft)
+        assert sigma == pytest.approx(expected)
+    assert [symbol for symbol, _ in sigmas] == ["Na", "Cl"]
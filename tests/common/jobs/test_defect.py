@@ -0,0 +1,38 @@
+def test_get_supercell_site_mapping(test_dir):
+    from pymatgen.analysis.defects.generators import (
+        InterstitialGenerator,
+        SubstitutionGenerator,
+        VacancyGenerator,
+    )
+    from pymatgen.core import Structure
+
+    from atomate2.common.jobs.defect import get_supercell_site_mapping
+
+    struct = Structure.from_file(test_dir / "structures" / "GaN.cif")
+    sc_mat = [[2, 2, 0], [2, -2, 0], [0, 0, 1]]
+    bulk_sc = struct * sc_mat
+
+    vacancy = next(iter(VacancyGenerator().generate(struct)))
+    mapping = get_supercell_site_mapping(
+        bulk_sc, vacancy.get_supercell_structure(sc_mat=sc_mat)
+    )
+    assert len(mapping) == len(bulk_sc) - 1
+    assert len(set(mapping)) == len(mapping)
+    assert None not in mapping
+
+    substitution = next(
+        iter(SubstitutionGenerator().generate(struct, substitution={"Ga": ["Mg"]}))
+    )
+    sc_struct = substitution.get_supercell_structure(sc_mat=sc_mat)
+    mapping = get_supercell_site_mapping(bulk_sc, sc_struct)
+    assert sorted(mapping) == list(range(len(bulk_sc)))
+    mg_index = sc_struct.indices_from_symbol("Mg")[0]
+    assert bulk_sc[mapping[mg_index]].specie.symbol == "Ga"
+
+    interstitial = next(
+        iter(InterstitialGenerator().generate(struct, insertions={"H": [[0.1] * 3]}))
+    )
+    mapping = get_supercell_site_mapping(
+        bulk_sc, interstitial.get_supercell_structure(sc_mat=sc_mat)
+    )
+    assert mapping.count(None) == 1
@@ -0,0 +1,92 @@
+import numpy as np
+from jobflow import run_locally
+from pytest import approx
+
+from atomate2.common.jobs.electrode import coarsen_grid, get_charge_density_job
+
+
+def _get_charge_density(prev_dir):
+    from pymatgen.io.vasp import Chgcar
+
+    return Chgcar.from_file(f"{prev_dir}/AECCAR0.gz") + Chgcar.from_file(
+        f"{prev_dir}/AECCAR2.gz"
+    )
+
+
+def test_coarsen_grid():
+    grid = np.arange(5 * 4 * 6, dtype=float).reshape(5, 4, 6)
+    assert coarsen_grid(grid, 1) is grid
+
+    coarse = coarsen_grid(grid, 2)
+    assert coarse.shape == (3, 2, 3)
+    assert coarse[0, 0, 0] == approx(grid[:2, :2, :2].mean())
+    assert coarse[-1, -1, -1] == approx(grid[4:, 2:, 4:].mean())
+    # the grids average the charge, so the mean charge is kept for divisible axes
+    assert coarsen_grid(grid[:4], 2).mean() == approx(grid[:4].mean())
+
+
+def test_get_charge_density_job(clean_dir, test_dir, memory_jobstore):
+    import shutil
+
+    static_dir = test_dir / "vasp/H_Graphite/static_0/outputs"
+    for filename in ("AECCAR0.gz", "AECCAR2.gz"):
+        shutil.copy(static_dir / filename, filename)
+    chg = _get_charge_density(".")
+
+    for coarsening in (1, 2):
+        job = get_charge_density_job(".", _get_charge_density, coarsening=coarsening)
+        responses = run_locally(
+            job, store=memory_jobstore, create_folders=False, ensure_success=True
+        )
+        loaded = responses[job.uuid][1].output
+        assert type(loaded) is type(chg)
+        assert loaded.structure == chg.structure
+        assert loaded.data_aug == chg.data_aug
+        assert set(loaded.data) == set(chg.data)
+        for key, grid in chg.data.items():
+            np.testing.assert_allclose(loaded.data[key], coarsen_grid(grid, coarsening))
+
+        # only a reference to the charge density is kept in the job store
+        output = memory_jobstore.query_one({"uuid": job.uuid}, load=False)["output"]
+        assert output["@class"] == "Chgcar"
+        assert output["store"] == "data"
+
+
+def test_get_min_energy_summary(clean_dir, si_structure, caplog):
+    import logging
+
+    from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+    from pymatgen.entries.computed_entries import ComputedEntry
+
+    from atomate2.common.jobs.electrode import RelaxJobSummary, get_min_energy_summary
+
+    inserted = si_structure.copy()
+    inserted.append("Li", [0.5, 0.5, 0.5])
+    strained = inserted.copy()
+    strained.apply_strain([1.0, 0, 0])
+    substituted = inserted.copy()
+    substituted.replace(0, "Ge")
+
+    summaries = []
+    for idx, (structure, energy) in enumerate(
+        [(inserted, -5), (inserted, -4), (strained, -7), (substituted, -6)]
+    ):
+        entry = ComputedEntry(structure.composition, energy * len(structure))
+        summaries.append(RelaxJobSummary(structure, entry, f"dir_{idx}", f"{idx}"))
+
+    matcher = StructureMatcher(comparator=ElementComparator(), ignored_species=["Li"])
+    job = get_min_energy_summary(summaries, si_structure, matcher)
+    with caplog.at_level(logging.INFO):
+        responses = run_locally(job, create_folders=False, ensure_success=True)
+    assert RelaxJobSummary._make(responses[job.uuid][1].output).dir_name == "dir_0"
+    assert "Ran 1 full structure matches for 4 relaxed structures" in caplog.text
+
+    # the same host in a different cell setting is not ruled out by the lattice
+    rebased = inserted.copy()
+    rebased.make_supercell([[1, 1, 0], [0, 1, 0], [0, 0, 1]])
+    entry = ComputedEntry(rebased.composition, -8 * len(rebased))
+    summaries.append(RelaxJobSummary(rebased, entry, "dir_rebased", "rebased"))
+    job = get_min_energy_summary(summaries, si_structure, matcher)
+    responses = run_locally(job, create_folders=False, ensure_success=True)
+    output = RelaxJobSummary._make(responses[job.uuid][1].output)
+    assert output.dir_name == "dir_rebased"
@@ -110,6 +110,30 @@ def test_postprocess_eos(clean_dir):
         )
 
 
+def test_postprocess_eos_pymatgen_models(clean_dir):
+    from pymatgen.analysis.eos import EOS
+
+    volumes = _eos_test_pars["v0"] * np.linspace(0.95, 1.05, 11)
+    energies = taylor_energy(
+        volumes, *[_eos_test_pars[key] for key in ("e0", "b0", "b1", "v0")]
+    )
+    e_v_dict = {"relax": {"energy": list(energies), "volume": list(volumes)}}
+
+    # models not fitted in batches are fitted with pymatgen
+    eos_models = ("deltafactor", "vinet", "numerical_eos")
+    postprocessor = PostProcessEosEnergy()
+    postprocessor.eos_models = eos_models
+    analysis_job = postprocessor.make(e_v_dict)
+    response = run_locally(analysis_job, create_folders=False, ensure_success=True)
+    eos_output = response[analysis_job.uuid][1].output["relax"]["EOS"]
+    assert tuple(eos_output) == eos_models
+    for eos_name in ("deltafactor", "numerical_eos"):
+        reference = EOS(eos_name).fit(volumes, energies)
+        assert eos_output[eos_name]["b0 GPa"] == approx(float(reference.b0_GPa))
+        assert eos_output[eos_name]["v0"] == approx(reference.v0)
+    assert eos_output["vinet"]["v0"] == approx(_eos_test_pars["v0"], rel=0.05)
+
+
 def test_postprocess_eos_pressure(clean_dir):
     volumes = _eos_test_pars["v0"] * np.linspace(0.95, 1.05, 3)
     pressures = taylor_pressure(
@@ -140,6 +164,44 @@ def test_postprocess_eos_pressure(clean_dir):
     )
 
 
+def test_fit_energy_eos():
+    from pymatgen.analysis.eos import EOS
+
+    from atomate2.common.analysis.eos import ENERGY_EOS_MODELS, fit_energy_eos
+
+    rng = np.random.default_rng(0)
+    volumes, energies = [], []
+    for n_points, scale in ((11, 1.0), (7, 1.2), (9, 0.8)):
+        vols = scale * _eos_test_pars["v0"] * np.linspace(0.94, 1.06, n_points)
+        volumes.append(vols)
+        energies.append(
+            taylor_energy(
+                vols,
+                *[_eos_test_pars[key] for key in ("e0", "b0", "b1")],
+                scale * _eos_test_pars["v0"],
+            )
+            + rng.normal(scale=1e-3, size=n_points)
+        )
+    # the parabola of the last dataset has its minimum outside the volumes
+    volumes.append(volumes[0][:5])
+    energies.append(energies[0][:5] - 10 * volumes[0][:5])
+
+    results = fit_energy_eos(volumes, energies)
+    assert len(results) == 4
+    for vols, energy, eos_results in zip(
+        volumes[:3], energies[:3], results[:3], strict=True
+    ):
+        assert set(eos_results) == set(ENERGY_EOS_MODELS)
+        for eos_name, result in eos_results.items():
+            reference = EOS(eos_name).fit(vols, energy)
+            assert result["b0 GPa"] == approx(float(reference.b0_GPa), rel=1e-3)
+            for key, value in reference.results.items():
+                assert result[key] == approx(value, rel=1e-3)
+
+    for result in results[3].values():
+        assert "parabola" in result["exception"]
+
+
 def test_apply_strain_to_structure(clean_dir, si_structure):
     strains = [1.0 + eps for eps in (-0.05, 0.0, 0.05)]
 
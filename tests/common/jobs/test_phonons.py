@@ -0,0 +1,29 @@
+from jobflow import run_locally
+from pymatgen.core import Structure
+
+from atomate2.common.jobs.phonons import generate_phonon_displacements
+
+
+def test_generate_phonon_displacements(si_structure: Structure):
+    kwargs = {
+        "structure": si_structure,
+        "supercell_matrix": [[2, 0, 0], [0, 2, 0], [0, 0, 2]],
+        "displacement": 0.01,
+        "sym_reduce": True,
+        "symprec": 1e-4,
+        "use_symmetrized_structure": None,
+        "kpath_scheme": "seekpath",
+        "code": "vasp",
+    }
+
+    job = generate_phonon_displacements(**kwargs)
+    responses = run_locally(job, create_folders=False, ensure_success=True)
+    displacements = responses[job.uuid][1].output
+    assert isinstance(displacements, list)
+    assert all(isinstance(structure, Structure) for structure in displacements)
+
+    job = generate_phonon_displacements(**kwargs, return_dataset=True)
+    responses = run_locally(job, create_folders=False, ensure_success=True)
+    output = responses[job.uuid][1].output
+    assert output["displacements"] == displacements
+    assert len(output["dataset"]["first_atoms"]) == len(displacements)
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def test_gruneisen_phonopy_conversion(test_dir, tmp_dir):
+    import phonopy
+    from phonopy.api_gruneisen import PhonopyGruneisen
+    from phonopy.phonon.band_structure import get_band_qpoints_and_path_connections
+    from pymatgen.core import Structure
+    from pymatgen.io.phonopy import (
+        get_gruneisen_ph_bs_symm_line,
+        get_gruneisenparameter,
+    )
+
+    from atomate2.common.schemas.gruneisen import (
+        get_gruneisen_parameter_from_phonopy,
+        get_gruneisen_ph_bs_symm_line_from_phonopy,
+    )
+    from atomate2.common.schemas.phonons import PhononBSDOSDoc
+
+    yaml_dir = test_dir / "vasp/Si_gruneisen"
+    structure = Structure.from_file(yaml_dir / "POSCAR")
+    gru = PhonopyGruneisen(
+        phonon=phonopy.load(yaml_dir / "ground_phonopy.yaml"),
+        phonon_plus=phonopy.load(yaml_dir / "plus_phonopy.yaml"),
+        phonon_minus=phonopy.load(yaml_dir / "minus_phonopy.yaml"),
+    )
+
+    gru.set_mesh(mesh=(4, 4, 4))
+    gru.write_yaml_mesh(filename="gruneisen_mesh.yaml")
+    gp = get_gruneisen_parameter_from_phonopy(gru, structure)
+    gp_yaml = get_gruneisenparameter("gruneisen_mesh.yaml", structure=structure)
+    np.testing.assert_allclose(gp.qpoints, gp_yaml.qpoints, atol=1e-8)
+    np.testing.assert_allclose(gp.multiplicities, gp_yaml.multiplicities)
+    np.testing.assert_allclose(gp.frequencies, gp_yaml.frequencies, atol=1e-8)
+    np.testing.assert_allclose(gp.gruneisen, gp_yaml.gruneisen, atol=1e-8)
+    assert gp.structure == structure
+
+    kpath_dict, kpath_concrete = PhononBSDOSDoc.get_kpath(
+        structure=structure, kpath_scheme="seekpath", symprec=1e-4
+    )
+    qpoints, _connections = get_band_qpoints_and_path_connections(
+        kpath_concrete, npoints=11
+    )
+    gru.set_band_structure(bands=qpoints)
+    gru.write_yaml_band_structure(filename="gruneisen_band.yaml")
+    bs = get_gruneisen_ph_bs_symm_line_from_phonopy(
+        gru, structure, labels_dict=kpath_dict
+    )
+    bs_yaml = get_gruneisen_ph_bs_symm_line(
+        "gruneisen_band.yaml", structure=structure, labels_dict=kpath_dict
+    )
+    np.testing.assert_allclose(
+        [qpt.frac_coords for qpt in bs.qpoints],
+        [qpt.frac_coords for qpt in bs_yaml.qpoints],
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(bs.distance, bs_yaml.distance, atol=1e-6)
+    np.testing.assert_allclose(bs.bands, bs_yaml.bands, atol=1e-8)
+    np.testing.assert_allclose(
+        bs.gruneisen, bs_yaml.gruneisen, atol=1e-8, equal_nan=True
+    )
+    assert [branch["name"] for branch in bs.branches] == [
+        branch["name"] for branch in bs_yaml.branches
+    ]
+    # the band structure uses the structure that was passed in
+    assert bs.structure == structure
+    np.testing.assert_allclose(
+        bs.lattice_rec.matrix, structure.lattice.reciprocal_lattice.matrix
+    )
@@ -6,11 +6,17 @@ from monty.json import MontyEncoder
 from pydantic import ValidationError
 
 from atomate2.common.schemas.phonons import (
+    ForceConstants,
     PhononBSDOSDoc,
     PhononComputationalSettings,
     PhononJobDirs,
     PhononUUIDs,
     ThermalDisplacementData,
+    get_displacement_dataset,
+    get_ph_bs_symm_line_from_phonopy,
+    get_ph_dos_from_phonopy,
+    get_thermal_properties,
+    set_displacement_dataset,
 )
 
 
@@ -58,3 +64,121 @@ def test_phonon_bs_dos_doc():
 def test_model_validate(model_cls):
     validated = model_cls.model_validate_json(json.dumps(model_cls(), cls=MontyEncoder))
     assert isinstance(validated, model_cls)
+
+
+def test_compact_force_constants(si_structure):
+    from atomate2.common.jobs.anharmonicity import get_harmonic_forces
+
+    structure = si_structure * (2, 2, 2)
+    n_atoms = len(structure)
+    rng = np.random.default_rng(42)
+    dense = rng.normal(size=(n_atoms, n_atoms, 3, 3))
+
+    # binary round trip through JSON without a cutoff is lossless
+    fcs = ForceConstants.from_array(dense)
+    assert "force_constants" not in fcs.as_dict()
+    decoded = json.loads(json.dumps(fcs, cls=MontyEncoder))
+    doc = PhononBSDOSDoc(force_constants=decoded)
+    np.testing.assert_array_equal(doc.force_constants.force_constants, dense)
+    assert doc.force_constants.pairs is None
+
+    # with a cutoff only the nearest neighbour pairs are kept
+    fcs = ForceConstants.from_array(dense, structure=structure, cutoff=2.5)
+    idx_i, idx_j, pair_fcs = fcs.pairs
+    assert len(idx_i) == n_atoms * 5
+    expected = np.where(structure.distance_matrix[..., None, None] <= 2.5, dense, 0.0)
+    np.testing.assert_array_equal(fcs.force_constants, expected)
+
+    # harmonic forces from the sparse pairs match the dense evaluation
+    displacements = rng.normal(size=(3, n_atoms, 3))
+    np.testing.assert_allclose(
+        get_harmonic_forces(fcs, displacements),
+        get_harmonic_forces(expected, displacements),
+    )
+
+    # the legacy form is still supported
+    legacy = ForceConstants.from_dict({"force_constants": dense.tolist()})
+    assert legacy.as_dict()["force_constants"] == dense.tolist()
+
+
+def test_get_thermal_properties(si_structure):
+    from pymatgen.phonon.dos import PhononDos
+
+    freqs = np.linspace(-0.5, 15, 200)
+    dos = PhononDos(freqs, np.exp(-((freqs - 7) ** 2) / 4) * (freqs > 0))
+    temperatures = np.arange(0, 1000, 50)
+
+    properties = get_thermal_properties(dos, temperatures, structure=si_structure)
+
+    methods = {
+        "free_energy": dos.helmholtz_free_energy,
+        "entropy": dos.entropy,
+        "internal_energy": dos.internal_energy,
+        "heat_capacity": dos.cv,
+    }
+    for key, method in methods.items():
+        expected = [method(temp, structure=si_structure) for temp in temperatures]
+        np.testing.assert_array_equal(properties[key], expected)
+
+
+def test_phonopy_conversion(si_structure, tmp_dir):
+    from phonopy import Phonopy
+    from pymatgen.io.phonopy import (
+        get_ph_bs_symm_line,
+        get_ph_dos,
+        get_phonopy_structure,
+    )
+
+    phonon = Phonopy(get_phonopy_structure(si_structure), supercell_matrix=np.eye(3))
+    phonon.generate_displacements(distance=0.01)
+    n_atoms = len(phonon.supercell)
+    forces = []
+    for atom_idx, *displacement in phonon.displacements:
+        force = np.zeros((n_atoms, 3))
+        force[atom_idx] = -10 * np.array(displacement)
+        forces.append(force - force.mean(axis=0))
+    phonon.forces = forces
+    phonon.produce_force_constants()
+
+    qpoints = [[[0, 0, 0], [0.5, 0, 0.5]], [[0.5, 0.5, 0.5], [0, 0, 0]]]
+    phonon.run_band_structure(qpoints, with_eigenvectors=True)
+    phonon.write_yaml_band_structure(filename="band.yaml")
+    bs_symm_line = get_ph_bs_symm_line_from_phonopy(phonon, has_nac=True)
+    bs_symm_line_yaml = get_ph_bs_symm_line("band.yaml", has_nac=True)
+    np.testing.assert_allclose(bs_symm_line.bands, bs_symm_line_yaml.bands, atol=1e-8)
+    np.testing.assert_allclose(
+        bs_symm_line.eigendisplacements,
+        bs_symm_line_yaml.eigendisplacements,
+        atol=1e-8,
+    )
+    np.testing.assert_allclose(
+        bs_symm_line.lattice_rec.matrix, bs_symm_line_yaml.lattice_rec.matrix, atol=1e-7
+    )
+    assert bs_symm_line.has_nac
+
+    phonon.run_mesh([4, 4, 4])
+    phonon.run_total_dos()
+    phonon.write_total_dos(filename="total_dos.dat")
+    dos = get_ph_dos_from_phonopy(phonon)
+    dos_yaml = get_ph_dos("total_dos.dat")
+    np.testing.assert_allclose(dos.frequencies, dos_yaml.frequencies, atol=1e-8)
+    np.testing.assert_allclose(dos.densities, dos_yaml.densities, atol=1e-8)
+
+
+def test_displacement_dataset(si_structure):
+    from phonopy import Phonopy
+    from pymatgen.io.phonopy import get_phonopy_structure
+
+    cell = get_phonopy_structure(si_structure)
+    phonon = Phonopy(cell, supercell_matrix=2 * np.eye(3))
+    phonon.generate_displacements(distance=0.01)
+    dataset = json.loads(json.dumps(get_displacement_dataset(phonon)))
+
+    new_phonon = Phonopy(cell, supercell_matrix=2 * np.eye(3))
+    set_displacement_dataset(new_phonon, dataset)
+    assert new_phonon.dataset == phonon.dataset
+    np.testing.assert_array_equal(new_phonon.displacements, phonon.displacements)
+
+    # the dataset can not be used with a different supercell
+    with pytest.raises(ValueError, match="does not match"):
+        set_displacement_dataset(Phonopy(cell, supercell_matrix=np.eye(3)), dataset)
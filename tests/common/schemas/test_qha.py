@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from jobflow import run_locally
 from numpy.testing import assert_allclose
 from pymatgen.core.structure import Structure
@@ -244,3 +246,110 @@ def test_analyze_free_energy_small(tmp_dir, test_dir):
     )
     assert_allclose(qha_doc.helmholtz_volume[2][2], -14.631379092600538, atol=1e-3)
     assert_allclose(qha_doc.t_max, 100)
+
+
+def _get_qha_inputs(test_dir):
+    import numpy as np
+
+    structure = Structure.from_file(f"{test_dir}/qha/POSCAR")
+    volumes, energies = np.loadtxt(f"{test_dir}/qha/e-v.dat").T
+    free_energies, heat_capacities, entropies = [], [], []
+    for index in range(-5, 6):
+        with open(f"{test_dir}/qha/thermal_properties.yaml-{index!s}") as f:
+            thermal_properties = YAML().load(f)["thermal_properties"]
+        temperatures = [v["temperature"] for v in thermal_properties]
+        free_energies.append([v["free_energy"] for v in thermal_properties])
+        heat_capacities.append([v["heat_capacity"] for v in thermal_properties])
+        entropies.append([v["entropy"] for v in thermal_properties])
+
+    return {
+        "structure": structure,
+        "volumes": volumes,
+        "temperatures": temperatures,
+        "electronic_energies": np.tile(energies, (len(temperatures), 1)),
+        "free_energies": np.transpose(free_energies),
+        "heat_capacities": np.transpose(heat_capacities),
+        "entropies": np.transpose(entropies),
+        "t_max": 100,
+    }
+
+
+def test_qha_plot_policy(tmp_dir, test_dir):
+    from atomate2.common.jobs.utils import render_plots
+
+    kwargs = _get_qha_inputs(test_dir)
+
+    doc = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="off")
+    assert doc.deferred_plots is None
+    assert not list(Path.cwd().glob("*.pdf"))
+
+    doc = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="deferred")
+    assert doc.deferred_plots["helmholtz_volume"] == {
+        "filename": "helmholtz_volume.pdf"
+    }
+    assert not list(Path.cwd().glob("*.pdf"))
+
+    responses = run_locally(render_plots(doc), create_folders=False)
+    assert len(responses) == 1
+    assert len(list(Path.cwd().glob("*.pdf"))) == 7
+
+
+def test_qha_parallel_eos_fit(tmp_dir, test_dir):
+    kwargs = _get_qha_inputs(test_dir)
+
+    serial = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="off")
+    parallel = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="off", n_workers=2)
+    for key in (
+        "bulk_modulus",
+        "thermal_expansion",
+        "helmholtz_volume",
+        "volume_temperature",
+        "gibbs_temperature",
+        "bulk_modulus_temperature",
+        "heat_capacity_p_numerical",
+        "gruneisen_temperature",
+    ):
+        assert_allclose(getattr(parallel, key), getattr(serial, key), err_msg=key)
+
+
+def test_qha_parallel_eos_fit_unsupported_phonopy(tmp_dir, test_dir, monkeypatch):
+    from atomate2.common.schemas import qha
+
+    kwargs = _get_qha_inputs(test_dir)
+    serial = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="off")
+
+    # unsupported phonopy versions fall back to phonopy's own QHA.run
+    monkeypatch.setattr(qha, "_PARALLEL_QHA_PHONOPY_VERSIONS", ((0, 0, 0), (0, 0, 0)))
+    monkeypatch.setattr(qha, "_ParallelQHA", None)
+    parallel = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="off", n_workers=2)
+    assert_allclose(parallel.thermal_expansion, serial.thermal_expansion)
+
+
+def test_qha_compact_arrays(tmp_dir, test_dir):
+    import json
+
+    import numpy as np
+
+    kwargs = _get_qha_inputs(test_dir)
+
+    doc = PhononQHADoc.from_phonon_runs(**kwargs, plot_policy="off")
+    compact = PhononQHADoc.from_phonon_runs(
+        **kwargs, plot_policy="deferred", compact_arrays=True
+    )
+    assert compact.free_energies is None
+    assert compact.helmholtz_volume is None
+    # the compact arrays are plain JSON
+    compact.compact_arrays = json.loads(json.dumps(compact.compact_arrays))
+    for name in (
+        "helmholtz_volume",
+        "free_energies",
+        "heat_capacities",
+        "entropies",
+        "electronic_energies",
+    ):
+        np.testing.assert_array_equal(
+            compact.get_array(name), np.array(getattr(doc, name)), err_msg=name
+        )
+
+    compact.render_plots()
+    assert len(list(Path.cwd().glob("*.pdf"))) == 7
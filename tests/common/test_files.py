@@ -1,6 +1,14 @@
 from pathlib import Path
 
-from atomate2.common.files import gunzip_files, gzip_files, gzip_output_folder
+import pytest
+
+from atomate2.common.files import (
+    copy_files,
+    gunzip_files,
+    gzip_files,
+    gzip_output_folder,
+)
+from atomate2.utils.file_client import FileClient
 
 
 def test_gunzip_force_overwrites(tmp_path):
@@ -57,3 +65,195 @@ def test_zip_outputs(tmp_dir):
     assert (Path.cwd() / "a.gz").exists()
     assert not (Path.cwd() / "b").exists()
     assert (Path.cwd() / "b.gz").exists()
+
+
+def test_parallel_gzip(tmp_path):
+    import gzip
+
+    import numpy as np
+
+    from atomate2.utils.file_client import FileClient
+
+    data = np.random.default_rng(42).bytes(50_000) * 20
+    for fname in ("big", "small1", "small2"):
+        (tmp_path / fname).write_bytes(data if fname == "big" else b"small")
+
+    # big file is compressed in blocks which are written as separate gzip members
+    FileClient().gzip(tmp_path / "big", n_threads=4, block_size=100_000)
+    assert not (tmp_path / "big").exists()
+    assert (tmp_path / "big.gz").read_bytes().count(b"\x1f\x8b\x08") >= 10
+    assert gzip.decompress((tmp_path / "big.gz").read_bytes()) == data
+
+    gzip_files(tmp_path, n_threads=3)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "big.gz",
+        "small1.gz",
+        "small2.gz",
+    ]
+
+    gunzip_files(tmp_path, n_threads=3)
+    assert (tmp_path / "big").read_bytes() == data
+    assert (tmp_path / "small2").read_bytes() == b"small"
+
+
+def test_gzip_files_threads(tmp_path, monkeypatch):
+    from atomate2.utils.file_client import FileClient
+
+    block_threads = []
+    gzip = FileClient.gzip
+
+    def _gzip(self, path, n_threads=1, **kwargs):
+        block_threads.append(n_threads)
+        gzip(self, path, n_threads=n_threads, **kwargs)
+
+    monkeypatch.setattr(FileClient, "gzip", _gzip)
+
+    # files are compressed concurrently, but each one with a single thread
+    for fname in ("a", "b"):
+        (tmp_path / fname).write_bytes(b"data")
+    gzip_files(tmp_path, n_threads=3)
+    assert block_threads == [1, 1]
+
+    # a single file is compressed in parallel blocks
+    (tmp_path / "c").write_bytes(b"data")
+    gzip_files(tmp_path, n_threads=3)
+    assert block_threads[-1] == 3
+
+
+def test_copy_files_bulk(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    for name in ("INCAR", "OUTCAR", "vasprun.xml", "KPOINTS.gz"):
+        (src_dir / name).write_text(name * 100)
+
+    for bulk in (False, True):
+        dest_dir = tmp_path / f"dest_{bulk}"
+        dest_dir.mkdir()
+        copy_files(
+            src_dir,
+            dest_dir,
+            include_files=["*CAR", "vasprun.xml", "KPOINTS*"],
+            exclude_files=["OUTCAR"],
+            bulk=bulk,
+        )
+        copied = sorted(p.name for p in dest_dir.iterdir())
+        assert copied == ["INCAR", "KPOINTS.gz", "vasprun.xml"]
+        assert (dest_dir / "INCAR").read_text() == "INCAR" * 100
+
+    # missing files should raise in bulk mode unless explicitly allowed
+    with pytest.raises(FileNotFoundError):
+        copy_files(src_dir, tmp_path, include_files=["CHGCAR"], bulk=True)
+    copy_files(
+        src_dir, tmp_path, include_files=["CHGCAR"], allow_missing=True, bulk=True
+    )
+
+
+def test_copy_files_bulk_symlinks(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "OUTCAR").write_text("OUTCAR")
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "OUTCAR").symlink_to(data_dir / "OUTCAR")
+    (src_dir / "CHGCAR").symlink_to(data_dir / "missing")
+    (src_dir / "subdir").symlink_to(data_dir)
+
+    assert FileClient().list_files(src_dir) == {Path("OUTCAR"): 6}
+
+    dest_dir = tmp_path / "dest"
+    dest_dir.mkdir()
+    copy_files(src_dir, dest_dir, include_files=["OUTCAR"], bulk=True)
+    assert (dest_dir / "OUTCAR").read_text() == "OUTCAR"
+
+
+def test_ssh_connection_pool(monkeypatch):
+    from atomate2.utils import file_client as fc
+
+    class FakeTransport:
+        active = True
+
+        def is_active(self):
+            return self.active
+
+        def set_keepalive(self, interval):
+            pass
+
+    class FakeSFTP:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class FakeSSH:
+        def __init__(self):
+            self.transport = FakeTransport()
+            self.closed = False
+
+        def get_transport(self):
+            return self.transport
+
+        def open_sftp(self):
+            return FakeSFTP()
+
+        def close(self):
+            self.closed = True
+
+    n_connects = []
+
+    def fake_connect(host, key_filename, config_filename):
+        n_connects.append(host)
+        return FakeSSH()
+
+    monkeypatch.setattr(fc, "_connect_host", fake_connect)
+    pool = fc.SSHConnectionPool(max_size=1, idle_timeout=60)
+
+    # connections are reused between file clients
+    for _ in range(3):
+        with fc.FileClient(pool=pool) as file_client:
+            ssh = file_client.get_ssh("host1")
+    assert n_connects == ["host1"]
+    assert len(pool) == 1
+
+    # dropped connections are reopened
+    ssh.transport.active = False
+    with fc.FileClient(pool=pool) as file_client:
+        assert file_client.get_ssh("host1") is not ssh
+    assert ssh.closed
+    assert n_connects == ["host1"] * 2
+
+    # least recently used idle connections are evicted beyond the max size
+    with fc.FileClient(pool=pool) as file_client:
+        file_client.get_ssh("host2")
+    assert len(pool) == 1
+    assert n_connects == ["host1", "host1", "host2"]
+
+    # idle connections time out
+    pool.idle_timeout = 0
+    with fc.FileClient(pool=pool) as file_client:
+        file_client.get_ssh("host1")
+    assert len(pool) == 0
+
+    # concurrent borrowers share the SSH transport but not the SFTP channel
+    pool.idle_timeout = 60
+    with fc.FileClient(pool=pool) as client1, fc.FileClient(pool=pool) as client2:
+        assert client1.get_ssh("host1") is client2.get_ssh("host1")
+        sftp = client1.get_sftp("host1")
+        assert sftp is not client2.get_sftp("host1")
+    assert sftp.closed
+    assert len(pool) == 1
+
+    # forked processes start with an empty pool and leave parent connections open
+    with fc.FileClient(pool=pool) as file_client:
+        ssh = file_client.get_ssh("host1")
+        sftp = file_client.get_sftp("host1")
+        monkeypatch.setattr(fc.os, "getpid", lambda: -1)
+        pool._reset_after_fork()  # noqa: SLF001
+        assert len(pool) == 0
+    assert not sftp.closed
+    assert not ssh.closed
+
+
+def test_connection_pool_disabled_by_default():
+    from atomate2.utils.file_client import get_connection_pool
+
+    assert get_connection_pool() is None
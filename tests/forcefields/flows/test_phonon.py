@@ -91,3 +91,48 @@ def test_phonon_wf_force_field(clean_dir, si_structure: Structure, tmp_path: Pat
     # check phonon plots exist
     assert os.path.isfile(filename_bs)
     assert os.path.isfile(filename_dos)
+
+
+def test_phonon_wf_force_field_batched(clean_dir, si_structure: Structure):
+    from atomate2.forcefields.jobs import (
+        ForceFieldBatchStaticMaker,
+        ForceFieldStaticMaker,
+    )
+
+    phonon_kwargs = dict(
+        use_symmetrized_structure="conventional",
+        create_thermal_displacements=False,
+        store_force_constants=False,
+        prefer_90_degrees=False,
+        min_length=10,
+        bulk_relax_maker=None,
+        static_energy_maker=None,
+        generate_frequencies_eigenvectors_kwargs={"tstep": 100},
+    )
+    batch_maker = PhononMaker(socket=True, **phonon_kwargs)
+    assert isinstance(batch_maker.phonon_displacement_maker, ForceFieldBatchStaticMaker)
+    assert batch_maker.phonon_displacement_maker.name == "Force field batch static"
+
+    # the settings of the displacement maker are kept
+    custom_maker = PhononMaker(
+        socket=True,
+        phonon_displacement_maker=ForceFieldStaticMaker(
+            name="custom static",
+            force_field_name="CHGNet",
+            task_document_kwargs={"store_trajectory": "no"},
+        ),
+    ).phonon_displacement_maker
+    assert isinstance(custom_maker, ForceFieldBatchStaticMaker)
+    assert custom_maker.name == "custom static"
+    assert custom_maker.task_document_kwargs == {"store_trajectory": "no"}
+
+    docs = []
+    for maker in (batch_maker, PhononMaker(**phonon_kwargs)):
+        flow = maker.make(si_structure)
+        responses = run_locally(flow, create_folders=True, ensure_success=True)
+        docs.append(responses[flow[-1].uuid][1].output)
+
+    # all displacements are evaluated in a single job
+    assert len(set(docs[0].uuids.displacements_uuids)) == 1
+    assert_allclose(docs[0].free_energies, docs[1].free_energies, rtol=1e-3)
+    assert_allclose(docs[0].entropies, docs[1].entropies, rtol=1e-3, atol=1e-3)
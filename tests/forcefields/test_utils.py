@@ -43,3 +43,35 @@ def test_m3gnet_pot():
     assert str(m3gnet_pes_calc.potential) != str(m3gnet_default.potential)
     assert m3gnet_pes_calc.stress_weight == m3gnet_calculator.stress_weight
     assert m3gnet_pes_calc.stress_weight == m3gnet_default.stress_weight
+
+
+def test_calculator_cache():
+    from atomate2.forcefields.utils import CalculatorCache
+
+    lj_meta = {"@module": "ase.calculators.lj", "@callable": "LennardJones"}
+    cache = CalculatorCache(max_size=2)
+
+    calc = cache.get(lj_meta, sigma=2.0, epsilon=1.0)
+    assert cache.get(lj_meta, epsilon=1.0, sigma=2.0) is calc
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+    # different kwargs give a different calculator
+    other_calc = cache.get(lj_meta, sigma=3.0)
+    assert other_calc is not calc
+    assert len(cache) == 2
+
+    # least recently used calculator is evicted
+    cache.get(lj_meta, sigma=4.0)
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (1, 3, 1, 2)
+    assert cache.get(lj_meta, sigma=2.0, epsilon=1.0) is not calc
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info().misses == 0
+
+    # disabled cache always loads a new calculator
+    cache = CalculatorCache(max_size=0)
+    assert cache.get(lj_meta) is not cache.get(lj_meta)
+    assert cache.info().misses == 2
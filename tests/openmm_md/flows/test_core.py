@@ -83,7 +83,8 @@ def test_hdf5_writing(interchange, run_job):
     task_doc = run_job(anneal_flow)
 
     calc_output_names = [calc.output.traj_file for calc in task_doc.calcs_reversed]
-    assert len(list(Path(task_doc.dir_name).iterdir())) == 5
+    # includes the file handing the simulation state between jobs
+    assert len(list(Path(task_doc.dir_name).iterdir())) == 6
     assert set(calc_output_names) == {
         "trajectory3.h5md",
         "trajectory2.h5md",
@@ -178,6 +179,55 @@ def test_flow_maker(interchange, run_job):
     assert len(u.trajectory) == 5
 
 
+def test_single_context(interchange, run_job):
+    production_maker = OpenMMFlowMaker(
+        name="test_production",
+        tags=["test"],
+        makers=[
+            EnergyMinimizationMaker(max_iterations=1, state_interval=1),
+            NPTMaker(n_steps=5, pressure=1.0, state_interval=1, traj_interval=1),
+            OpenMMFlowMaker.anneal_flow(anneal_temp=400, final_temp=300, n_steps=5),
+            NVTMaker(n_steps=5),
+        ],
+        single_context=True,
+    )
+
+    production_flow = production_maker.make(interchange)
+    task_doc = run_job(production_flow)
+
+    # a single job runs all stages but reports a calculation for each
+    assert len(production_flow.jobs) == 2
+    assert len(task_doc.job_uuids) == 1
+    assert task_doc.tags == ["test"]
+    assert [calc.task_name for calc in task_doc.calcs_reversed] == [
+        "nvt simulation",
+        "lower temp",
+        "hold temp",
+        "raise temp",
+        "npt simulation",
+        "energy minimization",
+    ]
+
+    all_steps = [calc.output.steps_reported for calc in task_doc.calcs_reversed]
+    assert all_steps == [
+        [11, 12, 13, 14, 15],
+        [10],
+        [8, 9],
+        [6, 7],
+        [1, 2, 3, 4, 5],
+        [0],
+    ]
+    assert task_doc.calcs_reversed[0].output.state_file == "state5.csv"
+    assert task_doc.calcs_reversed[1].input.temperature == 300
+    assert task_doc.calcs_reversed[1].input.starting_temperature == 400
+
+    interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
+    topology = PDBFile(io.StringIO(interchange.topology)).getTopology()
+    u = Universe(topology, str(Path(task_doc.dir_name) / "trajectory5.dcd"))
+
+    assert len(u.trajectory) == 5
+
+
 def test_traj_blob_embed(interchange, run_job, tmp_path):
     nvt = NVTMaker(n_steps=2, traj_interval=1, embed_traj=True)
 
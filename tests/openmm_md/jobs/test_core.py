@@ -2,7 +2,9 @@ from pathlib import Path
 
 import numpy as np
 from emmet.core.openmm import OpenMMInterchange
+from jobflow import Flow
 from openmm import XmlSerializer
+from openmm.unit import nanometer
 
 from atomate2.openmm.jobs import (
     EnergyMinimizationMaker,
@@ -10,6 +12,7 @@ from atomate2.openmm.jobs import (
     NVTMaker,
     TempChangeMaker,
 )
+from atomate2.openmm.jobs.base import OPENMM_STATE_FILE
 
 
 def test_energy_minimization_maker(interchange, run_job):
@@ -88,3 +91,64 @@ def test_temp_change_maker(interchange, run_job):
     # test that temperature was updated correctly in the input
     assert task_doc.calcs_reversed[0].input.temperature == 310
     assert task_doc.calcs_reversed[0].input.starting_temperature == 298
+
+
+def test_state_hand_off(interchange, run_job):
+    first_job = NVTMaker(n_steps=5, state_interval=1).make(
+        interchange, store_interchange=False
+    )
+    second_job = NVTMaker(n_steps=5, state_interval=1).make(
+        None, prev_dir=first_job.output.dir_name
+    )
+    task_doc = run_job(Flow([first_job, second_job]))
+
+    # the state file holds the system and topology, so each job only needs the
+    # directory of the previous one
+    dir_name = Path(task_doc.dir_name)
+    assert [path.suffix for path in dir_name.glob("openmm_*")] == [".npz"]
+
+    # the second job continues from the state written by the first
+    calc_output = task_doc.calcs_reversed[0].output
+    assert calc_output.steps_reported == list(range(6, 11))
+
+    # the interchange is only updated with the final state by the last job
+    new_interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
+    system = XmlSerializer.deserialize(interchange.system)
+    new_system = XmlSerializer.deserialize(new_interchange.system)
+    assert new_system.getNumParticles() == system.getNumParticles()
+    new_state = XmlSerializer.deserialize(new_interchange.state)
+    with np.load(dir_name / OPENMM_STATE_FILE) as state:
+        np.testing.assert_allclose(
+            new_state.getPositions(asNumpy=True).value_in_unit(nanometer),
+            state["positions"],
+        )
+
+
+def test_state_hand_off_with_interchange(interchange, run_job):
+    first_job = NVTMaker(n_steps=5, state_interval=1).make(interchange)
+    second_job = NVTMaker(n_steps=5, state_interval=1).make(
+        interchange, prev_dir=first_job.output.dir_name
+    )
+    task_doc = run_job(Flow([first_job, second_job]))
+
+    # an interchange passed by the caller takes precedence over the state
+    calc_output = task_doc.calcs_reversed[0].output
+    assert calc_output.steps_reported == list(range(1, 6))
+
+
+def test_state_hand_off_store_interchange(interchange, run_job):
+    first_job = NVTMaker(n_steps=5, state_interval=1).make(
+        interchange, store_interchange=False
+    )
+    second_job = NVTMaker(n_steps=5, state_interval=1).make(
+        interchange, prev_dir=first_job.output.dir_name, continue_from_state=True
+    )
+    task_doc = run_job(Flow([first_job, second_job]))
+
+    # the simulation continues from the state, the interchange is only stored
+    calc_output = task_doc.calcs_reversed[0].output
+    assert calc_output.steps_reported == list(range(6, 11))
+    new_interchange = OpenMMInterchange.model_validate_json(task_doc.interchange)
+    assert new_interchange.system == interchange.system
+    assert new_interchange.topology == interchange.topology
+    assert new_interchange.state != interchange.state
@@ -0,0 +1,161 @@
+from datetime import datetime
+
+import numpy as np
+from pymatgen.core import Lattice, Structure
+
+from atomate2.vasp.builders.elastic import _group_deformations
+
+
+def test_group_deformations():
+    rng = np.random.default_rng(42)
+    parents = [
+        Structure(Lattice.cubic(a), ["Si", "Si"], [[0, 0, 0], [0.25, 0.25, 0.25]])
+        for a in (5.43, 5.43 + 1e-6, 5.44, 5.45)
+    ]
+    # same lattice as the first parent but different coordinates
+    parents.append(
+        Structure(Lattice.cubic(5.43), ["Si", "Si"], [[0, 0, 0], [0.3, 0.25, 0.25]])
+    )
+    # same lattice diagonal as the first parent but sheared
+    parents.append(
+        Structure(
+            [[5.43, 0.1, 0], [0, 5.43, 0], [0, 0, 5.43]],
+            ["Si", "Si"],
+            [[0, 0, 0], [0.25, 0.25, 0.25]],
+        )
+    )
+    # same lattice and coordinates as the first parent but different species
+    parents.append(
+        Structure(Lattice.cubic(5.43), ["Si", "Ge"], [[0, 0, 0], [0.25, 0.25, 0.25]])
+    )
+
+    parent_idxs = rng.integers(len(parents), size=50)
+    tasks = [
+        {
+            "uuid": idx,
+            "output": {
+                "transformations": {
+                    "history": [{"input_structure": parents[parent_idx]}]
+                }
+            },
+        }
+        for idx, parent_idx in enumerate(parent_idxs)
+    ]
+
+    grouped = _group_deformations(tasks, 1e-5)
+
+    # the first two parents are identical within the tolerance
+    expected_groups = np.where(parent_idxs == 1, 0, parent_idxs)
+    assert len(grouped) == len(set(expected_groups))
+    for group in grouped:
+        assert len({expected_groups[task["uuid"]] for task in group}) == 1
+    assert sum(len(group) for group in grouped) == len(tasks)
+
+
+def _get_deformation_tasks(structure):
+    from pymatgen.analysis.elasticity import Strain
+
+    c11, c12, c44 = 160, 60, 80
+    tensor = np.zeros((6, 6))
+    tensor[:3, :3] = c12
+    tensor[np.diag_indices(3)] = c11
+    tensor[3:, 3:] = np.eye(3) * c44
+
+    formula = structure.reduced_formula
+    tasks = []
+    for idx in range(6):
+        for magnitude in (-0.01, -0.005, 0.005, 0.01):
+            voigt = np.zeros(6)
+            voigt[idx] = magnitude
+            strain = Strain.from_voigt(voigt)
+            # VASP convention: stress in kBar with opposite sign
+            stress = -10 * np.dot(tensor, strain.voigt)
+            tasks.append(
+                {
+                    "uuid": f"{formula}-{idx}-{magnitude}",
+                    "last_updated": "2024-01-01T00:00:00",
+                    "output": {
+                        "formula_pretty": formula,
+                        "dir_name": "/dir",
+                        "output": {"stress": Strain.from_voigt(stress).tolist()},
+                        "orig_inputs": {"NSW": 99, "ISIF": 3},
+                        "transformations": {
+                            "history": [
+                                {
+                                    "@class": "DeformationTransformation",
+                                    "input_structure": structure.as_dict(),
+                                    "deformation": strain.get_deformation_matrix()
+                                    .round(12)
+                                    .tolist(),
+                                }
+                            ]
+                        },
+                    },
+                }
+            )
+    return tasks
+
+
+def test_elastic_builder_incremental(si_structure):
+    from maggma.stores import MemoryStore
+
+    from atomate2.vasp.builders.elastic import ElasticBuilder
+
+    tasks = MemoryStore()
+    elasticity = MemoryStore()
+    builder = ElasticBuilder(tasks, elasticity, symprec=None, incremental=True)
+    builder.connect()
+    ge_structure = si_structure.copy().replace_species({"Si": "Ge"})
+    tasks.update(_get_deformation_tasks(si_structure), key="uuid")
+    tasks.update(_get_deformation_tasks(ge_structure), key="uuid")
+
+    items = list(builder.get_items())
+    assert len(items) == 2
+    builder.update_targets([builder.process_item(item) for item in items])
+    assert elasticity.count() == 2
+    doc = elasticity.query_one({"formula_pretty": "Si"})
+    assert doc["elastic_tensor"]["ieee_format"][0][0] > 0
+    assert doc["fitting_data_uuid"] == doc["fitting_data"]["uuids"][0]
+    # documents are stamped with the time of their tasks, not the build time
+    assert doc["last_updated"] == datetime.fromisoformat("2024-01-01T00:00:00")
+
+    # nothing changed so nothing should be rebuilt
+    assert len(list(builder.get_items())) == 0
+
+    # updating a task only rebuilds its formula, even if the update happened
+    # before the documents were written
+    task = tasks.query_one({"uuid": "Ge-0-0.01"})
+    tasks.update(task | {"last_updated": "2024-01-02T00:00:00"}, key="uuid")
+    assert [item[0]["output"]["formula_pretty"] for item in builder.get_items()] == [
+        "Ge"
+    ]
+
+    builder.incremental = False
+    assert len(list(builder.get_items())) == 2
+
+
+def test_elastic_builder_replaces_legacy_documents(si_structure):
+    from maggma.stores import MemoryStore
+
+    from atomate2.vasp.builders.elastic import ElasticBuilder
+
+    tasks = MemoryStore()
+    elasticity = MemoryStore()
+    builder = ElasticBuilder(tasks, elasticity, symprec=None)
+    assert not builder.incremental
+    builder.connect()
+    tasks.update(_get_deformation_tasks(si_structure), key="uuid")
+
+    builder.run()
+    assert elasticity.count() == 1
+
+    # documents written by older versions lack the fitting_data_uuid key
+    doc = elasticity.query_one()
+    doc.pop("_id")
+    doc.pop("fitting_data_uuid")
+    elasticity.remove_docs({})
+    elasticity.update(doc, key="formula_pretty")
+
+    builder.run()
+    assert elasticity.count() == 1
+    assert "fitting_data_uuid" in elasticity.query_one()
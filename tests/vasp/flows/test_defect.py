@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 import numpy as np
-from jobflow import JobStore, run_locally
+from jobflow import Flow, JobStore, run_locally
 from maggma.stores.mongolike import MemoryStore
 from pymatgen.analysis.defects.generators import SubstitutionGenerator
 from pymatgen.core import Structure
@@ -231,3 +231,34 @@ def test_formation_energy_maker_uc(mock_vasp, clean_dir, test_dir, monkeypatch):
         create_folders=True,
         ensure_success=True,
     )
+
+
+def test_formation_energy_maker_shared_bulk(test_dir):
+    maker = FormationEnergyMaker()
+    struct = Structure.from_file(test_dir / "structures" / "GaN.cif")
+    defects = list(
+        SubstitutionGenerator().get_defects(
+            structure=struct, substitution={"Ga": ["Mg", "Zn"]}
+        )
+    )
+
+    # separate flows are self-contained and each have a bulk supercell job
+    flows = [maker.make(defect, defect_index=idx) for idx, defect in enumerate(defects)]
+    for flow in flows:
+        bulk_jobs = [job for job in flow.jobs if job.name == "bulk supercell"]
+        assert len(bulk_jobs) == 1
+        spawn_job = next(job for job in flow.jobs if job.name == "spawn_defect_q_jobs")
+        assert spawn_job.function_kwargs["sc_mat"].uuid == bulk_jobs[0].uuid
+
+    # make_many shares a single bulk supercell job between the defects
+    flow = maker.make_many(defects)
+    bulk_jobs = [job for job in flow.jobs if job.name == "bulk supercell"]
+    defect_flows = [job for job in flow.jobs if isinstance(job, Flow)]
+    assert len(bulk_jobs) == 1
+    assert len(defect_flows) == len(defects)
+    assert len(flow.output) == len(defects)
+    for defect_flow in defect_flows:
+        spawn_job = next(
+            job for job in defect_flow.jobs if job.name == "spawn_defect_q_jobs"
+        )
+        assert spawn_job.function_kwargs["sc_mat"].uuid == bulk_jobs[0].uuid
@@ -177,6 +177,108 @@ def test_lobster_task_document_non_gzip(lobster_test_dir, tmp_path):
     assert doc.chemsys == "As-Ga"
 
 
+def test_lobster_output_cache(lobster_test_dir, caplog):
+    import logging
+
+    from atomate2.lobster.schemas import LobsterOutputCache
+
+    dir_name = lobster_test_dir / "lobsteroutputs/mp-2534"
+    output_cache = LobsterOutputCache(dir_name)
+    cohp = output_cache.complete_cohp()
+    assert isinstance(cohp, CompleteCohp)
+    assert output_cache.complete_cohp() is cohp
+    assert output_cache.complete_cohp("COOPCAR.lobster", are_coops=True) is not cohp
+    assert output_cache.dos("DOSCAR.LSO.lobster") is None
+    assert set(output_cache.timings) == {"COHPCAR.lobster.gz", "COOPCAR.lobster.gz"}
+
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="atomate2.lobster.schemas"):
+        LobsterTaskDocument.from_directory(
+            dir_name=dir_name,
+            save_cohp_plots=False,
+            calc_quality_kwargs={"n_bins": 100, "potcar_symbols": ["Ga_d", "As"]},
+            save_cba_jsons=False,
+            add_coxxcar_to_task_document=True,
+        )
+    parsed = [msg.split()[1] for msg in caplog.messages if msg.startswith("Parsed ")]
+    assert len(parsed) == len(set(parsed))
+    assert {"COHPCAR.lobster.gz", "ICOHPLIST.lobster.gz", "vasprun.xml.gz"} <= {*parsed}
+
+
+def test_lobster_task_document_n_workers(lobster_test_dir):
+    kwargs = {
+        "dir_name": lobster_test_dir / "lobsteroutputs/mp-2534",
+        "save_cohp_plots": False,
+        "calc_quality_kwargs": {"n_bins": 100, "potcar_symbols": ["Ga_d", "As"]},
+        "save_cba_jsons": False,
+        "add_coxxcar_to_task_document": True,
+    }
+    doc = LobsterTaskDocument.from_directory(**kwargs)
+    doc_parallel = LobsterTaskDocument.from_directory(**kwargs, n_workers=4)
+
+    assert doc_parallel.strongest_bonds == doc.strongest_bonds
+    assert doc_parallel.strongest_bonds_cation_anion == doc.strongest_bonds_cation_anion
+    assert doc_parallel.lobsterpy_text == doc.lobsterpy_text
+    assert doc_parallel.calc_quality_summary == doc.calc_quality_summary
+    assert doc_parallel.calc_quality_text == doc.calc_quality_text
+    assert doc_parallel.charges.Mulliken == doc.charges.Mulliken
+    assert doc_parallel.band_overlaps.max_deviation == doc.band_overlaps.max_deviation
+    assert doc_parallel.cobi_data.as_dict() == doc.cobi_data.as_dict()
+    assert doc_parallel.dos.as_dict() == doc.dos.as_dict()
+
+
+def test_run_lobster_tasks_groups(lobster_test_dir):
+    from functools import partial
+
+    from atomate2.lobster.schemas import (
+        LobsterOutputCache,
+        _parse_lobster_output,
+        _run_lobster_tasks,
+        _TaskGroup,
+    )
+
+    output_cache = LobsterOutputCache(lobster_test_dir / "lobsteroutputs/mp-2534")
+    parse_cohp = partial(_parse_lobster_output, method="complete_cohp")
+    parse_charge = partial(_parse_lobster_output, method="charge")
+    results = _run_lobster_tasks(
+        [
+            _TaskGroup({"cohp": parse_cohp, "cohp_again": parse_cohp}),
+            _TaskGroup({"charge": parse_charge}),
+        ],
+        output_cache,
+        n_workers=2,
+    )
+
+    # the tasks of a group share one parsed COHPCAR, which is sent back once
+    assert isinstance(results["cohp"], CompleteCohp)
+    assert results["cohp_again"] is results["cohp"]
+    assert isinstance(results["charge"], Charge)
+    assert set(output_cache.timings) == {"COHPCAR.lobster.gz", "CHARGE.lobster.gz"}
+
+    # files parsed before are sent to the groups sharing them, not parsed again
+    output_cache = LobsterOutputCache(lobster_test_dir / "lobsteroutputs/mp-2534")
+    output_cache.complete_cohp()
+    timings = dict(output_cache.timings)
+    results = _run_lobster_tasks(
+        [
+            _TaskGroup({"cohp": parse_cohp}, ("COHPCAR.lobster",)),
+            _TaskGroup({"cohp_again": parse_cohp}, ("COHPCAR.lobster",)),
+            _TaskGroup({"charge": parse_charge}, ("COHPCAR.lobster",)),
+        ],
+        output_cache,
+        n_workers=3,
+    )
+    assert isinstance(results["cohp"], CompleteCohp)
+    assert results["cohp_again"].as_dict() == results["cohp"].as_dict()
+    assert output_cache.timings["COHPCAR.lobster.gz"] == timings["COHPCAR.lobster.gz"]
+    assert "CHARGE.lobster.gz" in output_cache.timings
+
+    shared = output_cache.share(["COHPCAR.lobster"])
+    assert shared.complete_cohp() is output_cache.complete_cohp()
+    assert shared.timings == {}
+    assert shared.charge() is not output_cache.charge()
+
+
 def test_lobster_task_doc_saved_jsons(lobster_test_dir):
     """
     Test if jsons saved are valid
@@ -307,3 +409,35 @@ def test_lobster_task_doc_saved_jsons(lobster_test_dir):
 
     # delete the computational data json after the test
     os.remove(lobster_test_dir / "lobsteroutputs/mp-754354/computational_data.json.gz")
+
+
+def test_read_saved_json_index(tmp_path):
+    import gzip
+    import json
+
+    from atomate2.lobster.schemas import _IndexedJsonWriter, _read_index
+
+    data = [{"structure": {"a": 1.5}}, {"dos": None}, {"charges": [1, -1]}]
+    with _IndexedJsonWriter(tmp_path / "indexed.json.gz") as file:
+        for item in data:
+            file.write(item)
+    with gzip.open(tmp_path / "plain.json.gz", "wt") as file:
+        json.dump(data, file)
+
+    # the indexed file is still a valid gzipped JSON
+    with gzip.open(tmp_path / "indexed.json.gz", "rt") as file:
+        assert json.load(file) == data
+    with open(tmp_path / "indexed.json.gz", "rb") as file:
+        assert set(_read_index(file)) == {"structure", "dos", "charges"}
+    with open(tmp_path / "plain.json.gz", "rb") as file:
+        assert _read_index(file) is None
+
+    for filename in ("indexed.json.gz", "plain.json.gz"):
+        path = tmp_path / filename
+        assert read_saved_json(path, pymatgen_objs=False) == data[0]
+        assert read_saved_json(path, pymatgen_objs=False, query="dos") == data[1]
+        assert read_saved_json(path, pymatgen_objs=False, query=None) == {
+            key: value for item in data for key, value in item.items()
+        }
+        with pytest.raises(ValueError, match="recheck the query"):
+            read_saved_json(path, query="cohp_data")
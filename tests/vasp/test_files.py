@@ -45,3 +45,33 @@ def test_get_largest_relax_extension(vasp_test_dir):
     path = vasp_test_dir / "Si_band_structure" / "static" / "outputs"
     extension = get_largest_relax_extension(directory=path)
     assert extension == ""
+
+
+def test_get_planar_averaged_locpot(vasp_test_dir, tmp_dir):
+    import shutil
+
+    import numpy as np
+    from pymatgen.io.vasp import Locpot, Poscar
+
+    from atomate2.vasp.files import get_planar_averaged_locpot
+    from atomate2.vasp.jobs.base import get_vasp_task_document
+
+    path = vasp_test_dir / "Si_band_structure" / "static" / "outputs"
+    poscar = Poscar.from_file(path / "POSCAR.gz")
+    rng = np.random.default_rng(0)
+    locpot = Locpot(poscar, {"total": rng.normal(size=(7, 5, 9))})
+    locpot.write_file("LOCPOT")
+
+    averages = get_planar_averaged_locpot("LOCPOT")
+    for axis in range(3):
+        np.testing.assert_allclose(
+            averages[axis], locpot.get_average_along_axis(axis), atol=1e-8
+        )
+
+    # the planar averages are streamed when parsing the task document
+    for file in path.glob("*"):
+        shutil.copy(file, file.name)
+    task_doc = get_vasp_task_document(".")
+    np.testing.assert_allclose(
+        task_doc.calcs_reversed[0].output.locpot[2], averages[2], atol=1e-12
+    )